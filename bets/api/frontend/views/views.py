@@ -7,6 +7,7 @@ from rest_framework import response as rest_response
 from rest_framework import status as rest_status
 
 from football.services.prefetch import PrefetchView
+from utils.third_party.api.rest_framework import conditional as utils_conditional
 from utils.third_party.api.rest_framework import mixins as utils_mixins
 from user.permissions import IsNotBlocked
 
@@ -15,6 +16,12 @@ from ..serializers import serializers as bets_serializers
 from . import filters as frontend_filters
 
 
+def _odds_amount_etag(request: http.HttpRequest, *args, **kwargs) -> str:
+    # * The counted list is both the tag and what the view sends
+    sports = PrefetchView()._count_fixtures(queryset=bets_models.Odds.objects)
+    return utils_conditional.version_etag(*sports)
+
+
 class OddsAmountViewSet(utils_mixins.PrefetchableListMixin):
     permission_classes = []
 
@@ -22,6 +29,7 @@ class OddsAmountViewSet(utils_mixins.PrefetchableListMixin):
         description="NO AUTH. Get sports that have games in it.",
         responses=bets_serializers.ReadOddsAmountSerializer,
     )
+    @utils_conditional.conditional_list(etag_func=_odds_amount_etag)
     def list(self, request: http.HttpRequest, *args, **kwargs) -> rest_response.Response:
         queryset = self._prefetch_list(queryset=self.queryset)
         return rest_response.Response(data={"types": queryset}, status=rest_status.HTTP_200_OK)
@@ -30,12 +38,13 @@ class OddsAmountViewSet(utils_mixins.PrefetchableListMixin):
         return PrefetchView()._count_fixtures(queryset=queryset)
 
     serializer_class = bets_serializers.ReadOddsAmountSerializer
+    query_budget = 1
 
     renderer_classes = [rest_renderers.JSONRenderer]
     queryset = bets_models.Odds.objects
 
 
-class BetsViewSet(utils_mixins.PrefetchableListMixin):
+class BetsViewSet(utils_mixins.KeysetPaginationMixin, utils_mixins.PrefetchableListMixin):
     permission_classes = [rest_permissions.IsAuthenticated, IsNotBlocked]
 
     @drf_utils.extend_schema(
@@ -56,7 +65,7 @@ class BetsViewSet(utils_mixins.PrefetchableListMixin):
     filterset_class = frontend_filters.BetsFilterSet
 
 
-class TradeViewSet(utils_mixins.PrefetchableListMixin):
+class TradeViewSet(utils_mixins.KeysetPaginationMixin, utils_mixins.PrefetchableListMixin):
     permission_classes = [rest_permissions.IsAuthenticated, IsNotBlocked]
 
     def _get_client(self):
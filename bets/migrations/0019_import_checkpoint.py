@@ -0,0 +1,28 @@
+# Generated by Django 3.2.7 on 2026-10-18 15:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bets', '0018_auto_20241129_1136'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind_of_sport', models.PositiveSmallIntegerField(choices=[(1, 'football'), (2, 'baseball'), (3, 'basketball'), (4, 'formula 1'), (5, 'handball'), (6, 'hockey'), (7, 'rugby'), (8, 'volleyball')], verbose_name='Вид спорту')),
+                ('date', models.DateField(verbose_name='Дата матчів')),
+                ('fetched_at', models.DateTimeField(auto_now=True, verbose_name='Останнє завантаження')),
+                ('hashes', models.JSONField(default=dict, verbose_name='Хеші матчів')),
+            ],
+            options={
+                'verbose_name': 'Контрольна точка імпорту',
+                'verbose_name_plural': 'Контрольні точки імпорту',
+                'unique_together': {('kind_of_sport', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.7 on 2026-10-18 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bets', '0019_import_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='odds',
+            index=models.Index(fields=['fixture', 'name_en_us'], name='bets_odds_fixture_name_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+from django.utils import timezone
+
+# * Per-sport tasks replaced by task_sports_data_import, no longer registered
+LEGACY_TASKS = [
+    "task_baseball_data_import",
+    "task_basketball_data_import",
+    "task_football_data_import",
+    "task_formula_1_data_import",
+    "task_handball_data_import",
+    "task_hockey_data_import",
+    "task_rugby_data_import",
+    "task_volleyball_data_import",
+]
+
+
+def remove_legacy_import_tasks(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTasks = apps.get_model("django_celery_beat", "PeriodicTasks")
+
+    deleted, _ = PeriodicTask.objects.filter(task__in=LEGACY_TASKS).delete()
+    if deleted:
+        # * Signals are not sent from migrations, the running beat is told here
+        PeriodicTasks.objects.update_or_create(
+            ident=1, defaults={"last_update": timezone.now()}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bets", "0020_odds_fixture_name_index"),
+        ("django_celery_beat", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_legacy_import_tasks, migrations.RunPython.noop),
+    ]
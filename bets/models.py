@@ -3,6 +3,7 @@ from django import utils
 from django.db import models as django_models
 from django.utils.translation import gettext_lazy as _
 
+from football import choices as football_choices
 from football import models as football_models
 
 # region				-----Internal Imports-----
@@ -158,6 +159,12 @@ class Odds(django_models.Model):
     # region              -----Metas-----
     class Meta(object):
         unique_together = ("name", "fixture")
+        # * Named explicitly: name_en_us is added later by modeltranslation
+        indexes = [
+            django_models.Index(
+                fields=["fixture", "name_en_us"], name="bets_odds_fixture_name_idx"
+            )
+        ]
 
     # endregion
 
@@ -191,3 +198,35 @@ class OddsDetail(django_models.Model):
         return f"{self.name} ID: {self.id}"
 
     # endregion
+
+
+class ImportCheckpoint(django_models.Model):
+    # region           -----Information-----
+    kind_of_sport = django_models.PositiveSmallIntegerField(
+        choices=football_choices.kinds_of_sport,
+        verbose_name="Вид спорту",
+        blank=False,
+        null=False,
+    )
+
+    date = django_models.DateField(verbose_name="Дата матчів", blank=False, null=False)
+
+    fetched_at = django_models.DateTimeField(verbose_name="Останнє завантаження", auto_now=True)
+
+    # * {fixture api id: [content hash, status/date/score hash]}
+    hashes = django_models.JSONField(verbose_name="Хеші матчів", default=dict)
+    # endregion
+
+    # region              -----Metas-----
+    class Meta(object):
+        unique_together = ("kind_of_sport", "date")
+        verbose_name_plural = "Контрольні точки імпорту"
+        verbose_name = "Контрольна точка імпорту"
+
+    # endregion
+
+    # region         -----Default Methods-----
+    def __str__(self) -> str:
+        return f"{self.kind_of_sport} {self.date}"
+
+    # endregion
@@ -25,22 +25,22 @@ logger = logging.Logger(__file__)
 # endregion
 
 
-@dispatch.receiver(signal=django_models.signals.pre_save, sender=models.OddsDetail)
-def translate_odd_details(instance: typing.Any, raw: bool = True, *args, **kwargs) -> None:
+@dispatch.receiver(signal=django_models.signals.post_save, sender=models.OddsDetail)
+def translate_odd_details(instance: typing.Any, created: bool = False, raw: bool = True, *args, **kwargs) -> None:
     if raw:  # if data saves from loaddata
         return
     try:
-        instance = utils.translate.multiple_translations(instance=instance)
+        instance = utils.translate.multiple_translations(instance=instance, created=created)
     except:
         pass
 
 
-@dispatch.receiver(signal=django_models.signals.pre_save, sender=models.Odds)
-def translate_odd(instance: typing.Any, raw: bool = True, *args, **kwargs) -> None:
+@dispatch.receiver(signal=django_models.signals.post_save, sender=models.Odds)
+def translate_odd(instance: typing.Any, created: bool = False, raw: bool = True, *args, **kwargs) -> None:
     if raw:  # if data saves from loaddata
         return
     try:
-        instance = utils.translate.multiple_translations(instance=instance)
+        instance = utils.translate.multiple_translations(instance=instance, created=created)
     except:
         pass
 
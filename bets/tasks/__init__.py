@@ -1,9 +1,2 @@
-from .baseball import *
-from .basketball import *
 from .clean_matches import *
-from .football import *
-from .formula_1 import *
-from .handball import *
-from .hockey import *
-from .rugby import *
-from .volleyball import *
+from .importer import *
@@ -2,9 +2,19 @@ import celery
 from django.utils import timezone
 
 from football.models import Match
+from football.services import cache as football_cache
+from football.signals.invalidation import signals as invalidation_signals
 
 
 @celery.shared_task(name="task_clean_matches")
 def clean_matches():
     three_days_ago = timezone.now() - timezone.timedelta(days=3)
-    Match.objects.filter(date__lte=three_days_ago).delete()
+    matches = Match.objects.filter(date__lte=three_days_ago)
+    kinds_of_sport = set(matches.values_list("league__kind_of_sport", flat=True).distinct())
+
+    # * One listing refresh per sport instead of one per deleted row
+    with football_cache.invalidation_suppressed():
+        matches.delete()
+
+    for kind_of_sport in kinds_of_sport:
+        invalidation_signals.listing_refresher(kind_of_sport=kind_of_sport)()
@@ -0,0 +1,217 @@
+import datetime
+import hashlib
+import itertools
+import json
+import logging
+import typing
+
+import celery
+from django import utils as django_utils
+
+from football import tasks as football_tasks
+from football.services import cache as football_cache
+from football.services import listing as football_listing
+from rapid_api.api import RapidAPI
+
+# region				-----External Imports-----
+from utils import dottedpath
+
+# region				-----Internal Imports-----
+from .. import models as bets_models
+from . import services as bet_services
+from . import sports as bet_sports
+
+# endregion
+
+# endregion
+
+# region			  -----Supporting Variables-----
+logger = logging.Logger(__file__)
+
+IMPORT_DAYS = 2
+IMPORT_CHUNK_SIZE = 200
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+# endregion
+
+
+def _add_fixture(
+    batch: bet_services.FixtureBatch, fixture: typing.Dict, row: typing.Dict
+) -> int:
+    country = row.get("country")
+    if isinstance(country, str):
+        country = {"name": country}
+
+    api_id = int(row["api_id"])
+    batch.add(
+        fixture=fixture,
+        country=country,
+        league=row["league"],
+        home_team=row["home_team"],
+        away_team=row.get("away_team"),
+        api_id=api_id,
+        date=datetime.datetime.strptime(row["date"], DATE_FORMAT),
+        referee=row.get("referee"),
+    )
+    return api_id
+
+
+def _hash(value: typing.Any) -> str:
+    return hashlib.sha1(
+        json.dumps(value, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _fixture_hashes(fixture: typing.Dict, row: typing.Dict) -> typing.List[str]:
+    # * The second hash covers what odds depend on: status, kick-off and score
+    return [
+        _hash(fixture),
+        _hash([row.get("status"), row.get("date"), row.get("score")]),
+    ]
+
+
+def _chunks(
+    iterable: typing.Iterable[typing.Any], size: int
+) -> typing.Iterator[typing.List[typing.Any]]:
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+# * The listing is rebuilt once at the end instead of after every write
+@football_cache.invalidation_suppressed()
+def import_sport(
+    spec: bet_sports.SportSpec, days: int = IMPORT_DAYS, incremental: bool = True
+) -> typing.Dict[str, typing.Any]:
+    rapid = RapidAPI(host=spec.host, version=spec.version, path=spec.path)
+    today = django_utils.timezone.now().date()
+    dates = [today + datetime.timedelta(days=day) for day in range(days)]
+    summary = {"sport": spec.name, "fixtures": 0, "skipped": 0, "errors": 0}
+
+    # * One batch per run: entities shared by both days are loaded with one
+    # * query per model and written back once
+    batch = bet_services.FixtureBatch(
+        kind_of_sport=spec.kind_of_sport, version=spec.version
+    )
+    checkpoints = {
+        checkpoint.date: checkpoint
+        for checkpoint in bets_models.ImportCheckpoint.objects.filter(
+            kind_of_sport=spec.kind_of_sport, date__in=dates
+        )
+    }
+    hashes = {date: {} for date in dates}
+    events_id = []
+    # * Odds hash to fall back to when the odds of the event fail to sync
+    odds_fallbacks = {}
+    for date in dates:
+        checkpoint = checkpoints.get(date)
+        previous = checkpoint.hashes if checkpoint and incremental else {}
+        search_by = {"date": date.strftime("%Y-%m-%d")}
+
+        # * Fixtures are streamed and consumed in chunks, so a large match day
+        # * never sits in memory as one decoded payload
+        try:
+            for fixtures in _chunks(rapid.iter_data(search_by=search_by), IMPORT_CHUNK_SIZE):
+                if spec.prepare:
+                    fixtures = spec.prepare(spec, fixtures)
+
+                columns = dottedpath.extract_many(records=fixtures, fields=spec.fields)
+                for fixture, *values in zip(fixtures, *columns.values()):
+                    row = dict(zip(columns, values))
+                    try:
+                        key = str(int(row["api_id"]))
+                        fixture_hashes = _fixture_hashes(fixture=fixture, row=row)
+                        previous_hashes = previous.get(key)
+
+                        # * Unchanged fixtures never reach the ORM, their odds are
+                        # * requested again only if the last sync of them failed
+                        if previous_hashes and previous_hashes[0] == fixture_hashes[0]:
+                            hashes[date][key] = fixture_hashes
+                            summary["skipped"] += 1
+                            if spec.with_odds and not previous_hashes[1]:
+                                events_id.append(int(key))
+                                odds_fallbacks[int(key)] = (date, key, None)
+                            continue
+
+                        api_id = _add_fixture(batch=batch, fixture=fixture, row=row)
+                        hashes[date][key] = fixture_hashes
+                        summary["fixtures"] += 1
+                        if not previous_hashes or previous_hashes[1] != fixture_hashes[1]:
+                            events_id.append(api_id)
+                            odds_fallbacks[api_id] = (
+                                date,
+                                key,
+                                previous_hashes[1] if previous_hashes else None,
+                            )
+                    except Exception as ex:
+                        summary["errors"] += 1
+                        logger.error(ex)
+        except Exception as ex:
+            summary["errors"] += 1
+            logger.error(f"RapidAPI {spec.host} {search_by}: {ex}")
+            # * A failed fetch keeps the old checkpoint for the next run
+            hashes.pop(date)
+
+    try:
+        batch.flush()
+    except Exception as ex:
+        summary["errors"] += 1
+        logger.error(ex)
+        return summary
+
+    logger.info(f"kind of sport {spec.kind_of_sport} {summary}")
+
+    if spec.with_odds and events_id:
+        try:
+            synced = bet_services.generate_odds(
+                events_id=events_id,
+                version=spec.version,
+                host=spec.host,
+                kind_of_sport=spec.kind_of_sport,
+            )
+        except Exception as ex:
+            synced = set()
+            logger.error(ex)
+
+        # * Events the odds sync missed keep their previous odds hash, so the
+        # * next run requests them again
+        for api_id in set(events_id) - synced:
+            date, key, previous = odds_fallbacks[api_id]
+            if key in hashes.get(date, {}):
+                hashes[date][key][1] = previous
+        summary["odds_failed"] = len(set(events_id) - synced)
+
+    for date, date_hashes in hashes.items():
+        bets_models.ImportCheckpoint.objects.update_or_create(
+            kind_of_sport=spec.kind_of_sport, date=date, defaults={"hashes": date_hashes}
+        )
+
+    try:
+        football_listing.rebuild_league_listing(kind_of_sport=spec.kind_of_sport)
+        football_tasks.warm_league_lists(kinds_of_sport=[spec.kind_of_sport])
+    except Exception as ex:
+        logger.error(ex)
+
+    return summary
+
+
+@celery.shared_task(name="task_sport_data_import")
+def task_sport_data_import(
+    sport: str, incremental: bool = True
+) -> typing.Dict[str, typing.Any]:
+    return import_sport(spec=bet_sports.SPORTS[sport], incremental=incremental)
+
+
+@celery.shared_task(name="task_sports_data_import_done")
+def task_sports_data_import_done(summaries: typing.List[typing.Dict]) -> None:
+    for summary in summaries:
+        logger.info(f"import {summary}")
+
+
+@celery.shared_task(name="task_sports_data_import")
+def task_sports_data_import() -> None:
+    # * One task per sport, so a failing sport does not stop the others. They
+    # * only overlap on a worker with concurrency: the prod worker runs -P solo
+    # * (docker-compose.prod.yml), which imports the sports one after another
+    celery.chord(
+        task_sport_data_import.si(sport) for sport in bet_sports.SPORTS
+    )(task_sports_data_import_done.s())
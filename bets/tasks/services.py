@@ -1,18 +1,21 @@
+import dataclasses
 import logging
 import random
-import time
 import typing
 from datetime import datetime
+from decimal import Decimal
 
-import requests
-from django.urls import reverse
+from django.db import models as django_models
+from django.db import connections, transaction
 
+import utils
 from football import models as football_models
 from football.services import rapid as football_types
 from geo import models as geo_models
 from rapid_api.api import RapidAPI
 
 # region				-----External Imports-----
+from utils.dottedpath import compile_path
 from utils.dottedpath import dottedpath as utils_dottedpath
 
 # region				-----Internal Imports-----
@@ -24,106 +27,616 @@ from .. import models as bets_models
 
 # region			  -----Supporting Variables-----
 logger = logging.Logger(__file__)
+
+BULK_BATCH_SIZE = 500
+
+ODDS_PAGE_SIZE = 100
+ODDS_PER_FIXTURE = 6
+ODDS_DETAILS_PER_ODDS = 4
+
+# * The 1-X-2 prices of the main market are copied onto Match for the listing
+MAIN_ODDS_NAME = "Match Winner"
+MAIN_ODDS_FIELDS = {"Home": "main_odds_1", "Draw": "main_odds_x", "Away": "main_odds_2"}
+
+# * Paths read for every imported fixture are compiled once
+_id = compile_path("id")
+_name = compile_path("name")
+_logo = compile_path("logo")
+_season = compile_path("season")
+_flag = compile_path("flag")
+_total = compile_path("total")
+_home_team = compile_path("teams.home")
+_away_team = compile_path("teams.away")
+_home_score = compile_path("scores.home")
+_away_score = compile_path("scores.away")
 # endregion
 
 
-def create_or_get_team(data: football_types.TeamValueType) -> football_models.Team:
-    team, _ = football_models.Team.objects.update_or_create(
-        id=int(utils_dottedpath(data=data, path="id")),
-        defaults={
-            "title": utils_dottedpath(data=data, path="name"),
-            "logo": utils_dottedpath(data=data, path="logo"),
-            "id": int(utils_dottedpath(data=data, path="id")),
-        },
-    )
+@dataclasses.dataclass
+class UpsertReport(object):
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    deleted_details: int = 0
 
-    return team
+    def __str__(self) -> str:
+        return (
+            f"inserted {self.inserted}, "
+            f"updated {self.updated}, "
+            f"unchanged {self.unchanged}, "
+            f"deleted {self.deleted}, "
+            f"deleted details {self.deleted_details}"
+        )
 
 
-def create_or_get_country(data: football_types.CountryType) -> geo_models.Country:
-    country, _ = geo_models.Country.objects.update_or_create(
-        title=utils_dottedpath(data=data, path="name")
-    )
-    return country
+def _schedule_translation(instances: typing.List[django_models.Model]) -> None:
+    # * Bulk insert skips the signals; the new rows are translated in one batch
+    # * after the commit instead of holding the import up
+    try:
+        utils.translate.bulk_translations(instances=instances)
+    except Exception as ex:
+        logger.error(ex)
 
 
-def create_or_get_league(
-    data: football_types.LeagueType,
-    country: geo_models.Country,
-    version: str or None,
-    kind_of_sport: int,
-) -> football_models.League:
-    defaults = {
-        "season": str(utils_dottedpath(data=data, path="season")),
-        "title": utils_dottedpath(data=data, path="name"),
-        "api_id": int(utils_dottedpath(data=data, path="id")),
-        "logo": utils_dottedpath(data=data, path="logo"),
-        "kind_of_sport": kind_of_sport,
-        "country": country,
+def _bulk_insert(
+    model: typing.Type[django_models.Model],
+    instances: typing.List[django_models.Model],
+) -> None:
+    parents = model._meta.get_parent_list()
+    if not parents:
+        model.objects.bulk_create(
+            instances, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True
+        )
+        _schedule_translation(instances=instances)
+        return
+
+    # * bulk_create refuses multi-table inheritance (Match -> Event), so the
+    # * parent rows are created first and the child rows inserted on top of them
+    with transaction.atomic():
+        (parent,) = parents
+        queryset = model._base_manager.all()
+        queryset._for_write = True
+
+        if connections[queryset.db].features.can_return_rows_from_bulk_insert:
+            parent_rows = parent.objects.bulk_create(
+                [parent() for _ in instances], batch_size=BULK_BATCH_SIZE
+            )
+        else:
+            parent_rows = [parent.objects.create() for _ in instances]
+
+        for instance, parent_row in zip(instances, parent_rows):
+            instance.pk = parent_row.pk
+            instance.id = parent_row.pk
+
+        queryset._batched_insert(
+            instances,
+            fields=model._meta.local_concrete_fields,
+            batch_size=BULK_BATCH_SIZE,
+        )
+    _schedule_translation(instances=instances)
+
+
+def _select_by_keys(
+    model: typing.Type[django_models.Model],
+    key_fields: typing.Tuple[str, ...],
+    keys: typing.Iterable[tuple],
+) -> typing.Dict[tuple, django_models.Model]:
+    keys = set(keys)
+    if not keys:
+        return {}
+
+    # * One "in" per key column selects a superset, exact keys are matched below
+    lookups = {
+        f"{field}__in": {key[index] for key in keys}
+        for index, field in enumerate(key_fields)
     }
-    if version:
-        defaults.update(
-            round=str(utils_dottedpath(data=data, path="season")),
-            flag=utils_dottedpath(data=data, path="flag"),
+
+    selected = {}
+    for instance in model.objects.filter(**lookups):
+        key = tuple(getattr(instance, field) for field in key_fields)
+        if key in keys:
+            selected[key] = instance
+    return selected
+
+
+class IdentityMap(object):
+    # region		     -----Public Methods-----
+    def warm(self, keys: typing.Iterable[tuple]) -> None:
+        # * Keys are loaded once per run, misses are remembered as well
+        missing = set(keys) - self.__loaded
+        if not missing:
+            return
+
+        self.__instances.update(
+            _select_by_keys(model=self.__model, key_fields=self.__key_fields, keys=missing)
+        )
+        self.__loaded.update(missing)
+
+    def get(self, key: tuple) -> django_models.Model or None:
+        return self.__instances.get(key)
+
+    def stage(self, key: tuple, defaults: typing.Dict) -> django_models.Model:
+        self.warm(keys=[key])
+        self.__staged.add(key)
+
+        instance = self.__instances.get(key)
+        if instance is None:
+            instance = self.__model(**dict(zip(self.__key_fields, key)), **defaults)
+            self.__instances[key] = instance
+            self.__new[key] = instance
+            return instance
+
+        changed = [
+            field
+            for field, value in defaults.items()
+            if getattr(instance, field) != value
+        ]
+        for field in changed:
+            setattr(instance, field, defaults[field])
+        if changed and key not in self.__new:
+            self.__dirty[key] = instance
+            self.__dirty_fields.update(changed)
+        return instance
+
+    def flush(self) -> UpsertReport:
+        report = UpsertReport(
+            updated=len(self.__dirty),
+            inserted=len(self.__new),
+            unchanged=len(self.__staged) - len(self.__dirty) - len(self.__new),
         )
 
-    league, _ = football_models.League.objects.update_or_create(
-        api_id=utils_dottedpath(data=data, path="id"),
-        kind_of_sport=kind_of_sport,
-        defaults=defaults,
+        if self.__dirty:
+            self.__model.objects.bulk_update(
+                list(self.__dirty.values()),
+                fields=sorted(self.__dirty_fields),
+                batch_size=BULK_BATCH_SIZE,
+            )
+
+        if self.__new:
+            _bulk_insert(model=self.__model, instances=list(self.__new.values()))
+            # * Reselected so pks are known even where bulk insert returns none
+            self.__instances.update(
+                _select_by_keys(
+                    model=self.__model, key_fields=self.__key_fields, keys=self.__new
+                )
+            )
+
+        self.__staged, self.__new, self.__dirty = set(), {}, {}
+        self.__dirty_fields = set()
+        return report
+
+    @property
+    def instances(self) -> typing.Dict[tuple, django_models.Model]:
+        return self.__instances
+
+    # endregion
+
+    # region		     -----Private Method-----
+    def __init__(
+        self,
+        model: typing.Type[django_models.Model],
+        key_fields: typing.Tuple[str, ...],
+    ) -> None:
+        self.__model = model
+        self.__key_fields = key_fields
+
+        self.__instances = {}
+        self.__loaded = set()
+        self.__staged = set()
+        self.__new = {}
+        self.__dirty = {}
+        self.__dirty_fields = set()
+
+    # endregion
+
+
+def bulk_upsert(
+    model: typing.Type[django_models.Model],
+    key_fields: typing.Tuple[str, ...],
+    rows: typing.Dict[tuple, typing.Dict],
+    identity_map: IdentityMap or None = None,
+) -> typing.Tuple[UpsertReport, typing.Dict[tuple, django_models.Model]]:
+    identity_map = identity_map or IdentityMap(model=model, key_fields=key_fields)
+    identity_map.warm(keys=rows)
+    for key, defaults in rows.items():
+        identity_map.stage(key=key, defaults=defaults)
+
+    return identity_map.flush(), identity_map.instances
+
+
+class FixtureBatch(object):
+    # region		     -----Public Methods-----
+    def add(
+        self,
+        fixture: typing.Dict,
+        country: football_types.CountryType,
+        league: football_types.LeagueType,
+        home_team: football_types.TeamValueType,
+        away_team: football_types.TeamValueType or None,
+        api_id: int,
+        date: datetime,
+        referee: str or None = None,
+    ) -> None:
+        country_name = _name(country)
+        if not country_name:
+            raise ValueError(f"Fixture {api_id} has no country")
+        country_key = (country_name,)
+
+        league_key = (int(_id(league)), self.__kind_of_sport)
+        league_defaults = {
+            "season": str(_season(league)),
+            "title": _name(league),
+            "logo": _logo(league),
+        }
+        if self.__version:
+            league_defaults.update(
+                round=str(_season(league)),
+                flag=_flag(league),
+            )
+
+        home_team_key = self.__team_key(data=home_team)
+        away_team_key = self.__team_key(data=away_team) if away_team else None
+
+        match_defaults = {
+            "date": date,
+            "home_team_id": home_team_key,
+            "away_team_id": away_team_key,
+            "winer_id": find_winner(
+                home_team=home_team_key,
+                away_team=away_team_key,
+                fixture=fixture,
+                version=self.__version,
+            ),
+        }
+        if referee is not None:
+            match_defaults.update(referee=referee)
+
+        # * Later fixtures overwrite earlier ones, so every entity is written once
+        self.__countries[country_key] = {}
+        self.__leagues[league_key] = (country_key, league_defaults)
+        for team_key, team in ((home_team_key, home_team), (away_team_key, away_team)):
+            if team_key is None:
+                continue
+            self.__teams[team_key] = {
+                "title": _name(team),
+                "logo": _logo(team) or None,
+            }
+        self.__matches[(api_id, league_key)] = match_defaults
+
+    def flush(self) -> typing.Dict[str, UpsertReport]:
+        reports = {}
+
+        reports["country"], countries = bulk_upsert(
+            model=geo_models.Country,
+            key_fields=("title",),
+            rows=self.__countries,
+            identity_map=self.__identity_maps["country"],
+        )
+
+        leagues_rows = {
+            key: {**defaults, "country_id": countries[country_key].pk}
+            for key, (country_key, defaults) in self.__leagues.items()
+        }
+        reports["league"], leagues = bulk_upsert(
+            model=football_models.League,
+            key_fields=("api_id", "kind_of_sport"),
+            rows=leagues_rows,
+            identity_map=self.__identity_maps["league"],
+        )
+
+        # * Teams without an API id (formula 1 drivers) are matched by title
+        teams_by_id = {
+            (key,): defaults
+            for (field, key), defaults in self.__teams.items()
+            if field == "id"
+        }
+        teams_by_title = {
+            (key,): {"logo": defaults["logo"]} if defaults["logo"] else {}
+            for (field, key), defaults in self.__teams.items()
+            if field == "title"
+        }
+        reports["team"], teams = bulk_upsert(
+            model=football_models.Team,
+            key_fields=("id",),
+            rows=teams_by_id,
+            identity_map=self.__identity_maps["team"],
+        )
+        if teams_by_title:
+            report, titled_teams = bulk_upsert(
+                model=football_models.Team,
+                key_fields=("title",),
+                rows=teams_by_title,
+                identity_map=self.__identity_maps["titled_team"],
+            )
+            reports["team"].inserted += report.inserted
+            reports["team"].updated += report.updated
+            reports["team"].unchanged += report.unchanged
+            teams = {**teams, **titled_teams}
+
+        def team_pk(team_key: typing.Tuple or None) -> int or None:
+            return teams[team_key[1:]].pk if team_key else None
+
+        matches_rows = {
+            (api_id, leagues[league_key].pk): {
+                **defaults,
+                "home_team_id": team_pk(defaults["home_team_id"]),
+                "away_team_id": team_pk(defaults["away_team_id"]),
+                "winer_id": team_pk(defaults["winer_id"]),
+            }
+            for (api_id, league_key), defaults in self.__matches.items()
+        }
+        reports["match"], _ = bulk_upsert(
+            model=football_models.Match,
+            key_fields=("api_id", "league_id"),
+            rows=matches_rows,
+            identity_map=self.__identity_maps["match"],
+        )
+
+        self.__countries, self.__leagues, self.__teams, self.__matches = {}, {}, {}, {}
+        for entity, report in reports.items():
+            logger.info(f"kind of sport {self.__kind_of_sport} {entity}: {report}")
+
+        return reports
+
+    # endregion
+
+    # region		     -----Private Method-----
+    def __init__(self, kind_of_sport: int, version: str or None) -> None:
+        self.__kind_of_sport = kind_of_sport
+        self.__version = version
+
+        self.__countries = {}
+        self.__leagues = {}
+        self.__teams = {}
+        self.__matches = {}
+
+        # * Entities seen by earlier flushes of the run are served from memory
+        self.__identity_maps = {
+            "country": IdentityMap(model=geo_models.Country, key_fields=("title",)),
+            "league": IdentityMap(
+                model=football_models.League, key_fields=("api_id", "kind_of_sport")
+            ),
+            "team": IdentityMap(model=football_models.Team, key_fields=("id",)),
+            "titled_team": IdentityMap(
+                model=football_models.Team, key_fields=("title",)
+            ),
+            "match": IdentityMap(
+                model=football_models.Match, key_fields=("api_id", "league_id")
+            ),
+        }
+
+    @staticmethod
+    def __team_key(data: football_types.TeamValueType) -> typing.Tuple[str, typing.Any]:
+        team_id = _id(data)
+        if team_id:
+            return ("id", int(team_id))
+
+        title = _name(data)
+        if not title:
+            raise ValueError(f"Team {data} has neither id nor name")
+        return ("title", title)
+
+    # endregion
+
+
+OddsMarketsType = typing.Dict[str, typing.List[typing.Tuple[str, Decimal or None]]]
+
+
+def _parse_odds(
+    response: typing.List[typing.Dict], version: str or None
+) -> typing.Dict[int, OddsMarketsType]:
+    fixtures = {}
+    for odds in response:
+        fixture_id_path = "fixture.id" if version else "game.id"
+        fixture_id = utils_dottedpath(data=odds, path=fixture_id_path)
+        bookmakers = utils_dottedpath(data=odds, path="bookmakers")
+        if not bookmakers:
+            continue
+
+        # * The bookmaker offering the most markets
+        best_bookmakers = max(bookmakers, key=lambda bookmaker: len(bookmaker.get("bets") or []))
+
+        markets = {}
+        bets = utils_dottedpath(data=best_bookmakers, path="bets") or []
+        if bets and not any(elem.get("name") == MAIN_ODDS_NAME for elem in bets):
+            # * None is filled with a random odd only when the row is created,
+            # * so re-imports keep the generated value instead of churning it
+            markets[MAIN_ODDS_NAME] = [(name, None) for name in ["Home", "Away"]]
+
+        for bet in bets[:ODDS_PER_FIXTURE]:
+            odds_details = utils_dottedpath(data=bet, path="values")
+            markets.setdefault(
+                _name(bet),
+                [
+                    (odds_detail.get("value"), _odd_value(odds_detail.get("odd")))
+                    for odds_detail in odds_details[:ODDS_DETAILS_PER_ODDS]
+                ],
+            )
+
+        fixtures[int(fixture_id)] = markets
+    return fixtures
+
+
+def _odd_value(value: typing.Any) -> Decimal:
+    return Decimal(str(value)).quantize(Decimal("0.01"))
+
+
+def _sync_odds_page(
+    page: typing.Dict[int, OddsMarketsType], kind_of_sport: int or None
+) -> UpsertReport:
+    report = UpsertReport()
+
+    matches = football_models.Match.objects.filter(api_id__in=page)
+    if kind_of_sport:
+        matches = matches.filter(league__kind_of_sport=kind_of_sport)
+    fixtures = dict(matches.values_list("api_id", "pk"))
+
+    existing_odds = {
+        (odds.fixture_id, odds.name): odds
+        for odds in bets_models.Odds.objects.filter(fixture_id__in=fixtures.values())
+    }
+    existing_details = {}
+    for detail in bets_models.OddsDetail.objects.filter(
+        odds__fixture_id__in=fixtures.values()
+    ):
+        existing_details.setdefault(detail.odds_id, {})[detail.name] = detail
+
+    kept_odds, new_odds, new_details = {}, [], []
+    changed_details, deleted_details = [], []
+    for api_id, markets in page.items():
+        fixture_id = fixtures.get(api_id)
+        if fixture_id is None:
+            continue
+
+        for name, values in markets.items():
+            key = (fixture_id, name)
+            odds = existing_odds.pop(key, None)
+            if odds is None:
+                new_odds.append(bets_models.Odds(name=name, fixture_id=fixture_id))
+                new_details.extend((key, detail, value) for detail, value in values)
+                report.inserted += 1
+                continue
+
+            kept_odds[key] = odds
+            details = existing_details.get(odds.pk, {})
+            changed = False
+            for detail_name, value in values:
+                detail = details.pop(detail_name, None)
+                if detail is None:
+                    new_details.append((key, detail_name, value))
+                    changed = True
+                elif value is not None and detail.value != value:
+                    detail.value = value
+                    changed_details.append(detail)
+                    changed = True
+
+            deleted_details.extend(detail.pk for detail in details.values())
+            if changed or details:
+                report.updated += 1
+            else:
+                report.unchanged += 1
+
+    # * Markets that are left disappeared from the feed of a fetched fixture
+    deleted_odds = [odds.pk for odds in existing_odds.values()]
+
+    with transaction.atomic():
+        # * Counted from what was removed: odds that clients already bet on are
+        # * never removed, the details of removed odds go with them
+        if deleted_odds:
+            _, removed = bets_models.Odds.objects.filter(
+                pk__in=deleted_odds, bets__isnull=True
+            ).delete()
+            report.deleted += removed.get(bets_models.Odds._meta.label, 0)
+            report.deleted_details += removed.get(bets_models.OddsDetail._meta.label, 0)
+        if deleted_details:
+            _, removed = bets_models.OddsDetail.objects.filter(pk__in=deleted_details).delete()
+            report.deleted_details += removed.get(bets_models.OddsDetail._meta.label, 0)
+        if changed_details:
+            bets_models.OddsDetail.objects.bulk_update(
+                changed_details, fields=["value"], batch_size=BULK_BATCH_SIZE
+            )
+
+        if new_odds:
+            _bulk_insert(model=bets_models.Odds, instances=new_odds)
+            kept_odds.update(
+                _select_by_keys(
+                    model=bets_models.Odds,
+                    key_fields=("fixture_id", "name"),
+                    keys=[(odds.fixture_id, odds.name) for odds in new_odds],
+                )
+            )
+
+        if new_details:
+            _bulk_insert(
+                model=bets_models.OddsDetail,
+                instances=[
+                    bets_models.OddsDetail(
+                        odds=kept_odds[key],
+                        name=name,
+                        value=_odd_value(get_random_odd()) if value is None else value,
+                    )
+                    for key, name, value in new_details
+                    if key in kept_odds
+                ],
+            )
+
+        sync_main_odds(fixtures_id=fixtures.values())
+
+    logger.info(f"odds {report}")
+    return report
+
+
+def sync_main_odds(fixtures_id: typing.Iterable[int]) -> int:
+    prices = {
+        fixture_id: dict.fromkeys(MAIN_ODDS_FIELDS.values())
+        for fixture_id in fixtures_id
+    }
+    details = bets_models.OddsDetail.objects.filter(
+        odds__fixture_id__in=prices,
+        odds__name_en_us=MAIN_ODDS_NAME,
+        name_en_us__in=MAIN_ODDS_FIELDS,
+    ).values_list("odds__fixture_id", "name_en_us", "value")
+    for fixture_id, name, value in details:
+        prices[fixture_id][MAIN_ODDS_FIELDS[name]] = value
+
+    changed = []
+    for match in football_models.Match.objects.filter(pk__in=prices).only(
+        *MAIN_ODDS_FIELDS.values()
+    ):
+        values = prices[match.pk]
+        if any(getattr(match, field) != value for field, value in values.items()):
+            for field, value in values.items():
+                setattr(match, field, value)
+            changed.append(match)
+
+    football_models.Match.objects.bulk_update(
+        changed, fields=list(MAIN_ODDS_FIELDS.values()), batch_size=BULK_BATCH_SIZE
     )
-    return league
+    return len(changed)
 
 
-def generate_odds(events_id: typing.List[id], version: str or None, host: str) -> None:
-    for index_event_id, event_id in enumerate(events_id, 1):
-        rapid = RapidAPI(version=version, path="odds", host=host)
-        params = {"fixture": event_id} if version else {"game": event_id}
-        response = rapid.fetch_data(search_by=params)
-        if index_event_id % 100 == 0:
-            time.sleep(60)
+def generate_odds(
+    events_id: typing.List[id],
+    version: str or None,
+    host: str,
+    kind_of_sport: int or None = None,
+) -> typing.Set[int]:
+    # * Returns the events whose odds were fetched and written, the importer
+    # * retries the others on its next run
+    rapid = RapidAPI(version=version, path="odds", host=host)
+    search_by = [
+        {"fixture": event_id} if version else {"game": event_id}
+        for event_id in events_id
+    ]
+
+    synced = set()
+    page, page_events = {}, []
+
+    def sync_page() -> None:
         try:
-            for odds in response:
-                fixture_id_path = "fixture.id" if version else "game.id"
-                fixture_id = utils_dottedpath(data=odds, path=fixture_id_path)
-                bookmakers = utils_dottedpath(data=odds, path="bookmakers")
-                best_bookmakers = bookmakers[max(map(len, bookmakers))]
-
-                bets = utils_dottedpath(data=best_bookmakers, path="bets")
-                if bets and not any(
-                    elem.get("name") == "Match Winner" for elem in bets
-                ):
-                    odds = bets_models.Odds.objects.create(
-                        name="Match Winner",
-                        fixture=football_models.Match.objects.get(api_id=fixture_id),
-                    )
-                    for name in ["Home", "Away"]:
-                        bets_models.OddsDetail.objects.create(
-                            value=get_random_odd(), name=name, odds=odds
-                        )
-
-                for index_bet, bet in enumerate(bets, 1):
-                    odds = bets_models.Odds.objects.create(
-                        name=utils_dottedpath(data=bet, path="name"),
-                        fixture=football_models.Match.objects.get(api_id=fixture_id),
-                    )
+            _sync_odds_page(page=page, kind_of_sport=kind_of_sport)
+        except Exception as ex:
+            logger.error(ex)
+            return
+        synced.update(page_events)
 
-                    odds_details = utils_dottedpath(data=bet, path="values")
-                    for index_odds_detail, odds_detail in enumerate(odds_details, 1):
-                        bets_models.OddsDetail.objects.create(
-                            value=float(odds_detail.get("odd")),
-                            name=odds_detail.get("value"),
-                            odds=odds,
-                        )
-                        if index_odds_detail >= 4:
-                            logger.info(f"odds detail 4")
-                            break
-
-                    if index_bet >= 6:
-                        logger.info(f"odds 6")
-                        break
+    for params, response in rapid.fetch_many(search_by=search_by):
+        try:
+            page.update(_parse_odds(response=response, version=version))
         except Exception as ex:
             logger.error(ex)
+            continue
+        page_events.append(int(params.get("fixture", params.get("game"))))
+
+        if len(page) >= ODDS_PAGE_SIZE:
+            sync_page()
+            page, page_events = {}, []
+
+    if page_events:
+        sync_page()
+
+    return synced
 
 
 def get_random_odd() -> float:
@@ -131,13 +644,13 @@ def get_random_odd() -> float:
 
 
 def find_winner(
-    home_team: football_models.Team,
-    away_team: football_models.Team,
+    home_team: typing.Any,
+    away_team: typing.Any,
     version: str or None,
     fixture: dict,
-) -> football_models.Team or None:
-    home_data = utils_dottedpath(data=fixture, path="teams.home")
-    away_data = utils_dottedpath(data=fixture, path="teams.away")
+) -> typing.Any:
+    home_data = _home_team(fixture)
+    away_data = _away_team(fixture)
     if version:
         winner = (
             home_team
@@ -145,11 +658,11 @@ def find_winner(
             else away_team if away_data["winner"] else None
         )
     else:
-        home_score = utils_dottedpath(data=fixture, path="scores.home")
-        away_score = utils_dottedpath(data=fixture, path="scores.away")
+        home_score = _home_score(fixture)
+        away_score = _away_score(fixture)
         if isinstance(home_score, dict):
-            home_score = utils_dottedpath(data=home_score, path="total")
-            away_score = utils_dottedpath(data=away_score, path="total")
+            home_score = _total(home_score)
+            away_score = _total(away_score)
 
         if not home_score or not away_score:
             return None
@@ -163,11 +676,3 @@ def find_winner(
         )
     return winner
 
-
-def create_cache(kind_of_sport: int):
-    t = int(datetime.datetime.now().timestamp() * 1000)
-    requests.get(
-        "https://admin.greekz.com"
-        + reverse("frontend-league-list")
-        + f"?kind_of_sport={kind_of_sport}&page_size=10&page=1&t={t}&cache=True",
-    )
@@ -0,0 +1,136 @@
+import dataclasses
+import typing
+
+from rapid_api.api import RapidAPI
+
+# region				-----External Imports-----
+from utils.dottedpath import dottedpath as utils_dottedpath
+
+# endregion
+
+# region			  -----Supporting Variables-----
+FixturesType = typing.List[typing.Dict]
+
+# * Dotted paths inside one fixture of the RapidAPI "games" endpoints
+TEAM_SPORT_FIELDS = {
+    "api_id": "id",
+    "date": "date",
+    "country": "country",
+    "league": "league",
+    "home_team": "teams.home",
+    "away_team": "teams.away",
+    "status": "status.short",
+    "score": "scores",
+}
+# endregion
+
+
+@dataclasses.dataclass(frozen=True)
+class SportSpec(object):
+    name: str
+    kind_of_sport: int
+    host: str
+    path: str = "games"
+    version: str or None = None
+    fields: typing.Mapping[str, str] = dataclasses.field(
+        default_factory=lambda: TEAM_SPORT_FIELDS
+    )
+    # * Reshapes one day of fixtures before they are read with ``fields``
+    prepare: typing.Callable[["SportSpec", FixturesType], FixturesType] or None = None
+    with_odds: bool = True
+
+
+def prepare_formula_1(spec: SportSpec, fixtures: FixturesType) -> FixturesType:
+    # * Races have no teams: the fastest lap driver stands in as the home team
+    drivers_path = "fastest_lap.driver.id"
+    drivers_id = {
+        utils_dottedpath(data=fixture, path=drivers_path) for fixture in fixtures
+    }
+    rapid = RapidAPI(host=spec.host, version=spec.version, path="drivers")
+    drivers = {
+        params["id"]: response[0]
+        for params, response in rapid.fetch_many(
+            search_by=[{"id": driver_id} for driver_id in drivers_id if driver_id]
+        )
+        if response
+    }
+
+    return [
+        {
+            "id": utils_dottedpath(data=fixture, path="id"),
+            "date": utils_dottedpath(data=fixture, path="date"),
+            "status": utils_dottedpath(data=fixture, path="status"),
+            "country": {
+                "name": utils_dottedpath(
+                    data=fixture, path="competition.location.country"
+                )
+            },
+            "league": {
+                "id": utils_dottedpath(data=fixture, path="competition.id"),
+                "name": utils_dottedpath(data=fixture, path="competition.name"),
+                "season": utils_dottedpath(data=fixture, path="season"),
+                "logo": None,
+            },
+            "teams": {
+                "home": {
+                    "name": utils_dottedpath(
+                        data=drivers.get(
+                            utils_dottedpath(data=fixture, path=drivers_path), {}
+                        ),
+                        path="name",
+                    ),
+                    "logo": None,
+                },
+            },
+        }
+        for fixture in fixtures
+    ]
+
+
+SPORTS: typing.Dict[str, SportSpec] = {
+    spec.name: spec
+    for spec in (
+        SportSpec(
+            name="football",
+            kind_of_sport=1,
+            host="api-football-v1.p.rapidapi.com",
+            path="fixtures",
+            version="v3",
+            fields={
+                **TEAM_SPORT_FIELDS,
+                "api_id": "fixture.id",
+                "date": "fixture.date",
+                "referee": "fixture.referee",
+                "country": "league.country",
+                "status": "fixture.status.short",
+                "score": "goals",
+            },
+        ),
+        SportSpec(name="baseball", kind_of_sport=2, host="api-baseball.p.rapidapi.com"),
+        SportSpec(
+            name="basketball", kind_of_sport=3, host="api-basketball.p.rapidapi.com"
+        ),
+        SportSpec(
+            name="formula_1",
+            kind_of_sport=4,
+            host="api-formula-1.p.rapidapi.com",
+            path="races",
+            fields={
+                **{
+                    key: path
+                    for key, path in TEAM_SPORT_FIELDS.items()
+                    if key not in ("away_team", "score")
+                },
+                "status": "status",
+            },
+            prepare=prepare_formula_1,
+            with_odds=False,
+        ),
+        SportSpec(name="handball", kind_of_sport=5, host="api-handball.p.rapidapi.com"),
+        SportSpec(name="hockey", kind_of_sport=6, host="api-hockey.p.rapidapi.com"),
+        SportSpec(name="rugby", kind_of_sport=7, host="api-rugby.p.rapidapi.com"),
+        SportSpec(
+            name="volleyball", kind_of_sport=8, host="api-volleyball.p.rapidapi.com"
+        ),
+    )
+}
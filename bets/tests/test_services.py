@@ -0,0 +1,319 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase
+
+from bets import models as bets_models
+from bets.tasks import importer as bet_importer
+from bets.tasks import services as bet_services
+from bets.tasks import sports as bet_sports
+from football import models as football_models
+from geo import models as geo_models
+from user.client import models as user_models
+
+
+def build_fixture(api_id: int, home_id: int, away_id: int, home_score: int = None) -> dict:
+    return {
+        "id": api_id,
+        "date": "2022-06-01T23:30:00+00:00",
+        "country": {"name": "USA"},
+        "league": {"id": 12, "name": "NBA", "logo": None, "season": "2022-2023"},
+        "teams": {
+            "home": {"id": home_id, "name": f"Team {home_id}", "logo": None},
+            "away": {"id": away_id, "name": f"Team {away_id}", "logo": None},
+        },
+        "scores": {"home": home_score, "away": 1},
+    }
+
+
+class FixtureBatchMixin(object):
+    def flush(self, *fixtures: dict) -> dict:
+        batch = bet_services.FixtureBatch(kind_of_sport=3, version=None)
+        for fixture in fixtures:
+            batch.add(
+                fixture=fixture,
+                country=fixture["country"],
+                league=fixture["league"],
+                home_team=fixture["teams"]["home"],
+                away_team=fixture["teams"]["away"],
+                api_id=fixture["id"],
+                date=datetime.datetime.strptime(fixture["date"], "%Y-%m-%dT%H:%M:%S%z"),
+            )
+        return batch.flush()
+
+
+class FixtureBatchTests(FixtureBatchMixin, TestCase):
+    def test_flush_dedupes_and_inserts(self):
+        reports = self.flush(build_fixture(1, 10, 11), build_fixture(2, 11, 12))
+
+        self.assertEqual(reports["country"].inserted, 1)
+        self.assertEqual(reports["league"].inserted, 1)
+        self.assertEqual(reports["team"].inserted, 3)
+        self.assertEqual(reports["match"].inserted, 2)
+        self.assertEqual(geo_models.Country.objects.count(), 1)
+        self.assertEqual(football_models.Match.objects.filter(league__api_id=12).count(), 2)
+
+    def test_flush_reports_updated_and_unchanged(self):
+        self.flush(build_fixture(1, 10, 11), build_fixture(2, 11, 12))
+
+        reports = self.flush(build_fixture(1, 10, 11), build_fixture(2, 11, 12, home_score=3))
+
+        self.assertEqual(reports["team"].unchanged, 3)
+        self.assertEqual(reports["match"].unchanged, 1)
+        self.assertEqual(reports["match"].updated, 1)
+        self.assertEqual(football_models.Match.objects.get(api_id=2).winer_id, 11)
+
+
+class SyncOddsPageTests(FixtureBatchMixin, TestCase):
+    def setUp(self):
+        self.flush(build_fixture(1, 10, 11))
+        self.page = {
+            1: {
+                "Match Winner": [("Home", Decimal("1.50")), ("Away", Decimal("2.50"))],
+                "Over/Under": [("Over 2.5", Decimal("1.90")), ("Under 2.5", Decimal("1.90"))],
+            }
+        }
+
+    def test_sync_odds_page_creates_odds_with_details(self):
+        report = bet_services._sync_odds_page(page=self.page, kind_of_sport=3)
+
+        odds = bets_models.Odds.objects.get(fixture__api_id=1, name="Match Winner")
+        self.assertEqual(report.inserted, 2)
+        self.assertEqual(
+            sorted(odds.odds_detail.values_list("name", flat=True)), ["Away", "Home"]
+        )
+
+    def test_sync_odds_page_skips_other_sports(self):
+        bet_services._sync_odds_page(page=self.page, kind_of_sport=1)
+
+        self.assertFalse(bets_models.Odds.objects.exists())
+
+    def test_sync_odds_page_applies_diff(self):
+        bet_services._sync_odds_page(page=self.page, kind_of_sport=3)
+
+        report = bet_services._sync_odds_page(
+            page={1: {"Match Winner": [("Home", Decimal("1.60")), ("Away", Decimal("2.50"))]}},
+            kind_of_sport=3,
+        )
+
+        self.assertEqual((report.updated, report.deleted), (1, 1))
+        self.assertEqual(report.deleted_details, 2)
+        self.assertEqual(bets_models.Odds.objects.count(), 1)
+        self.assertEqual(
+            bets_models.OddsDetail.objects.get(name="Home").value, Decimal("1.60")
+        )
+
+    def test_sync_odds_page_keeps_odds_with_bets_out_of_the_report(self):
+        bet_services._sync_odds_page(page=self.page, kind_of_sport=3)
+        client = user_models.Client.objects.create(username="client", email="c@example.com")
+        bets_models.Bet.objects.create(
+            client=client,
+            odds=bets_models.Odds.objects.get(name="Over/Under"),
+            rate="1.90",
+            stake=10,
+            on="Over 2.5",
+        )
+
+        report = bet_services._sync_odds_page(
+            page={1: {"Match Winner": [("Home", Decimal("1.50"))]}}, kind_of_sport=3
+        )
+
+        self.assertEqual((report.deleted, report.deleted_details), (0, 1))
+        self.assertTrue(bets_models.Odds.objects.filter(name="Over/Under").exists())
+
+    def test_sync_odds_page_copies_main_odds_to_match(self):
+        bet_services._sync_odds_page(page=self.page, kind_of_sport=3)
+        bet_services._sync_odds_page(
+            page={1: {"Match Winner": [("Home", Decimal("1.60")), ("Away", Decimal("2.50"))]}},
+            kind_of_sport=3,
+        )
+
+        match = football_models.Match.objects.get(api_id=1)
+        self.assertEqual(
+            (match.main_odds_1, match.main_odds_x, match.main_odds_2),
+            (Decimal("1.60"), None, Decimal("2.50")),
+        )
+
+    def test_sync_odds_page_keeps_generated_odds(self):
+        page = {1: {"Match Winner": [("Home", None), ("Away", None)]}}
+        bet_services._sync_odds_page(page=page, kind_of_sport=3)
+        values = list(bets_models.OddsDetail.objects.values_list("value", flat=True))
+
+        report = bet_services._sync_odds_page(page=page, kind_of_sport=3)
+
+        self.assertEqual(report.unchanged, 1)
+        self.assertEqual(
+            list(bets_models.OddsDetail.objects.values_list("value", flat=True)), values
+        )
+
+
+def sync_all_odds(events_id: list, **kwargs) -> set:
+    return set(events_id)
+
+
+@mock.patch.object(bet_importer.football_listing, "rebuild_league_listing")
+@mock.patch.object(bet_importer.football_tasks, "warm_league_lists")
+@mock.patch.object(bet_services, "generate_odds", side_effect=sync_all_odds)
+class ImportSportTests(TestCase):
+    def import_sport(self, sport: str, fixtures: list, *responses: list) -> dict:
+        with mock.patch.object(
+            bet_importer.RapidAPI, "iter_data", return_value=iter(fixtures)
+        ), mock.patch.object(
+            bet_importer.RapidAPI,
+            "fetch_many",
+            side_effect=[iter(response) for response in responses],
+        ):
+            return bet_importer.import_sport(spec=bet_sports.SPORTS[sport], days=1)
+
+    def test_import_sport_reads_fixtures_by_spec(self, generate_odds, *_):
+        summary = self.import_sport(
+            "basketball", [build_fixture(1, 10, 11)]
+        )
+
+        self.assertEqual(summary["fixtures"], 1)
+        self.assertTrue(
+            football_models.Match.objects.filter(api_id=1, away_team_id=11).exists()
+        )
+        generate_odds.assert_called_once_with(
+            events_id=[1],
+            version=None,
+            host="api-basketball.p.rapidapi.com",
+            kind_of_sport=3,
+        )
+
+    def test_import_sport_skips_unchanged_fixtures(self, generate_odds, *_):
+        self.import_sport("basketball", [build_fixture(1, 10, 11)])
+
+        summary = self.import_sport("basketball", [build_fixture(1, 10, 11)])
+
+        self.assertEqual((summary["fixtures"], summary["skipped"]), (0, 1))
+        generate_odds.assert_called_once()
+
+    def test_import_sport_refetches_odds_when_score_moves(self, generate_odds, *_):
+        self.import_sport("basketball", [build_fixture(1, 10, 11), build_fixture(2, 12, 13)])
+        generate_odds.reset_mock()
+
+        changed = build_fixture(1, 10, 11, home_score=3)
+        summary = self.import_sport("basketball", [changed, build_fixture(2, 12, 13)])
+
+        self.assertEqual((summary["fixtures"], summary["skipped"]), (1, 1))
+        self.assertEqual(generate_odds.call_args.kwargs["events_id"], [1])
+        self.assertEqual(football_models.Match.objects.get(api_id=1).winer_id, 10)
+
+    def test_import_sport_retries_odds_that_failed_to_sync(self, generate_odds, *_):
+        generate_odds.side_effect = lambda events_id, **kwargs: {2}
+        summary = self.import_sport(
+            "basketball", [build_fixture(1, 10, 11), build_fixture(2, 12, 13)]
+        )
+        self.assertEqual(summary["odds_failed"], 1)
+
+        generate_odds.side_effect = sync_all_odds
+        summary = self.import_sport(
+            "basketball", [build_fixture(1, 10, 11), build_fixture(2, 12, 13)]
+        )
+
+        self.assertEqual((summary["fixtures"], summary["skipped"]), (0, 2))
+        self.assertEqual(generate_odds.call_args.kwargs["events_id"], [1])
+
+        generate_odds.reset_mock()
+        self.import_sport("basketball", [build_fixture(1, 10, 11), build_fixture(2, 12, 13)])
+        generate_odds.assert_not_called()
+
+    def test_import_formula_1_uses_driver_as_home_team(self, generate_odds, *_):
+        race = {
+            "id": 7,
+            "date": "2022-06-01T13:00:00+00:00",
+            "season": 2022,
+            "competition": {"id": 3, "name": "GP", "location": {"country": "Monaco"}},
+            "fastest_lap": {"driver": {"id": 20}},
+        }
+        self.import_sport(
+            "formula_1",
+            [race],
+            [({"id": 20}, [{"id": 20, "name": "Driver"}])],
+        )
+
+        match = football_models.Match.objects.get(api_id=7)
+        self.assertEqual(match.home_team.title, "Driver")
+        self.assertIsNone(match.away_team)
+        generate_odds.assert_not_called()
+
+
+class GenerateOddsTests(TestCase):
+    @mock.patch.object(bet_services, "_sync_odds_page")
+    def test_generate_odds_returns_only_synced_events(self, sync_odds_page):
+        responses = [({"game": 1}, []), ({"game": 2}, "not odds")]
+        with mock.patch.object(
+            bet_services.RapidAPI, "fetch_many", return_value=iter(responses)
+        ), mock.patch.object(
+            bet_services, "_parse_odds", side_effect=[{}, ValueError("broken")]
+        ):
+            synced = bet_services.generate_odds(
+                events_id=[1, 2, 3], version=None, host="api-basketball.p.rapidapi.com"
+            )
+
+        # * 2 could not be parsed and 3 never came back from RapidAPI
+        self.assertEqual(synced, {1})
+
+    @mock.patch.object(bet_services, "_sync_odds_page", side_effect=ValueError("db"))
+    def test_generate_odds_drops_events_of_failed_pages(self, sync_odds_page):
+        with mock.patch.object(
+            bet_services.RapidAPI, "fetch_many", return_value=iter([({"game": 1}, [])])
+        ), mock.patch.object(bet_services, "_parse_odds", return_value={}):
+            synced = bet_services.generate_odds(
+                events_id=[1], version=None, host="api-basketball.p.rapidapi.com"
+            )
+
+        self.assertEqual(synced, set())
+
+
+class ParseOddsTests(TestCase):
+    def bookmaker(self, *names: str) -> dict:
+        values = [{"value": "Home", "odd": "1.5"}]
+        return {"bets": [{"name": name, "values": values} for name in names]}
+
+    def test_bookmaker_with_most_markets_is_used(self):
+        response = [
+            {"game": {"id": 1}, "bookmakers": [self.bookmaker("A"), self.bookmaker("A", "B")]}
+        ]
+
+        markets = bet_services._parse_odds(response=response, version=None)[1]
+
+        self.assertEqual(sorted(markets), ["A", "B", bet_services.MAIN_ODDS_NAME])
+
+    def test_fixtures_without_bookmakers_are_skipped(self):
+        response = [{"game": {"id": 1}, "bookmakers": []}, {"game": {"id": 2}}]
+
+        self.assertEqual(bet_services._parse_odds(response=response, version=None), {})
+
+
+class IdentityMapTests(TestCase):
+    def test_identity_map_serves_repeated_keys_from_memory(self):
+        geo_models.Country.objects.create(title="USA")
+        identity_map = bet_services.IdentityMap(
+            model=geo_models.Country, key_fields=("title",)
+        )
+
+        with self.assertNumQueries(1):
+            identity_map.warm(keys=[("USA",), ("Spain",)])
+            identity_map.stage(key=("USA",), defaults={})
+            identity_map.warm(keys=[("USA",), ("Spain",)])
+
+        self.assertEqual(identity_map.get(("USA",)).title, "USA")
+        self.assertIsNone(identity_map.get(("Spain",)))
+
+    def test_identity_map_writes_back_dirty_entities_only(self):
+        identity_map = bet_services.IdentityMap(
+            model=football_models.Team, key_fields=("id",)
+        )
+        football_models.Team.objects.create(id=1, title="One")
+        football_models.Team.objects.create(id=2, title="Two")
+        identity_map.warm(keys=[(1,), (2,)])
+
+        identity_map.stage(key=(1,), defaults={"title": "One"})
+        identity_map.stage(key=(2,), defaults={"title": "Renamed"})
+        report = identity_map.flush()
+
+        self.assertEqual((report.unchanged, report.updated), (1, 1))
+        self.assertEqual(football_models.Team.objects.get(id=2).title, "Renamed")
@@ -2,7 +2,7 @@
 from django import http, shortcuts, views
 
 from football.services import prefetch as services_prefetch
-from football.services.sportingnews import SportingNewsClient
+from football.services import sportingnews as services_sportingnews
 from user.mixins import SatelliteRequiredMixin
 
 # region				-----Internal Imports-----
@@ -27,7 +27,7 @@ class BetsWinsView(
             .all()
         )
 
-        rss_news = SportingNewsClient().rss_list()
+        rss_news = services_sportingnews.read_news()
         sports_amount = self._count_fixtures(queryset=Odds.objects)
 
         return shortcuts.render(
@@ -52,7 +52,7 @@ class BetsLossesView(
             .all()
         )
 
-        rss_news = SportingNewsClient().rss_list()
+        rss_news = services_sportingnews.read_news()
         sports_amount = self._count_fixtures(queryset=Odds.objects)
 
         return shortcuts.render(
@@ -77,7 +77,7 @@ class BetsProgressView(
             .all()
         )
 
-        rss_news = SportingNewsClient().rss_list()
+        rss_news = services_sportingnews.read_news()
         sports_amount = self._count_fixtures(queryset=Odds.objects)
 
         return shortcuts.render(
@@ -95,7 +95,7 @@ class NewsView(services_prefetch.SportIndexView):
     template_name = "pages/news/index.html"
 
     def get(self, request, *args, **kwargs) -> http.request.HttpRequest:
-        rss_news = SportingNewsClient().rss_list()
+        rss_news = services_sportingnews.read_news()
         sports_amount = self._count_fixtures(queryset=Odds.objects)
 
         return shortcuts.render(
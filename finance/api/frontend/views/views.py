@@ -11,7 +11,7 @@ from .... import models as finance_models
 from ..serializers import serializers as finance_serializers
 
 
-class TransactionViewSet(utils_mixins.PrefetchableListMixin):
+class TransactionViewSet(utils_mixins.KeysetPaginationMixin, utils_mixins.PrefetchableListMixin):
     permission_classes = [rest_permissions.IsAuthenticated, IsNotBlocked]
 
     def _get_client(self):
@@ -1,7 +1,7 @@
 # region				-----External Imports-----
 from django import http, shortcuts, views
 
-from football.services.sportingnews import SportingNewsClient
+from football.services import sportingnews as services_sportingnews
 from user.mixins import SatelliteRequiredMixin
 
 # region				-----Internal Imports-----
@@ -25,7 +25,7 @@ class TransactionsRefillView(SatelliteRequiredMixin, views.View):
             .all()
         )
 
-        rss_news = SportingNewsClient().rss_list()
+        rss_news = services_sportingnews.read_news()
 
         return shortcuts.render(
             request=request,
@@ -44,7 +44,7 @@ class TransactionsWithdrawView(SatelliteRequiredMixin, views.View):
             .all()
         )
 
-        rss_news = SportingNewsClient().rss_list()
+        rss_news = services_sportingnews.read_news()
 
         return shortcuts.render(
             request=request,
@@ -1,21 +1,69 @@
+import json
+import time
+
 from django import http
+from django.core.serializers import json as serializers_json
 from django.db import models
+from django.utils import translation
 from drf_spectacular import utils as drf_utils
 from rest_framework import renderers as rest_renderers
 from rest_framework import response as rest_response
 from rest_framework import status as rest_status
 
+from utils.third_party.api.rest_framework import conditional as utils_conditional
 from utils.third_party.api.rest_framework import mixins as utils_mixins
 from utils.third_party.api.rest_framework import paginators as utils_paginators
 
 from .... import models as football_models
+from ....services import cache as services_cache
+from ....services import listing as services_listing
+from ....services import prefetch as services_prefetch
 from ....services.prefetch import PrefetchView
 from ..serializers import serializers as football_serializers
 
-cache_dictionary = {}
 
+def _league_list_key(request: http.HttpRequest) -> str:
+    page = request.GET.get("page", 1)
+    if request.GET.get("pagination") == "keyset" or "cursor" in request.GET:
+        page = "keyset:{}:{}".format(
+            request.GET.get("cursor", ""), request.GET.get("count", "")
+        )
+
+    return services_cache.league_list_key(
+        kind_of_sport=request.GET.get("kind_of_sport"),
+        page=page,
+        page_size=request.GET.get("page_size"),
+        language=translation.get_language(),
+    )
+
+
+def _league_list_etag(request: http.HttpRequest, *args, **kwargs) -> str or None:
+    if "stream" in request.GET or "cache" in request.GET:
+        return None
+
+    # * Started matches are dropped on read, the tag turns over with the cache
+    period = int(time.time() // services_cache.LEAGUES_TIMEOUT)
+    return utils_conditional.version_etag(_league_list_key(request=request), period)
+
+
+def _best_fixture_etag(request: http.HttpRequest, *args, **kwargs) -> str or None:
+    kind_of_sport = request.GET.get("kind_of_sport")
+    if not str(kind_of_sport).isdigit():
+        return None
+
+    pk = services_cache.shared_cache().get(
+        services_cache.BEST_FIXTURE_KEY.format(int(kind_of_sport))
+    )
+    if pk is None:
+        pk = services_prefetch.select_best_fixture(kind_of_sport=int(kind_of_sport))
+    if not pk:
+        return None
+    return utils_conditional.version_etag(
+        pk, services_cache.leagues_version(kind_of_sport=kind_of_sport)
+    )
 
-class LeagueViewSet(utils_mixins.PrefetchableListMixin):
+
+class LeagueViewSet(utils_mixins.KeysetPaginationMixin, utils_mixins.PrefetchableListMixin):
     permission_classes = []
 
     @drf_utils.extend_schema(
@@ -27,33 +75,76 @@ class LeagueViewSet(utils_mixins.PrefetchableListMixin):
                     5 - handball, 6 - hockey, 7 - rugby, 8 - volleyball",
                 required=True,
                 type=drf_utils.OpenApiTypes.INT,
-            )
+            ),
+            drf_utils.OpenApiParameter(
+                name="pagination",
+                description="keyset - cursor pages without a count",
+                required=False,
+                type=drf_utils.OpenApiTypes.STR,
+            ),
+            drf_utils.OpenApiParameter(
+                name="count",
+                description="estimate - approximate count of keyset pages",
+                required=False,
+                type=drf_utils.OpenApiTypes.STR,
+            ),
+            drf_utils.OpenApiParameter(
+                name="stream",
+                description="Stream every league as one JSON object per line",
+                required=False,
+                type=drf_utils.OpenApiTypes.BOOL,
+            ),
         ],
         description="NO AUTH. Get all games in specific kind of sport.",
         responses=football_serializers.ReadLeagueSerializer,
     )
+    @utils_conditional.conditional_list(etag_func=_league_list_etag)
     def list(self, request: http.HttpRequest, *args, **kwargs) -> rest_response.Response:
-        key = f"sport_{request.GET.get('kind_of_sport')}"
-        if key in cache_dictionary and "cache" not in request.GET:
-            cached = cache_dictionary[key]
+        if "stream" in request.GET:
+            return self._stream_list()
+
+        key = _league_list_key(request=request)
+        cache = services_cache.shared_cache()
+
+        # * ?cache=True skips the lookup and rebuilds the entry
+        cached = None if "cache" in request.GET else cache.get(key)
+        if cached is not None:
             return rest_response.Response(data=cached["data"], status=cached["status"])
-        response = super().list(request=request, *args, **kwargs)
-        if "cache" in request.GET:
-            cache_dictionary[key] = {
-                "data": response.data,
-                "status": response.status_code,
-            }
+
+        # * Leagues are read from the listing rebuilt after every import
+        page = self.paginate_queryset(self._prefetch_list(queryset=self.queryset))
+        response = self.get_paginated_response(
+            data=services_listing.read_leagues(listings=page)
+        )
+        if response.status_code == rest_status.HTTP_200_OK:
+            cache.set(
+                key,
+                {"data": response.data, "status": response.status_code},
+                timeout=services_cache.LEAGUES_TIMEOUT,
+            )
         return response
 
+    def _stream_list(self) -> http.StreamingHttpResponse:
+        # * Leagues are read and sent one at a time, clients render each line
+        # * as it arrives instead of waiting for every league with its odds
+        listings = self._prefetch_list(queryset=self.queryset).iterator()
+        lines = (
+            json.dumps(league, cls=serializers_json.DjangoJSONEncoder) + "\n"
+            for league in services_listing.iter_leagues(listings=listings)
+        )
+        return http.StreamingHttpResponse(lines, content_type="application/x-ndjson")
+
     def _prefetch_list(self, queryset: models.QuerySet) -> models.QuerySet:
         kind_of_sport = self.request.query_params.get("kind_of_sport")
-        return PrefetchView()._prefetch_leagues(queryset=queryset, kind_of_sport=kind_of_sport)
+        return services_listing.league_listing(kind_of_sport=kind_of_sport)
 
     serializer_class = football_serializers.ReadLeagueSerializer
 
     pagination_class = utils_paginators.StandartPagePaginator
+    keyset_ordering = "position"
+    query_budget = 2
     renderer_classes = [rest_renderers.JSONRenderer]
-    queryset = football_models.League.objects
+    queryset = football_models.LeagueListing.objects
 
 
 class BestFixtureViewSet(utils_mixins.PrefetchableListMixin):
@@ -74,6 +165,7 @@ class BestFixtureViewSet(utils_mixins.PrefetchableListMixin):
         description="NO AUTH. Get nearest game in specific kind of sport.",
         responses=football_serializers.ReadMatchSerializer,
     )
+    @utils_conditional.conditional_list(etag_func=_best_fixture_etag)
     def list(self, request: http.HttpRequest, *args, **kwargs) -> rest_response.Response:
         instance = self._prefetch_list(queryset=self.queryset)
         if instance:
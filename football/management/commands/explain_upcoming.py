@@ -0,0 +1,50 @@
+# region				-----External Imports-----
+import typing
+
+from django.core.management import base
+from django.db import models as django_models
+
+from bets import models as bets_models
+from football import managers as football_managers
+from football import models as football_models
+
+# endregion
+
+
+class Command(base.BaseCommand):
+    help = "Print the query plans of the upcoming matches window"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kind-of-sport", type=int, default=1)
+        parser.add_argument(
+            "--legacy",
+            action="store_true",
+            help="Explain the former date__hour filter for comparison",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run the queries (EXPLAIN ANALYZE, PostgreSQL only)",
+        )
+
+    def handle(self, *args, **options):
+        upcoming = football_managers.upcoming_filter()
+        if options["legacy"]:
+            upcoming &= django_models.Q(
+                date__hour__gte=football_managers.upcoming_threshold().hour
+            )
+
+        matches = football_models.Match.objects.filter(
+            upcoming, league__kind_of_sport=options["kind_of_sport"]
+        )
+        queries: typing.Dict[str, django_models.QuerySet] = {
+            "matches": matches,
+            "main odds": bets_models.Odds.objects.filter(
+                fixture__in=matches.values("pk"), name_en_us="Match Winner"
+            ),
+        }
+
+        explain = {"analyze": True} if options["analyze"] else {}
+        for title, queryset in queries.items():
+            self.stdout.write(self.style.SUCCESS(title))
+            self.stdout.write(queryset.explain(**explain))
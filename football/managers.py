@@ -0,0 +1,42 @@
+# region				-----External Imports-----
+import datetime
+
+from django import utils
+from django.db import models as django_models
+
+# endregion
+
+# region			  -----Supporting Variables-----
+# * Matches starting within this offset are no longer offered
+UPCOMING_OFFSET = datetime.timedelta(hours=2)
+# endregion
+
+
+def upcoming_threshold() -> datetime.datetime:
+    return utils.timezone.now() + UPCOMING_OFFSET
+
+
+def upcoming_filter(prefix: str = "") -> django_models.Q:
+    # * A plain range on ``date``: extracts like date__hour defeat its indexes
+    return django_models.Q(**{f"{prefix}date__gte": upcoming_threshold()})
+
+
+def day_filter(day: datetime.date, prefix: str = "") -> django_models.Q:
+    timezone = utils.timezone.get_current_timezone()
+    start = utils.timezone.make_aware(
+        datetime.datetime.combine(day, datetime.time.min), timezone
+    )
+    return django_models.Q(
+        **{
+            f"{prefix}date__gte": start,
+            f"{prefix}date__lt": start + datetime.timedelta(days=1),
+        }
+    )
+
+
+class MatchQuerySet(django_models.QuerySet):
+    def upcoming(self) -> "MatchQuerySet":
+        return self.filter(upcoming_filter())
+
+    def on_day(self, day: datetime.date) -> "MatchQuerySet":
+        return self.filter(day_filter(day=day))
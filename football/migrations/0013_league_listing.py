@@ -0,0 +1,35 @@
+# Generated by Django 3.2.7 on 2026-10-18 15:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football', '0012_alter_league_kind_of_sport'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeagueListing',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind_of_sport', models.PositiveSmallIntegerField(choices=[(1, 'football'), (2, 'baseball'), (3, 'basketball'), (4, 'formula 1'), (5, 'handball'), (6, 'hockey'), (7, 'rugby'), (8, 'volleyball')], verbose_name='Kind of sport')),
+                ('language', models.CharField(max_length=10, verbose_name='Language')),
+                ('position', models.PositiveIntegerField(verbose_name='Position')),
+                ('last_match_date', models.DateTimeField(verbose_name='Last match date')),
+                ('data', models.JSONField(default=dict, verbose_name='Serialized league')),
+                ('league', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='listings', to='football.league', verbose_name='League')),
+            ],
+            options={
+                'verbose_name': 'League listing',
+                'verbose_name_plural': 'League listings',
+                'ordering': ['position'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='leaguelisting',
+            index=models.Index(fields=['kind_of_sport', 'language', 'position'], name='football_le_kind_of_af49d1_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.7 on 2026-10-18 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football', '0013_league_listing'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['league', 'date'], name='football_ma_league__c75f2a_idx'),
+        ),
+    ]
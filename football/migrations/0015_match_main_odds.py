@@ -0,0 +1,51 @@
+# Generated by Django 3.2.7 on 2026-10-18 15:52
+
+from django.db import migrations, models
+
+MAIN_ODDS_FIELDS = {"Home": "main_odds_1", "Draw": "main_odds_x", "Away": "main_odds_2"}
+
+
+def backfill_main_odds(apps, schema_editor):
+    Match = apps.get_model("football", "Match")
+    OddsDetail = apps.get_model("bets", "OddsDetail")
+
+    prices = {}
+    details = OddsDetail.objects.filter(
+        odds__name_en_us="Match Winner", name_en_us__in=MAIN_ODDS_FIELDS
+    ).values_list("odds__fixture_id", "name_en_us", "value")
+    for fixture_id, name, value in details.iterator():
+        prices.setdefault(fixture_id, {})[MAIN_ODDS_FIELDS[name]] = value
+
+    matches = []
+    for match in Match.objects.filter(pk__in=list(prices)).only("pk").iterator():
+        for field, value in prices[match.pk].items():
+            setattr(match, field, value)
+        matches.append(match)
+    Match.objects.bulk_update(matches, fields=list(MAIN_ODDS_FIELDS.values()), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bets', '0020_odds_fixture_name_index'),
+        ('football', '0014_match_league_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='match',
+            name='main_odds_1',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=100, null=True, verbose_name='Home win odd'),
+        ),
+        migrations.AddField(
+            model_name='match',
+            name='main_odds_2',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=100, null=True, verbose_name='Away win odd'),
+        ),
+        migrations.AddField(
+            model_name='match',
+            name='main_odds_x',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=100, null=True, verbose_name='Draw odd'),
+        ),
+        migrations.RunPython(backfill_main_odds, migrations.RunPython.noop),
+    ]
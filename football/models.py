@@ -6,6 +6,7 @@ from bets.models import Event
 
 # region				-----Internal Imports-----
 from . import choices as football_choices
+from . import managers as football_managers
 
 # endregion
 
@@ -93,6 +94,19 @@ class Match(Event):
     referee = django_models.CharField(
         verbose_name="Match referee", max_length=100, blank=True, null=True
     )
+
+    # * Copies of the "Match Winner" prices, kept in sync by the odds import
+    main_odds_1 = django_models.DecimalField(
+        verbose_name="Home win odd", decimal_places=2, max_digits=100, blank=True, null=True
+    )
+
+    main_odds_x = django_models.DecimalField(
+        verbose_name="Draw odd", decimal_places=2, max_digits=100, blank=True, null=True
+    )
+
+    main_odds_2 = django_models.DecimalField(
+        verbose_name="Away win odd", decimal_places=2, max_digits=100, blank=True, null=True
+    )
     # endregion
 
     # region           -----Relation-----
@@ -133,8 +147,13 @@ class Match(Event):
     )
     # endregion
 
+    # region             -----Manager-----
+    objects = football_managers.MatchQuerySet.as_manager()
+    # endregion
+
     # region              -----Metas-----
     class Meta(object):
+        indexes = [django_models.Index(fields=["league", "date"])]
         verbose_name_plural = "Matches"
         verbose_name = "Match"
 
@@ -180,3 +199,57 @@ class Team(django_models.Model):
 
 
 # endregion
+
+
+class LeagueListing(django_models.Model):
+    # region           -----Relation-----
+    league = django_models.ForeignKey(
+        on_delete=django_models.CASCADE,
+        related_name="listings",
+        verbose_name="League",
+        to="football.League",
+        blank=False,
+        null=False,
+    )
+    # endregion
+
+    # region           -----Information-----
+    kind_of_sport = django_models.PositiveSmallIntegerField(
+        choices=football_choices.kinds_of_sport,
+        verbose_name="Kind of sport",
+        blank=False,
+        null=False,
+    )
+
+    language = django_models.CharField(
+        verbose_name="Language", max_length=10, blank=False, null=False
+    )
+
+    position = django_models.PositiveIntegerField(
+        verbose_name="Position", blank=False, null=False
+    )
+
+    last_match_date = django_models.DateTimeField(
+        verbose_name="Last match date", blank=False, null=False
+    )
+
+    # * ReadLeagueSerializer output of the league with its upcoming matches
+    data = django_models.JSONField(verbose_name="Serialized league", default=dict)
+    # endregion
+
+    # region              -----Metas-----
+    class Meta(object):
+        ordering = ["position"]
+        indexes = [
+            django_models.Index(fields=["kind_of_sport", "language", "position"])
+        ]
+        verbose_name_plural = "League listings"
+        verbose_name = "League listing"
+
+    # endregion
+
+    # region         -----Default Methods-----
+    def __str__(self) -> str:
+        return f"{self.kind_of_sport} {self.language} {self.position}"
+
+    # endregion
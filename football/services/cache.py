@@ -0,0 +1,134 @@
+# region				-----External Imports-----
+import contextlib
+import threading
+import typing
+
+from django import http
+from django.conf import settings
+from django.core import cache as django_cache
+from django.db import transaction
+from django.utils import translation
+
+from utils.third_party.api.rest_framework import paginators as utils_paginators
+
+# endregion
+
+# region			  -----Supporting Variables-----
+CACHE_ALIAS = "shared"
+
+LEAGUES_TIMEOUT = 15 * 60
+LEAGUES_VERSION_KEY = "leagues:version"
+
+# * Kinds of sport with upcoming odds, shown in the header menu of every page
+SPORTS_AMOUNT_KEY = "sports:amount"
+SPORTS_AMOUNT_TIMEOUT = 5 * 60
+
+# * Primary key of the featured match per sport, 0 when there is none
+BEST_FIXTURE_KEY = "best_fixture:{}"
+BEST_FIXTURE_TIMEOUT = 60 * 60
+
+# * Parsed sportingnews.com articles of the news line, refreshed by a task
+RSS_NEWS_KEY = "rss:sportingnews"
+RSS_NEWS_REFRESHING_KEY = "rss:sportingnews:refreshing"
+RSS_NEWS_TIMEOUT = 24 * 60 * 60
+
+# * Query strings the frontend requests, each is rendered into the cache; the
+# * full league list passes the largest page size explicitly
+LEAGUES_FULL_PAGE_SIZE = str(utils_paginators.StandartPagePaginator.max_page_size)
+LEAGUES_WARM_QUERIES = [
+    {"page": "1", "page_size": "10"},
+    {"page": "1", "page_size": LEAGUES_FULL_PAGE_SIZE},
+]
+
+_state = threading.local()
+# endregion
+
+
+def shared_cache() -> django_cache.BaseCache:
+    return django_cache.caches[CACHE_ALIAS]
+
+
+def _version(key: str) -> int:
+    cache = shared_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key) or 1
+    return version
+
+
+def _bump(key: str) -> None:
+    cache = shared_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def leagues_version(kind_of_sport: typing.Any) -> str:
+    # * Both the global and the per-sport versions are part of it, so a bump
+    # * of either makes every older listing unreachable
+    return "{}:{}".format(
+        _version(LEAGUES_VERSION_KEY), _version(f"{LEAGUES_VERSION_KEY}:{kind_of_sport}")
+    )
+
+
+def league_list_key(
+    kind_of_sport: typing.Any, page: typing.Any, page_size: typing.Any, language: str
+) -> str:
+    return "leagues:{}:{}:{}:{}:{}".format(
+        leagues_version(kind_of_sport=kind_of_sport),
+        kind_of_sport,
+        language,
+        page,
+        page_size,
+    )
+
+
+def invalidate_leagues(kind_of_sport: int or None = None) -> None:
+    if kind_of_sport is None:
+        _bump(LEAGUES_VERSION_KEY)
+    else:
+        _bump(f"{LEAGUES_VERSION_KEY}:{kind_of_sport}")
+
+
+def on_commit_once(function: typing.Callable[[], None]) -> None:
+    # * Queryset deletes send one signal per row, the function runs once per
+    # * transaction
+    connection = transaction.get_connection()
+    if any(func is function for _, func in connection.run_on_commit):
+        return
+
+    transaction.on_commit(function)
+
+
+@contextlib.contextmanager
+def invalidation_suppressed() -> typing.Iterator[None]:
+    # * Bulk writers (the importers) refresh the listings themselves at the end
+    previous = getattr(_state, "suppressed", False)
+    _state.suppressed = True
+    try:
+        yield
+    finally:
+        _state.suppressed = previous
+
+
+def is_invalidation_suppressed() -> bool:
+    return getattr(_state, "suppressed", False)
+
+
+def warm_league_list(kind_of_sport: int, language: str) -> None:
+    # * Imported here: the views read their cache keys from this module
+    from football.api.frontend.views import views as frontend_views
+
+    view = frontend_views.LeagueViewSet.as_view({"get": "list"})
+    for query in LEAGUES_WARM_QUERIES:
+        request = http.HttpRequest()
+        request.method = "GET"
+        request.META["HTTP_HOST"] = settings.CACHE_WARMING_HOST
+        request.GET = http.QueryDict(mutable=True)
+        request.GET.update({"kind_of_sport": str(kind_of_sport), "cache": "True", **query})
+
+        # * ?cache=True makes the view render and store a fresh entry
+        with translation.override(language):
+            view(request)
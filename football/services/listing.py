@@ -0,0 +1,102 @@
+# region				-----External Imports-----
+import datetime
+import typing
+
+from django.conf import settings
+from django.db import models as django_models
+from django.db import transaction
+from django.utils import dateparse, translation
+
+from football import managers as football_managers
+from football import models as football_models
+from football.api.frontend.serializers import serializers as football_serializers
+
+# region				-----Internal Imports-----
+from . import cache as services_cache
+
+# endregion
+
+# endregion
+
+# region			  -----Supporting Variables-----
+KINDS_OF_SPORT = [kind for kind, _ in football_models.football_choices.kinds_of_sport]
+# endregion
+
+
+def listing_threshold() -> datetime.datetime:
+    # * Same window as PrefetchView: matches starting within two hours are gone
+    return football_managers.upcoming_threshold()
+
+
+def rebuild_league_listing(kind_of_sport: int) -> int:
+    # * Imported here: prefetch reads the listing for the index pages
+    from . import prefetch as services_prefetch
+
+    rows = []
+    for language in settings.LANGUAGE_CODES:
+        with translation.override(language):
+            leagues = services_prefetch.PrefetchView()._prefetch_leagues(
+                queryset=football_models.League.objects, kind_of_sport=kind_of_sport
+            )
+            serialized = football_serializers.ReadLeagueSerializer(
+                instance=leagues, many=True
+            ).data
+
+        for position, (league, data) in enumerate(zip(leagues, serialized)):
+            dates = [match.date for match in league.matches.all()]
+            if not dates:
+                continue
+
+            rows.append(
+                football_models.LeagueListing(
+                    league_id=league.pk,
+                    kind_of_sport=kind_of_sport,
+                    language=language,
+                    position=position,
+                    last_match_date=max(dates),
+                    data=data,
+                )
+            )
+
+    with transaction.atomic():
+        football_models.LeagueListing.objects.filter(kind_of_sport=kind_of_sport).delete()
+        football_models.LeagueListing.objects.bulk_create(rows)
+
+    services_cache.invalidate_leagues(kind_of_sport=kind_of_sport)
+    services_prefetch.count_fixtures()
+    services_prefetch.select_best_fixture(kind_of_sport=kind_of_sport)
+    return len(rows)
+
+
+def league_listing(
+    kind_of_sport: typing.Any,
+) -> django_models.QuerySet[football_models.LeagueListing]:
+    return football_models.LeagueListing.objects.filter(
+        kind_of_sport=kind_of_sport,
+        language=translation.get_language() or settings.LANGUAGE_CODE,
+        last_match_date__gte=listing_threshold(),
+    ).only("data", "position")
+
+
+def iter_leagues(
+    listings: typing.Iterable[football_models.LeagueListing], parse_dates: bool = False
+) -> typing.Iterator[typing.Dict]:
+    # * Matches that started since the last rebuild are dropped on read
+    threshold = listing_threshold()
+    for listing in listings:
+        league = dict(listing.data)
+        matches = []
+        for match in league.get("matches") or []:
+            date = dateparse.parse_datetime(match["date"])
+            if date < threshold:
+                continue
+            matches.append({**match, "date": date} if parse_dates else match)
+
+        league["matches"] = matches
+        yield league
+
+
+def read_leagues(
+    listings: typing.Iterable[football_models.LeagueListing], parse_dates: bool = False
+) -> typing.List[typing.Dict]:
+    return list(iter_leagues(listings=listings, parse_dates=parse_dates))
@@ -1,4 +1,3 @@
-import datetime
 import typing
 
 from django import http, shortcuts, utils, views
@@ -10,10 +9,13 @@ from django.db import models as django_models
 from django.utils import translation
 
 from bets import models as bets_models
+from football import managers as football_managers
 from football import models as football_models
 
 # region				-----Internal Imports-----
 from . import best_leagues as services_best_leagues
+from . import cache as services_cache
+from . import listing as services_listing
 from . import sportingnews as services_sportingnews
 
 # endregion
@@ -24,13 +26,87 @@ from . import sportingnews as services_sportingnews
 # endregion
 
 
+def count_fixtures(
+    queryset: django_models.QuerySet[bets_models.Odds] or None = None,
+) -> typing.List[int]:
+    queryset = bets_models.Odds.objects if queryset is None else queryset
+    kind_of_sport = "fixture__league__kind_of_sport"
+    last_matches = dict(
+        queryset.filter(football_managers.upcoming_filter(prefix="fixture__"))
+        .values_list(kind_of_sport)
+        .annotate(last_match_date=django_models.Max("fixture__date"))
+        .order_by(kind_of_sport)
+    )
+    sports = list(last_matches)
+
+    # * A sport leaves the menu once its last match enters the window, the
+    # * entry expires no later than that
+    timeout = services_cache.SPORTS_AMOUNT_TIMEOUT
+    if last_matches:
+        expires_in = min(last_matches.values()) - football_managers.upcoming_threshold()
+        timeout = max(1, min(timeout, int(expires_in.total_seconds())))
+
+    services_cache.shared_cache().set(
+        services_cache.SPORTS_AMOUNT_KEY, sports, timeout=timeout
+    )
+    return sports
+
+
+def _score(condition: django_models.Q, points: int) -> django_models.Case:
+    return django_models.Case(
+        django_models.When(condition, then=django_models.Value(points)),
+        default=django_models.Value(0),
+        output_field=django_models.IntegerField(),
+    )
+
+
+def select_best_fixture(kind_of_sport: int) -> int or None:
+    best_leagues = services_best_leagues.BestLeagues
+    today = utils.timezone.localtime(football_managers.upcoming_threshold()).date()
+    fixtures = football_models.Match.objects.upcoming().filter(
+        league__kind_of_sport=kind_of_sport
+    )
+    if kind_of_sport != 4:
+        fixtures = fixtures.filter(
+            django_models.Exists(
+                bets_models.Odds.objects.filter(fixture_id=django_models.OuterRef("pk"))
+            )
+        )
+
+    # * League priority outweighs the country, kickoff today and main odds
+    leagues = best_leagues.leagues.get(str(kind_of_sport), [])
+    countries = best_leagues.countries
+    fixture = (
+        fixtures.annotate(
+            score=_score(django_models.Q(league__title_en_us__in=leagues), 8)
+            + _score(django_models.Q(league__country__title_en_us__in=countries), 4)
+            + _score(football_managers.day_filter(day=today), 2)
+            + _score(django_models.Q(main_odds_1__isnull=False), 1)
+        )
+        .order_by("-score", "date")
+        .values("pk", "date")
+        .first()
+    )
+
+    # * The entry expires before the featured match leaves the window
+    timeout = services_cache.BEST_FIXTURE_TIMEOUT
+    if fixture:
+        expires_in = fixture["date"] - football_managers.upcoming_threshold()
+        timeout = max(1, min(timeout, int(expires_in.total_seconds())))
+
+    pk = fixture["pk"] if fixture else None
+    services_cache.shared_cache().set(
+        services_cache.BEST_FIXTURE_KEY.format(kind_of_sport), pk or 0, timeout=timeout
+    )
+    return pk
+
+
 class PrefetchView(services_best_leagues.BestLeagues):
     def _prefetch_leagues(
         self,
         queryset: django_models.QuerySet[football_models.League],
         kind_of_sport: int,
     ) -> django_models.QuerySet[football_models.League]:
-        current_datetime = utils.timezone.now() + datetime.timedelta(hours=2)
         filtered_query = django_models.Q()
         match_filtered_query = django_models.Q()
 
@@ -38,58 +114,26 @@ class PrefetchView(services_best_leagues.BestLeagues):
             match_filtered_query = django_models.Q(odds__isnull=False)
             filtered_query &= django_models.Q(matches__odds__isnull=False)
 
-        filter_mathces_counter = django_models.Q(
-            matches__date__gte=current_datetime,
-            matches__date__hour__gte=current_datetime.hour,
-        )
-
-        filter_odds_counter = django_models.Q(
-            matches__odds__fixture__date__gte=current_datetime,
-            matches__odds__fixture__date__hour__gte=current_datetime.hour,
-        )
-
-        filter_matches = django_models.Q(
-            date__gte=current_datetime,
-            date__hour__gte=current_datetime.hour,
+        filter_mathces_counter = football_managers.upcoming_filter(prefix="matches__")
+        filter_odds_counter = football_managers.upcoming_filter(
+            prefix="matches__odds__fixture__"
         )
 
         return (
             queryset.filter(filtered_query, kind_of_sport=kind_of_sport)
             .prefetch_related(
                 django_models.Prefetch(
-                    queryset=football_models.Match.objects.filter(
-                        match_filtered_query, filter_matches
-                    )
+                    queryset=football_models.Match.objects.upcoming()
+                    .filter(match_filtered_query)
                     .select_related("home_team")
                     .select_related("away_team")
-                    .annotate(
-                        main_odds_1=bets_models.Odds.objects.filter(
-                            fixture_id=django_models.OuterRef("id")
-                        )
-                        .filter(django_models.Q(name_en_us="Match Winner"))
-                        .values("odds_detail__value")[0:1]
-                    )
-                    .annotate(
-                        main_odds_x=bets_models.Odds.objects.filter(
-                            fixture_id=django_models.OuterRef("id")
-                        )
-                        .filter(django_models.Q(name_en_us="Match Winner"))
-                        .values("odds_detail__value")[1:2]
-                    )
-                    .annotate(
-                        main_odds_2=bets_models.Odds.objects.filter(
-                            fixture_id=django_models.OuterRef("id")
-                        )
-                        .filter(django_models.Q(name_en_us="Match Winner"))
-                        .values("odds_detail__value")[2:3]
-                    )
                     .prefetch_related(
                         django_models.Prefetch(
                             queryset=bets_models.Odds.objects.exclude(
                                 django_models.Q(name_en_us="Match Winner")
                             )
                             .prefetch_related("odds_detail")
-                            .only("name"),
+                            .only("name", "fixture"),
                             lookup="odds",
                         )
                     )
@@ -117,35 +161,28 @@ class PrefetchView(services_best_leagues.BestLeagues):
         queryset: django_models.QuerySet[football_models.Match],
         kind_of_sport: int,
     ) -> football_models.Match:
-        current_datetime = utils.timezone.now() + datetime.timedelta(hours=2)
-        filtered_query = django_models.Q(
-            league__kind_of_sport=kind_of_sport,
-            date__month=current_datetime.month,
-            date__year=current_datetime.year,
-            date__day=current_datetime.day,
-        )
-
-        if kind_of_sport != 4:
-            filtered_query &= django_models.Q(odds__isnull=False)
+        if not str(kind_of_sport).isdigit():
+            return None
 
-        fixture = queryset.filter(
-            filtered_query
-            & (
-                django_models.Q(league__title_en_us__in=str(self.leagues.get(1)))
-                | django_models.Q(league__country__title_en_us__in=self.countries)
-            )
+        # * The fixture is chosen after every import, requests only look it up
+        kind_of_sport = int(kind_of_sport)
+        pk = services_cache.shared_cache().get(
+            services_cache.BEST_FIXTURE_KEY.format(kind_of_sport)
         )
-        if not fixture.exists():
-            fixture = queryset.filter(filtered_query)
+        if pk is None:
+            pk = select_best_fixture(kind_of_sport=kind_of_sport)
+        if not pk:
+            return None
 
         return (
-            fixture.prefetch_related(
+            queryset.filter(pk=pk)
+            .prefetch_related(
                 django_models.Prefetch(
                     queryset=bets_models.Odds.objects.filter(
                         django_models.Q(name_en_us="Match Winner")
                     )
                     .prefetch_related("odds_detail")
-                    .only("name"),
+                    .only("name", "fixture"),
                     lookup="odds",
                 )
             )
@@ -158,17 +195,11 @@ class PrefetchView(services_best_leagues.BestLeagues):
     def _count_fixtures(
         self, queryset: django_models.QuerySet[bets_models.Odds]
     ) -> list:
-        current_datetime = utils.timezone.now() + datetime.timedelta(hours=2)
-        queryset = (
-            queryset.filter(
-                fixture__date__gte=current_datetime,
-                fixture__date__hour__gte=current_datetime.hour,
-            )
-            .distinct("fixture__league__kind_of_sport")
-            .values_list("fixture__league__kind_of_sport", flat=True)
-        )
-
-        return list(queryset)
+        # * Recounted after every import, pages only read the cached list
+        sports = services_cache.shared_cache().get(services_cache.SPORTS_AMOUNT_KEY)
+        if sports is None:
+            sports = count_fixtures(queryset=queryset)
+        return sports
 
 
 class SportIndexView(PrefetchView, views.View):
@@ -182,8 +213,11 @@ class SportIndexView(PrefetchView, views.View):
         type = kwargs.pop("type")
         paginator = django_paginator.Paginator(object_list=leagues, per_page=4)
         paginated_leagues = paginator.get_page(page)
+        paginated_leagues.object_list = services_listing.read_leagues(
+            listings=paginated_leagues.object_list, parse_dates=True
+        )
 
-        rss_news = services_sportingnews.SportingNewsClient().rss_list()
+        rss_news = services_sportingnews.read_news()
 
         sports_amount = self._count_fixtures(queryset=bets_models.Odds.objects)
         context = {
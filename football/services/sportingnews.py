@@ -1,5 +1,6 @@
 # region				-----External Imports-----
 import datetime
+import logging
 import typing
 from xml.etree import ElementTree
 
@@ -7,6 +8,7 @@ import requests
 import xmltodict
 
 # region				-----Internal Imports-----
+from . import cache as services_cache
 from .exceptions import SportingNewsException
 
 # endregion
@@ -14,9 +16,20 @@ from .exceptions import SportingNewsException
 # endregion
 
 # region			  -----Supporting Variables-----
+logger = logging.Logger(__file__)
+
+RSS_TIMEOUT = 10
+RSS_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
 # endregion
 
 
+class ArticleType(typing.TypedDict):
+    title: str
+    link: str
+    image: str or None
+    date: datetime.datetime or None
+
+
 class SportingNewsClient:
     def __init__(self) -> None:
         self._host = "www.sportingnews.com"
@@ -27,21 +40,65 @@ class SportingNewsClient:
 
     def rss(self) -> typing.List[typing.Any]:
         try:
-            return ElementTree.fromstring(requests.get(self.rss_url).content)
+            return ElementTree.fromstring(
+                requests.get(self.rss_url, timeout=RSS_TIMEOUT).content
+            )
         except requests.exceptions.RequestException as ex:
             raise SportingNewsException
 
-    def rss_list(self):
+    def rss_list(self) -> typing.List[ArticleType]:
         try:
-            xml_response = requests.get(self.rss_url).content
-            dict_data = xmltodict.parse(xml_response)
-            news_list = dict_data["rss"]["channel"]["item"]
-            for article in news_list:
-                if isinstance(article["media:content"], list):
-                    article["image"] = article["media:content"][0]["@url"]
-                else:
-                    article["image"] = article["media:content"]["@url"]
-                article["date"] = datetime.datetime.strptime(article["pubDate"], "%a, %d %b %Y %H:%M:%S %z")
-            return news_list
+            xml_response = requests.get(self.rss_url, timeout=RSS_TIMEOUT).content
         except requests.exceptions.RequestException as ex:
             raise SportingNewsException
+
+        try:
+            news_list = xmltodict.parse(xml_response)["rss"]["channel"].get("item") or []
+        except Exception as ex:
+            raise SportingNewsException(ex)
+
+        # * A channel with a single item is parsed into a dict
+        if isinstance(news_list, dict):
+            news_list = [news_list]
+        return [parse_article(article=article) for article in news_list]
+
+
+def parse_article(article: typing.Dict[str, typing.Any]) -> ArticleType:
+    # * Only what the news line renders is kept, the feed items are large
+    media = article.get("media:content")
+    if isinstance(media, list):
+        media = media[0] if media else None
+
+    date = article.get("pubDate")
+    return {
+        "title": article.get("title"),
+        "link": article.get("link"),
+        "image": media.get("@url") if media else None,
+        "date": datetime.datetime.strptime(date, RSS_DATE_FORMAT) if date else None,
+    }
+
+
+def refresh_news() -> typing.List[ArticleType]:
+    # * A failed fetch keeps serving the articles fetched last time
+    articles = SportingNewsClient().rss_list()
+    services_cache.shared_cache().set(
+        services_cache.RSS_NEWS_KEY, articles, timeout=services_cache.RSS_NEWS_TIMEOUT
+    )
+    return articles
+
+
+def read_news() -> typing.List[ArticleType]:
+    # * Pages never wait on sportingnews.com: the feed is refreshed by a task
+    cache = services_cache.shared_cache()
+    articles = cache.get(services_cache.RSS_NEWS_KEY)
+    if articles is not None:
+        return articles
+
+    if cache.add(services_cache.RSS_NEWS_REFRESHING_KEY, 1, timeout=RSS_TIMEOUT * 6):
+        from .. import tasks as football_tasks
+
+        try:
+            football_tasks.task_refresh_news.delay()
+        except Exception as ex:
+            logger.error(f"read_news: {ex}")
+    return []
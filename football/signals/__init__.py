@@ -1,4 +1,4 @@
 # region				-----Internal Imports-----
-from . import preprocessing
+from . import invalidation, preprocessing
 
 # endregion
@@ -0,0 +1,4 @@
+# region				-----Internal Imports-----
+from . import signals
+
+# endregion
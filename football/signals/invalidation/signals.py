@@ -0,0 +1,103 @@
+# region				-----External Imports-----
+import functools
+import typing
+
+from django import dispatch
+from django.db import models as django_models
+
+from bets import models as bets_models
+from geo import models as geo_models
+from utils import translate as utils_translate
+from utils.first_party import signals as utils_signals
+
+# region				-----Internal Imports-----
+from ... import models, tasks
+from ...services import cache as services_cache
+
+# endregion
+
+# endregion
+
+
+@functools.lru_cache(maxsize=None)
+def listing_refresher(kind_of_sport: typing.Optional[int]) -> typing.Callable[[], None]:
+    # * One callable per sport, so on_commit_once runs each sport once per transaction
+    def refresh() -> None:
+        services_cache.invalidate_leagues(kind_of_sport=kind_of_sport)
+        tasks.task_rebuild_league_listings.delay(kind_of_sport=kind_of_sport)
+
+    return refresh
+
+
+def refresh_listings() -> None:
+    listing_refresher(kind_of_sport=None)()
+
+
+def kinds_of_sport(instance: typing.Any) -> typing.Set[int]:
+    # * Related rows are read by id: a cascade may already have deleted them,
+    # * and then their own signal refreshes the sport
+    if isinstance(instance, models.League):
+        return {instance.kind_of_sport}
+    elif isinstance(instance, geo_models.Country):
+        leagues = models.League.objects.filter(country=instance.pk)
+        return set(leagues.values_list("kind_of_sport", flat=True).distinct())
+    elif isinstance(instance, models.Match):
+        leagues = models.League.objects.filter(pk=instance.league_id)
+        return set(leagues.values_list("kind_of_sport", flat=True))
+    elif isinstance(instance, bets_models.Odds):
+        matches = models.Match.objects.filter(pk=instance.fixture_id)
+    elif isinstance(instance, bets_models.OddsDetail):
+        matches = models.Match.objects.filter(odds=instance.odds_id)
+    else:
+        matches = models.Match.objects.filter(
+            django_models.Q(home_team=instance.pk) | django_models.Q(away_team=instance.pk)
+        )
+
+    return set(matches.values_list("league__kind_of_sport", flat=True).distinct())
+
+
+# * Odds and their details have no delete receiver: it would turn the cascade
+# * from a match into one query per row, the match refreshes its sport instead
+@utils_signals.multiple_sender_receiver(
+    signal=django_models.signals.post_save,
+    senders=[bets_models.Odds, bets_models.OddsDetail],
+)
+@utils_signals.multiple_sender_receiver(
+    signal=[django_models.signals.post_save, django_models.signals.post_delete],
+    senders=[models.League, models.Match, models.Team, geo_models.Country],
+)
+def invalidate_listings(
+    sender: typing.Any, instance: typing.Any, raw: bool = False, *args, **kwargs
+) -> None:
+    if raw or services_cache.is_invalidation_suppressed():  # loaddata or importer
+        return
+
+    # * Deleted teams and countries leave no trace of their sports, every sport
+    # * is refreshed then
+    if kwargs.get("signal") is django_models.signals.post_delete and sender in (
+        models.Team,
+        geo_models.Country,
+    ):
+        sports = {None}
+    else:
+        sports = kinds_of_sport(instance=instance)
+
+    for kind_of_sport in sports:
+        services_cache.on_commit_once(listing_refresher(kind_of_sport=kind_of_sport))
+
+
+TRANSLATED_MODELS = {
+    models.League,
+    models.Match,
+    models.Team,
+    bets_models.Odds,
+    bets_models.OddsDetail,
+    geo_models.Country,
+}
+
+
+@dispatch.receiver(utils_translate.translations_updated)
+def refresh_translated_listings(*args, **kwargs) -> None:
+    # * One rebuild per translation run: the listings were rendered before it finished
+    if TRANSLATED_MODELS.intersection(kwargs["models"]):
+        services_cache.on_commit_once(refresh_listings)
@@ -25,13 +25,13 @@ logger = logging.Logger(__file__)
 # endregion
 
 
-@dispatch.receiver(signal=django_models.signals.pre_save, sender=models.League)
-def translate_league(instance: typing.Any, raw: bool = True, *args, **kwargs) -> None:
+@dispatch.receiver(signal=django_models.signals.post_save, sender=models.League)
+def translate_league(instance: typing.Any, created: bool = False, raw: bool = True, *args, **kwargs) -> None:
     if raw:  # if data saves from loaddata
         return
     
     try:
-        instance = utils.translate.multiple_translations(instance=instance)
+        instance = utils.translate.multiple_translations(instance=instance, created=created)
     except:
         pass
 
@@ -40,11 +40,6 @@ def translate_league(instance: typing.Any, raw: bool = True, *args, **kwargs) ->
 def translate_match(instance: typing.Any, raw: bool = True, *args, **kwargs) -> None:
     if raw:  # if data saves from loaddata
         return
-    
-    try:
-        instance = utils.translate.multiple_translations(instance=instance)
-    except:
-        pass
 
     if instance and instance.pk:
         try:
@@ -84,12 +79,25 @@ def translate_match(instance: typing.Any, raw: bool = True, *args, **kwargs) ->
             pass
 
 
-@dispatch.receiver(signal=django_models.signals.pre_save, sender=models.Team)
-def translate_team(instance: typing.Any, raw: bool = True, *args, **kwargs) -> None:
+@dispatch.receiver(signal=django_models.signals.post_save, sender=models.Match)
+def schedule_match_translation(
+    instance: typing.Any, created: bool = False, raw: bool = True, *args, **kwargs
+) -> None:
+    if raw:  # if data saves from loaddata
+        return
+
+    try:
+        utils.translate.multiple_translations(instance=instance, created=created)
+    except:
+        pass
+
+
+@dispatch.receiver(signal=django_models.signals.post_save, sender=models.Team)
+def translate_team(instance: typing.Any, created: bool = False, raw: bool = True, *args, **kwargs) -> None:
     if raw:  # if data saves from loaddata
         return
     
     try:
-        instance = utils.translate.multiple_translations(instance=instance)
+        instance = utils.translate.multiple_translations(instance=instance, created=created)
     except:
         pass
@@ -1,12 +1,18 @@
 import datetime
 import logging
+import typing
 
 # region				-----External Imports-----
 import celery
+from celery import result as celery_result
+from django.conf import settings
 
 from football.models import League, Match, Team
 
 # region				-----Internal Imports-----
+from football.services import cache as services_cache
+from football.services import listing as services_listing
+from football.services import sportingnews as services_sportingnews
 from football.services.rapid import RapidClient
 from geo.models import Country
 
@@ -114,3 +120,43 @@ def start_import():
             imported += 1
 
     print(f"Imported {imported}, passed {passed}")
+
+
+@celery.shared_task(name="task_warm_league_list")
+def task_warm_league_list(kind_of_sport: int, language: str) -> None:
+    services_cache.warm_league_list(kind_of_sport=kind_of_sport, language=language)
+
+
+def warm_league_lists(kinds_of_sport: typing.Iterable[int]) -> celery_result.GroupResult:
+    # * Every sport and language is rendered by its own worker in parallel
+    return celery.group(
+        task_warm_league_list.si(kind, language)
+        for kind in kinds_of_sport
+        for language in settings.LANGUAGE_CODES
+    ).apply_async()
+
+
+@celery.shared_task(name="task_rebuild_league_listings")
+def task_rebuild_league_listings(kind_of_sport: int = None) -> None:
+    kinds_of_sport = (
+        [kind_of_sport] if kind_of_sport else services_listing.KINDS_OF_SPORT
+    )
+    for kind in kinds_of_sport:
+        rows = services_listing.rebuild_league_listing(kind_of_sport=kind)
+        logger.info(f"kind of sport {kind} listing rows {rows}")
+
+    warm_league_lists(kinds_of_sport=kinds_of_sport)
+
+
+@celery.shared_task(name="task_warm_league_lists")
+def task_warm_league_lists() -> None:
+    warm_league_lists(kinds_of_sport=services_listing.KINDS_OF_SPORT)
+
+
+@celery.shared_task(name="task_refresh_news")
+def task_refresh_news() -> None:
+    try:
+        articles = services_sportingnews.refresh_news()
+        logger.info(f"task_refresh_news: {len(articles)} articles")
+    finally:
+        services_cache.shared_cache().delete(services_cache.RSS_NEWS_REFRESHING_KEY)
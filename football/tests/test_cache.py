@@ -0,0 +1,186 @@
+import datetime
+from unittest import mock
+
+from django import utils
+from django.test import TestCase, override_settings
+
+from bets import models as bets_models
+from bets import tasks as bets_tasks
+from football import models as football_models
+from football import tasks as football_tasks
+from football.services import cache as services_cache
+from football.services import prefetch as services_prefetch
+from utils import translate as utils_translate
+from utils.first_party import testing as utils_testing
+
+
+@override_settings(CACHES=utils_testing.LOCMEM_CACHES)
+class LeagueListCacheTests(TestCase):
+    def key(self, kind_of_sport: int = 1) -> str:
+        return services_cache.league_list_key(
+            kind_of_sport=kind_of_sport, page=1, page_size=10, language="en-us"
+        )
+
+    def test_invalidate_leagues_per_sport(self):
+        football, basketball = self.key(1), self.key(3)
+
+        services_cache.invalidate_leagues(kind_of_sport=1)
+
+        self.assertNotEqual(self.key(1), football)
+        self.assertEqual(self.key(3), basketball)
+
+    # * The post-commit translation of the new rows is covered in integrations
+    @mock.patch.object(utils_translate, "schedule_translation")
+    @mock.patch.object(football_tasks.task_rebuild_league_listings, "delay")
+    def test_league_change_invalidates_on_commit(self, rebuild, schedule_translation):
+        key = self.key()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            football_models.League.objects.create(kind_of_sport=1, api_id=1, title="A")
+            football_models.League.objects.create(kind_of_sport=1, api_id=2, title="B")
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertNotEqual(self.key(), key)
+        rebuild.assert_called_once_with(kind_of_sport=1)
+
+    # * The post-commit translation of the new rows is covered in integrations
+    @mock.patch.object(utils_translate, "schedule_translation")
+    @mock.patch.object(football_tasks.task_rebuild_league_listings, "delay")
+    def test_change_refreshes_only_its_sport(self, rebuild, schedule_translation):
+        with services_cache.invalidation_suppressed():
+            league = football_models.League.objects.create(kind_of_sport=3, api_id=1, title="A")
+            home = football_models.Team.objects.create(title="Home")
+        football, basketball = self.key(1), self.key(3)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            match = football_models.Match.objects.create(
+                league=league, home_team=home, date=utils.timezone.now()
+            )
+            bets_models.Odds.objects.create(fixture=match, name="Match Winner")
+            home.save()
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.key(1), football)
+        self.assertNotEqual(self.key(3), basketball)
+        rebuild.assert_called_once_with(kind_of_sport=3)
+
+    # * The post-commit translation of the new rows is covered in integrations
+    @mock.patch.object(utils_translate, "schedule_translation")
+    @mock.patch.object(football_tasks.task_rebuild_league_listings, "delay")
+    def test_suppressed_invalidation_skips_refresh(self, rebuild, schedule_translation):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with services_cache.invalidation_suppressed():
+                football_models.League.objects.create(kind_of_sport=1, api_id=1, title="A")
+
+        self.assertEqual(callbacks, [])
+
+    def test_warm_league_list_stores_rendered_pages(self):
+        services_cache.warm_league_list(kind_of_sport=1, language="es")
+
+        cache = services_cache.shared_cache()
+        for page_size in ("10", services_cache.LEAGUES_FULL_PAGE_SIZE):
+            key = services_cache.league_list_key(
+                kind_of_sport="1", page="1", page_size=page_size, language="es"
+            )
+            self.assertEqual(cache.get(key)["status"], 200)
+        self.assertIsNone(cache.get(self.key()))
+
+
+    # * The post-commit translation of the new rows is covered in integrations
+    @mock.patch.object(utils_translate, "schedule_translation")
+    @mock.patch.object(football_tasks.task_rebuild_league_listings, "delay")
+    def test_clean_matches_refreshes_once_without_per_row_queries(
+        self, rebuild, schedule_translation
+    ):
+        with services_cache.invalidation_suppressed():
+            league = football_models.League.objects.create(kind_of_sport=3, api_id=1, title="A")
+            team = football_models.Team.objects.create(title="Team")
+            for _ in range(3):
+                match = football_models.Match.objects.create(
+                    league=league,
+                    home_team=team,
+                    date=utils.timezone.now() - datetime.timedelta(days=5),
+                )
+                for name in ("Match Winner", "Over/Under"):
+                    odds = bets_models.Odds.objects.create(fixture=match, name=name)
+                    bets_models.OddsDetail.objects.create(odds=odds, name="Home", value=1)
+
+        # * The cascade stays a fixed number of queries whatever the number of rows
+        with self.assertNumQueries(8):
+            bets_tasks.clean_matches()
+
+        self.assertFalse(bets_models.OddsDetail.objects.exists())
+        rebuild.assert_called_once_with(kind_of_sport=3)
+
+
+@override_settings(CACHES=utils_testing.LOCMEM_CACHES)
+class SportsAmountCacheTests(TestCase):
+    def setUp(self):
+        self.team = football_models.Team.objects.create(title="Team")
+
+    def odds(self, kind_of_sport: int, minutes: int) -> bets_models.Odds:
+        league = football_models.League.objects.create(
+            kind_of_sport=kind_of_sport, api_id=kind_of_sport, title="League"
+        )
+        match = football_models.Match.objects.create(
+            league=league,
+            home_team=self.team,
+            date=utils.timezone.now() + datetime.timedelta(minutes=minutes),
+        )
+        return bets_models.Odds.objects.create(fixture=match, name="Match Winner")
+
+    def test_count_fixtures_is_cached_until_a_sport_expires(self):
+        self.odds(kind_of_sport=3, minutes=122)
+        self.odds(kind_of_sport=1, minutes=24 * 60)
+        self.odds(kind_of_sport=2, minutes=60)
+
+        with mock.patch.object(services_cache.shared_cache(), "set") as cache_set:
+            sports = services_prefetch.count_fixtures()
+
+        self.assertEqual(sports, [1, 3])
+        # * Basketball leaves the menu in two minutes, so does the entry
+        self.assertLessEqual(cache_set.call_args.kwargs["timeout"], 2 * 60)
+
+    def test_pages_read_the_cached_sports(self):
+        services_prefetch.count_fixtures()
+        self.odds(kind_of_sport=1, minutes=5 * 60)
+
+        with self.assertNumQueries(0):
+            sports = services_prefetch.PrefetchView()._count_fixtures(
+                queryset=bets_models.Odds.objects
+            )
+
+        self.assertEqual(sports, [])
+
+
+@override_settings(CACHES=utils_testing.LOCMEM_CACHES)
+class BestFixtureTests(TestCase):
+    def setUp(self):
+        self.team = football_models.Team.objects.create(title="Team")
+
+    def match(self, title: str, hours: int) -> football_models.Match:
+        league = football_models.League.objects.create(kind_of_sport=1, title=title)
+        match = football_models.Match.objects.create(
+            league=league,
+            home_team=self.team,
+            date=utils.timezone.now() + datetime.timedelta(hours=hours),
+        )
+        bets_models.Odds.objects.create(fixture=match, name="Match Winner")
+        return match
+
+    def test_preferred_league_wins_over_kickoff(self):
+        self.match(title="Other league", hours=3)
+        featured = self.match(title="Premier league", hours=30)
+
+        self.assertEqual(services_prefetch.select_best_fixture(kind_of_sport=1), featured.pk)
+
+    def test_best_fixture_is_a_primary_key_lookup(self):
+        featured = self.match(title="Premier league", hours=5)
+        services_prefetch.select_best_fixture(kind_of_sport=1)
+
+        with self.assertNumQueries(3):
+            fixture = services_prefetch.PrefetchView()._prefetch_best_fixture(
+                queryset=football_models.Match.objects, kind_of_sport="1"
+            )
+
+        self.assertEqual(fixture, featured)
@@ -0,0 +1,112 @@
+import datetime
+import json
+from unittest import mock
+
+from django import urls, utils
+from django.test import TestCase, override_settings
+from rest_framework import test as rest_test
+
+from football import models as football_models
+from football.services import cache as services_cache
+from football.services import listing as services_listing
+from utils.first_party import testing as utils_testing
+from utils.third_party.api.rest_framework import paginators as utils_paginators
+
+
+class LeagueListingTests(TestCase):
+    def setUp(self):
+        self.league = football_models.League.objects.create(
+            kind_of_sport=1, api_id=1, title="League"
+        )
+        self.now = utils.timezone.now()
+
+    def listing(self, *hours: int) -> football_models.LeagueListing:
+        dates = [self.now + datetime.timedelta(hours=hour) for hour in hours]
+        return football_models.LeagueListing.objects.create(
+            league=self.league,
+            kind_of_sport=1,
+            language="en-us",
+            position=0,
+            last_match_date=max(dates),
+            data={
+                "id": self.league.pk,
+                "matches": [{"id": index, "date": date.isoformat()} for index, date in enumerate(dates)],
+            },
+        )
+
+    def test_league_listing_skips_leagues_without_upcoming_matches(self):
+        self.listing(1)
+        upcoming = self.listing(1, 5)
+
+        self.assertEqual(list(services_listing.league_listing(kind_of_sport=1)), [upcoming])
+
+    def test_read_leagues_drops_started_matches(self):
+        (league,) = services_listing.read_leagues(
+            listings=[self.listing(1, 5)], parse_dates=True
+        )
+
+        self.assertEqual([match["id"] for match in league["matches"]], [1])
+        self.assertIsInstance(league["matches"][0]["date"], datetime.datetime)
+
+
+@override_settings(CACHES=utils_testing.LOCMEM_CACHES)
+class LeagueListApiTests(TestCase):
+    def setUp(self):
+        date = utils.timezone.now() + datetime.timedelta(hours=5)
+        for position in range(3):
+            league = football_models.League.objects.create(
+                kind_of_sport=1, api_id=position, title=f"League {position}"
+            )
+            football_models.LeagueListing.objects.create(
+                league=league,
+                kind_of_sport=1,
+                language="en-us",
+                position=position,
+                last_match_date=date,
+                data={"id": league.pk, "matches": [{"id": position, "date": date.isoformat()}]},
+            )
+        self.client = rest_test.APIClient()
+        self.url = urls.reverse("frontend-league-list")
+
+    def test_keyset_pages_skip_the_count(self):
+        params = {"kind_of_sport": 1, "pagination": "keyset", "page_size": 2}
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url, params).json()
+        second = self.client.get(first["links"]["next"]).json()
+
+        self.assertIsNone(first["count"])
+        self.assertEqual(
+            [league["matches"][0]["id"] for league in first["results"] + second["results"]],
+            [0, 1, 2],
+        )
+        self.assertIsNone(second["links"]["next"])
+
+    def test_page_numbered_list_is_bounded(self):
+        with mock.patch.multiple(
+            utils_paginators.StandartPagePaginator, page_size=1, max_page_size=2
+        ):
+            default = self.client.get(self.url, {"kind_of_sport": 1}).json()
+            large = self.client.get(self.url, {"kind_of_sport": 1, "page_size": 3}).json()
+
+        self.assertEqual((default["count"], len(default["results"])), (3, 1))
+        self.assertEqual(len(large["results"]), 2)
+
+    def test_unchanged_listing_answers_not_modified(self):
+        params = {"kind_of_sport": 1}
+        response = self.client.get(self.url, params)
+        self.assertIn("public", response["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.url, params, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+        services_cache.invalidate_leagues(kind_of_sport=1)
+        changed = self.client.get(self.url, params, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(changed.status_code, 200)
+
+    def test_stream_sends_one_league_per_line(self):
+        response = self.client.get(self.url, {"kind_of_sport": 1, "stream": 1})
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([json.loads(line)["matches"][0]["id"] for line in lines], [0, 1, 2])
@@ -0,0 +1,42 @@
+import datetime
+from unittest import mock
+
+from django import utils
+from django.test import TestCase
+
+from football import models as football_models
+
+
+class MatchQuerySetTests(TestCase):
+    def setUp(self):
+        self.league = football_models.League.objects.create(
+            kind_of_sport=1, api_id=1, title="League"
+        )
+        self.team = football_models.Team.objects.create(title="Team")
+        self.now = datetime.datetime(2024, 3, 1, 20, tzinfo=datetime.timezone.utc)
+
+    def match(self, hours: int) -> football_models.Match:
+        return football_models.Match.objects.create(
+            league=self.league,
+            home_team=self.team,
+            date=self.now + datetime.timedelta(hours=hours),
+        )
+
+    def test_upcoming_keeps_next_day_matches(self):
+        self.match(1)
+        upcoming = [self.match(3), self.match(7)]
+
+        with mock.patch.object(utils.timezone, "now", return_value=self.now):
+            matches = list(football_models.Match.objects.upcoming().order_by("date"))
+
+        # * 03:00 the next day was dropped by the former date__hour__gte filter
+        self.assertEqual(matches, upcoming)
+
+    def test_on_day_uses_current_timezone(self):
+        late = self.match(0)
+        self.match(5)
+
+        with utils.timezone.override(datetime.timezone.utc):
+            matches = list(football_models.Match.objects.on_day(self.now.date()))
+
+        self.assertEqual(matches, [late])
@@ -0,0 +1,53 @@
+import datetime
+from unittest import mock
+
+from django import urls, utils
+from django.test import TestCase, override_settings
+from rest_framework import test as rest_test
+
+from football import models as football_models
+from football.api.frontend.views import views as frontend_views
+from utils.first_party import queries as utils_queries
+from utils.first_party import testing as utils_testing
+
+
+@override_settings(
+    CACHES=utils_testing.LOCMEM_CACHES,
+    QUERY_BUDGET_ENABLED=True,
+    QUERY_BUDGET_RAISE=True,
+)
+class QueryBudgetTests(utils_queries.QueryBudgetTestMixin, TestCase):
+    def setUp(self):
+        self.client = rest_test.APIClient()
+        self.url = urls.reverse("frontend-league-list")
+        self.params = {"kind_of_sport": 1, "cache": True}
+
+    def test_league_list_reports_server_timing(self):
+        response = self.client.get(self.url, self.params)
+
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="\d queries"')
+
+    def test_view_over_budget_fails(self):
+        # * The 500 is captured here instead of going to the errors.log handler
+        with mock.patch.object(frontend_views.LeagueViewSet, "query_budget", 0):
+            with self.assertLogs("django.request", "ERROR") as logs:
+                with self.assertRaises(utils_queries.QueryBudgetExceeded):
+                    self.client.get(self.url, self.params)
+
+        self.assertIn("QueryBudgetExceeded", logs.output[0])
+
+    def test_duplicated_queries_are_fingerprinted(self):
+        league = football_models.League.objects.create(kind_of_sport=1, title="League")
+        team = football_models.Team.objects.create(title="Team")
+        for hours in range(3):
+            football_models.Match.objects.create(
+                league=league,
+                home_team=team,
+                date=utils.timezone.now() + datetime.timedelta(hours=hours),
+            )
+
+        with self.assertQueryBudget(4) as stats:
+            for match in football_models.Match.objects.all():
+                match.home_team.title
+
+        self.assertEqual(list(stats.duplicates.values()), [3])
@@ -0,0 +1,67 @@
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from football import tasks as football_tasks
+from football.services import cache as services_cache
+from football.services import sportingnews as services_sportingnews
+from football.services.exceptions import SportingNewsException
+from utils.first_party import testing as utils_testing
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss xmlns:media="http://search.yahoo.com/mrss/" version="2.0">
+  <channel>
+    <item>
+      <title>Derby day</title>
+      <link>https://www.sportingnews.com/us/derby</link>
+      <pubDate>Wed, 01 Jun 2022 23:30:00 +0000</pubDate>
+      <media:content url="https://example.com/1.jpg" />
+      <media:content url="https://example.com/2.jpg" />
+    </item>
+    <item>
+      <title>No picture</title>
+      <link>https://www.sportingnews.com/us/plain</link>
+    </item>
+  </channel>
+</rss>"""
+
+
+@override_settings(CACHES=utils_testing.LOCMEM_CACHES)
+class SportingNewsTests(SimpleTestCase):
+    def tearDown(self):
+        services_cache.shared_cache().clear()
+
+    @mock.patch.object(services_sportingnews.requests, "get")
+    def test_pages_read_the_refreshed_feed(self, get):
+        get.return_value = mock.Mock(content=RSS)
+        services_sportingnews.refresh_news()
+
+        articles = services_sportingnews.read_news()
+
+        get.assert_called_once()
+        self.assertEqual(
+            [(article["title"], article["image"]) for article in articles],
+            [("Derby day", "https://example.com/1.jpg"), ("No picture", None)],
+        )
+        self.assertEqual(articles[0]["date"].year, 2022)
+
+    @mock.patch.object(services_sportingnews.requests, "get")
+    def test_failed_refresh_keeps_the_last_articles(self, get):
+        get.return_value = mock.Mock(content=RSS)
+        services_sportingnews.refresh_news()
+
+        get.side_effect = requests.exceptions.Timeout
+        with self.assertRaises(SportingNewsException):
+            services_sportingnews.refresh_news()
+
+        self.assertEqual(len(services_sportingnews.read_news()), 2)
+
+    @mock.patch.object(football_tasks.task_refresh_news, "delay")
+    @mock.patch.object(services_sportingnews.requests, "get")
+    def test_cold_cache_renders_without_waiting(self, get, delay):
+        self.assertEqual(services_sportingnews.read_news(), [])
+        self.assertEqual(services_sportingnews.read_news(), [])
+
+        get.assert_not_called()
+        delay.assert_called_once_with()
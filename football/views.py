@@ -13,6 +13,7 @@ from bets import models as bets_models
 from . import models as football_models
 
 # region				-----Internal Imports-----
+from .services import listing as services_listing
 from .services import prefetch as services_prefetch
 
 # endregion
@@ -27,9 +28,7 @@ class FootballIndexView(services_prefetch.SportIndexView):
     template_name = "pages/football/index.html"
 
     def get(self, request, *args, **kwargs):
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=1
-        )
+        leagues = services_listing.league_listing(kind_of_sport=1)
         best_fixture = self._prefetch_best_fixture(
             queryset=football_models.Match.objects, kind_of_sport=1
         )
@@ -45,9 +44,7 @@ class BaseballIndexView(services_prefetch.SportIndexView):
     template_name = "pages/football/index.html"
 
     def get(self, request, *args, **kwargs):
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=2
-        )
+        leagues = services_listing.league_listing(kind_of_sport=2)
 
         best_fixture = self._prefetch_best_fixture(
             queryset=football_models.Match.objects, kind_of_sport=2
@@ -64,9 +61,7 @@ class BasketballIndexView(services_prefetch.SportIndexView):
     template_name = "pages/football/index.html"
 
     def get(self, request, *args, **kwargs):
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=3
-        )
+        leagues = services_listing.league_listing(kind_of_sport=3)
 
         best_fixture = self._prefetch_best_fixture(
             queryset=football_models.Match.objects, kind_of_sport=3
@@ -86,9 +81,7 @@ class Formula1IndexView(services_prefetch.SportIndexView):
     template_name = "pages/formula_1/index.html"
 
     def get(self, request, *args, **kwargs):
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=4
-        )
+        leagues = services_listing.league_listing(kind_of_sport=4)
 
         best_fixture = self._prefetch_best_fixture(
             queryset=football_models.Match.objects, kind_of_sport=4
@@ -108,9 +101,7 @@ class HandballIndexView(services_prefetch.SportIndexView):
     template_name = "pages/football/index.html"
 
     def get(self, request, *args, **kwargs):
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=5
-        )
+        leagues = services_listing.league_listing(kind_of_sport=5)
 
         best_fixture = self._prefetch_best_fixture(
             queryset=football_models.Match.objects, kind_of_sport=5
@@ -127,9 +118,7 @@ class HockeyIndexView(services_prefetch.SportIndexView):
     template_name = "pages/football/index.html"
 
     def get(self, request, *args, **kwargs):
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=6
-        )
+        leagues = services_listing.league_listing(kind_of_sport=6)
 
         best_fixture = self._prefetch_best_fixture(
             queryset=football_models.Match.objects, kind_of_sport=6
@@ -146,9 +135,7 @@ class RugbyIndexView(services_prefetch.SportIndexView):
     template_name = "pages/football/index.html"
 
     def get(self, request, *args, **kwargs):
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=7
-        )
+        leagues = services_listing.league_listing(kind_of_sport=7)
 
         best_fixture = self._prefetch_best_fixture(
             queryset=football_models.Match.objects, kind_of_sport=7
@@ -165,9 +152,7 @@ class VolleyballIndexView(services_prefetch.SportIndexView):
     template_name = "pages/football/index.html"
 
     def get(self, request, *args, **kwargs):
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=8
-        )
+        leagues = services_listing.league_listing(kind_of_sport=8)
 
         best_fixture = self._prefetch_best_fixture(
             queryset=football_models.Match.objects, kind_of_sport=8
@@ -189,9 +174,7 @@ class LazyLoadView(services_prefetch.PrefetchView, views.View):
     def get(self, request, *args, **kwargs):
         kind_of_sport = request.GET.get("kind_of_sport")
         page = request.GET.get("page", 1)
-        leagues = self._prefetch_leagues(
-            queryset=football_models.League.objects, kind_of_sport=kind_of_sport
-        )
+        leagues = services_listing.league_listing(kind_of_sport=kind_of_sport)
         paginator = django_paginator.Paginator(object_list=leagues, per_page=4)
 
         try:
@@ -199,6 +182,10 @@ class LazyLoadView(services_prefetch.PrefetchView, views.View):
         except django_paginator.EmptyPage:
             return JsonResponse(data={"detail": "Not Found"}, status=404)
 
+        paginated_leagues.object_list = services_listing.read_leagues(
+            listings=paginated_leagues.object_list, parse_dates=True
+        )
+
         leagues_html = loader.render_to_string(
             context={"leagues": paginated_leagues}, template_name=self.template_name
         )
@@ -22,12 +22,12 @@ logger = logging.Logger(__file__)
 # endregion
 
 
-@dispatch.receiver(signal=django_models.signals.pre_save, sender=models.Country)
-def translate_country(instance: typing.Any, raw: bool = True, *args, **kwargs) -> None:
+@dispatch.receiver(signal=django_models.signals.post_save, sender=models.Country)
+def translate_country(instance: typing.Any, created: bool = False, raw: bool = True, *args, **kwargs) -> None:
     if raw:  # if data saves from loaddata
         return
     
     try:
-        instance = utils.translate.multiple_translations(instance=instance)
+        instance = utils.translate.multiple_translations(instance=instance, created=created)
     except:
         pass
@@ -0,0 +1,8 @@
+# region				-----External Imports-----
+from django.apps import AppConfig
+
+# endregion
+
+
+class IntegrationsConfig(AppConfig):
+    name = "integrations"
@@ -1,4 +1,4 @@
 # region				-----Internal Imports-----
-from . import translate
+from . import backends, exceptions, translate
 
 # endregion
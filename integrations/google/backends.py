@@ -0,0 +1,107 @@
+import logging
+import threading
+import time
+import typing
+
+from django import dispatch
+from django.conf import settings as django_settings
+from django.core import signals as core_signals
+from django.utils import module_loading
+
+# region				-----External Imports-----
+from website.settings.django import google_cloud_client
+
+# endregion
+
+logger = logging.Logger(__file__)
+
+
+class TranslationBackend(object):
+    # * Translates one request worth of texts, the caller keeps within the limits
+    def translate(self, texts: typing.List[str], to_language: str) -> typing.List[str]:
+        raise NotImplementedError
+
+    @property
+    def available(self) -> bool:
+        return True
+
+
+class GoogleBackend(TranslationBackend):
+    # region		     -----Public Methods-----
+    def translate(self, texts: typing.List[str], to_language: str) -> typing.List[str]:
+        response = google_cloud_client.translate_text(
+            target_language_code=to_language,
+            contents=texts,
+            mime_type="text/html",
+            parent=self.__parent,
+            timeout=120,
+        )
+        return [value.translated_text for value in response.translations]
+
+    @property
+    def available(self) -> bool:
+        return google_cloud_client is not None
+
+    # endregion
+
+    # region		     -----Private Method-----
+    def __init__(self, **options) -> None:
+        project_id = django_settings.GOOGLE_CLOUD_TRANSLATE_PROJECT_ID
+        location = django_settings.GOOGLE_CLOUD_TRANSLATE_LOCATION
+        self.__parent = f"projects/{project_id}/locations/{location}"
+
+    # endregion
+
+
+class LocalBackend(TranslationBackend):
+    # * Deterministic stand-in for development and benchmarks: known texts come
+    # * from the dictionary, the rest is pseudo-localized as "[es] text"
+
+    # region		     -----Public Methods-----
+    def translate(self, texts: typing.List[str], to_language: str) -> typing.List[str]:
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self.__lock:
+            self.requests += 1
+            self.texts += len(texts)
+
+        dictionary = self.dictionary.get(to_language, {})
+        return [dictionary.get(text) or f"[{to_language}] {text}" for text in texts]
+
+    # endregion
+
+    # region		     -----Private Method-----
+    def __init__(
+        self,
+        latency: float = 0.0,
+        dictionary: typing.Dict[str, typing.Dict[str, str]] or None = None,
+        **options,
+    ) -> None:
+        # * Seconds slept per request, to model the round trip to the API
+        self.latency = latency
+        self.dictionary = dictionary or {}
+
+        self.requests = 0
+        self.texts = 0
+        self.__lock = threading.Lock()
+
+    # endregion
+
+
+_backends = {}
+
+
+def get_backend() -> TranslationBackend:
+    # * One instance per configured class, so the local counters add up
+    path = django_settings.TRANSLATION_BACKEND
+    if path not in _backends:
+        backend_class = module_loading.import_string(path)
+        _backends[path] = backend_class(**django_settings.TRANSLATION_BACKEND_OPTIONS)
+    return _backends[path]
+
+
+@dispatch.receiver(core_signals.setting_changed)
+def reset_backend(setting: str, *args, **kwargs) -> None:
+    if setting.startswith("TRANSLATION_BACKEND"):
+        _backends.clear()
@@ -0,0 +1,9 @@
+import typing
+
+
+class TranslationUnavailable(Exception):
+    # * The backend failed or is not configured, as opposed to answering without
+    # * a translation; what did come back is kept in translations
+    def __init__(self, message: str, translations: typing.Dict[str, str] = None) -> None:
+        super().__init__(message)
+        self.translations = translations or {}
@@ -1,76 +1,65 @@
 import logging
+import typing
+from concurrent import futures
 
-import modeltranslation
-from django.conf import settings as django_settings
-from django.db import models as django_models
-
-# region				-----External Imports-----
-from website.settings.django import google_cloud_client
+# region				-----Internal Imports-----
+from . import backends as google_backends
+from . import exceptions as google_exceptions
 
 # endregion
 
 logger = logging.Logger(__file__)
 
+# * Limits of one translate_text request: contents and total code points
+TRANSLATE_CHUNK_SIZE = 1024
+TRANSLATE_CHUNK_CHARS = 30000
+TRANSLATE_WORKERS = 4
 
-class ModelTranslator(object):
-    # region		     -----Public Methods-----
-    def translate(self, instance: django_models.Model) -> django_models.Model:
-        # Check if Google Cloud Translation is available
-        if google_cloud_client is None:
-            logger.warning("Google Cloud Translation client not available - skipping translation")
-            return instance
-
-        project_id = django_settings.GOOGLE_CLOUD_TRANSLATE_PROJECT_ID
-        location = django_settings.GOOGLE_CLOUD_TRANSLATE_LOCATION
-
-        parent = f"projects/{project_id}/locations/{location}"
-
-        field_values = {}
-
-        for field in self.__translatable_fields:
-            value = getattr(instance, field, None)
-            if value:
-                field_values[field] = value
-
-        field_values = {key: str(value) for key, value in field_values.items() if value}
 
-        if field_values:
-            response = google_cloud_client.translate_text(
-                target_language_code=self.__language,
-                contents=field_values.values(),
-                mime_type="text/html",
-                parent=parent,
-                timeout=120,
-            )
-            logger.info(f"ModelTranslator: {response}")
+def _chunks(texts: typing.List[str]) -> typing.Iterator[typing.List[str]]:
+    chunk, size = [], 0
+    for text in texts:
+        if chunk and (
+            len(chunk) >= TRANSLATE_CHUNK_SIZE or size + len(text) > TRANSLATE_CHUNK_CHARS
+        ):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(text)
+        size += len(text)
 
-            iterate_over = zip(response.translations, field_values.keys())
+    if chunk:
+        yield chunk
 
-            for value, field in iterate_over:
-                field = f"{field}_{self.__language}"
-                value = value.translated_text
-                setattr(instance, field, value)
 
-        return instance
-
-    # endregion
-
-    # region		     -----Private Method-----
-    def __init__(self, model: django_models.Model, to_language: str) -> None:
-        self.__translatable_fields = (
-            modeltranslation.manager.get_translatable_fields_for_model(model.__class__)
+def translate_texts(texts: typing.List[str], to_language: str) -> typing.Dict[str, str]:
+    backend = google_backends.get_backend()
+    if not backend.available:
+        raise google_exceptions.TranslationUnavailable(
+            "Google Cloud Translation client not available"
         )
 
-        self.__language = to_language
-        self.__model = model
-
-    # endregion
-
-
-def translate(instance: django_models.Model, to_language: str) -> django_models.Model:
-    try:
-        translator = ModelTranslator(to_language=to_language, model=instance)
-        logger.info(f"translate: {translator}")
-        return translator.translate(instance=instance)
-    except:
-        pass
+    def translate_chunk(
+        chunk: typing.List[str],
+    ) -> typing.Tuple[typing.Dict[str, str], Exception or None]:
+        try:
+            return dict(zip(chunk, backend.translate(texts=chunk, to_language=to_language))), None
+        except Exception as ex:
+            logger.error(f"translate_texts: {ex}")
+            return {}, ex
+
+    # * Requests only wait on the network, so the chunks are sent side by side
+    translations, errors = {}, []
+    with futures.ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS) as executor:
+        for chunk_translations, error in executor.map(
+            translate_chunk, _chunks(list(dict.fromkeys(texts)))
+        ):
+            translations.update(chunk_translations)
+            if error is not None:
+                errors.append(error)
+
+    # * A failed request is not an answer: its texts are asked again next run
+    if errors:
+        raise google_exceptions.TranslationUnavailable(
+            f"{len(errors)} translate requests failed: {errors[0]}", translations=translations
+        )
+    return translations
@@ -0,0 +1,89 @@
+# region				-----External Imports-----
+import hashlib
+import logging
+import typing
+
+from django.core import cache as django_cache
+
+# endregion
+
+# region				-----Internal Imports-----
+from . import google
+from . import models as integrations_models
+
+# endregion
+
+# region			  -----Supporting Variables-----
+logger = logging.Logger(__file__)
+
+CACHE_ALIAS = "shared"
+MEMORY_TIMEOUT = 30 * 24 * 60 * 60
+BULK_BATCH_SIZE = 500
+# endregion
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _key(source_hash: str, language: str) -> str:
+    return f"translation:{language}:{source_hash}"
+
+
+def translate_texts(
+    texts: typing.Iterable[str], to_language: str
+) -> typing.Dict[str, str]:
+    # * Redis first, then the table; only what neither knows goes to Google
+    hashes = {text: _hash(text) for text in dict.fromkeys(texts) if text}
+    cache = django_cache.caches[CACHE_ALIAS]
+
+    keys = {_key(source_hash, to_language): text for text, source_hash in hashes.items()}
+    translations = {keys[key]: value for key, value in cache.get_many(keys).items()}
+
+    missing = {text: hashes[text] for text in hashes if text not in translations}
+    remembered = {}
+    if missing:
+        rows = dict(
+            integrations_models.TranslationMemory.objects.filter(
+                language=to_language, source_hash__in=missing.values()
+            ).values_list("source_hash", "translation")
+        )
+        remembered = {
+            text: rows[source_hash]
+            for text, source_hash in missing.items()
+            if source_hash in rows
+        }
+
+    fetched, unavailable = {}, None
+    missing = [text for text in missing if text not in remembered]
+    if missing:
+        try:
+            fetched = google.translate.translate_texts(texts=missing, to_language=to_language)
+        except google.exceptions.TranslationUnavailable as ex:
+            # * What the successful requests returned is remembered before failing
+            fetched, unavailable = ex.translations, ex
+        integrations_models.TranslationMemory.objects.bulk_create(
+            [
+                integrations_models.TranslationMemory(
+                    source_hash=hashes[text],
+                    source=text,
+                    language=to_language,
+                    translation=translation,
+                )
+                for text, translation in fetched.items()
+            ],
+            batch_size=BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        logger.info(f"translation memory {to_language}: {len(fetched)} of {len(missing)} new")
+
+    learned = {**remembered, **fetched}
+    if learned:
+        cache.set_many(
+            {_key(hashes[text], to_language): value for text, value in learned.items()},
+            timeout=MEMORY_TIMEOUT,
+        )
+
+    if unavailable is not None:
+        raise unavailable
+    return {**translations, **learned}
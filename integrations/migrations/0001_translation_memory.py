@@ -0,0 +1,30 @@
+# Generated by Django 3.2.7 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationMemory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_hash', models.CharField(max_length=40, verbose_name='Source hash')),
+                ('source', models.TextField(verbose_name='Source text')),
+                ('language', models.CharField(max_length=10, verbose_name='Target language')),
+                ('translation', models.TextField(verbose_name='Translation')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+            ],
+            options={
+                'verbose_name': 'Translation',
+                'verbose_name_plural': 'Translation memory',
+                'unique_together': {('source_hash', 'language')},
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.7 on 2026-10-18 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0001_translation_memory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(max_length=100, unique=True, verbose_name='Model')),
+                ('last_pk', models.BigIntegerField(default=0, verbose_name='Last primary key')),
+                ('failed', models.JSONField(default=list, verbose_name='Failed primary keys')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+            ],
+            options={
+                'verbose_name': 'Translation checkpoint',
+                'verbose_name_plural': 'Translation checkpoints',
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+# region				-----External Imports-----
+from django.db import models as django_models
+
+# endregion
+
+
+class TranslationMemory(django_models.Model):
+    # region           -----Information-----
+    # * sha1 of the source, long texts can't be indexed as they are
+    source_hash = django_models.CharField(
+        verbose_name="Source hash", max_length=40, blank=False, null=False
+    )
+
+    source = django_models.TextField(verbose_name="Source text", blank=False, null=False)
+
+    language = django_models.CharField(
+        verbose_name="Target language", max_length=10, blank=False, null=False
+    )
+
+    translation = django_models.TextField(
+        verbose_name="Translation", blank=False, null=False
+    )
+
+    created_at = django_models.DateTimeField(verbose_name="Created at", auto_now_add=True)
+    # endregion
+
+    # region              -----Metas-----
+    class Meta(object):
+        unique_together = ("source_hash", "language")
+        verbose_name_plural = "Translation memory"
+        verbose_name = "Translation"
+
+    # endregion
+
+    # region         -----Default Methods-----
+    def __str__(self) -> str:
+        return f"{self.language}: {self.source[:50]}"
+
+    # endregion
+
+
+class TranslationCheckpoint(django_models.Model):
+    # region           -----Information-----
+    label = django_models.CharField(
+        verbose_name="Model", max_length=100, unique=True, blank=False, null=False
+    )
+
+    # * Rows up to this primary key went through the batch translation
+    last_pk = django_models.BigIntegerField(verbose_name="Last primary key", default=0)
+
+    # * Rows the API returned nothing for, they are not requested again
+    failed = django_models.JSONField(verbose_name="Failed primary keys", default=list)
+
+    updated_at = django_models.DateTimeField(verbose_name="Updated at", auto_now=True)
+    # endregion
+
+    # region              -----Metas-----
+    class Meta(object):
+        verbose_name_plural = "Translation checkpoints"
+        verbose_name = "Translation checkpoint"
+
+    # endregion
+
+    # region         -----Default Methods-----
+    def __str__(self) -> str:
+        return f"{self.label}: {self.last_pk}"
+
+    # endregion
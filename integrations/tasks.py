@@ -0,0 +1,11 @@
+# region				-----External Imports-----
+import celery
+
+from utils import translate as utils_translate
+
+# endregion
+
+
+@celery.shared_task(name="task_translate_new_rows")
+def task_translate_new_rows() -> int:
+    return utils_translate.translate_pending()
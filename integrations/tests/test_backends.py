@@ -0,0 +1,34 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from integrations.google import backends as google_backends
+from integrations.google import translate as google_translate
+
+
+@override_settings(
+    TRANSLATION_BACKEND="integrations.google.backends.LocalBackend",
+    TRANSLATION_BACKEND_OPTIONS={"dictionary": {"es": {"Home": "Local"}}},
+)
+class LocalBackendTests(SimpleTestCase):
+    def setUp(self):
+        self.backend = google_backends.get_backend()
+        self.backend.requests = self.backend.texts = 0
+
+    def test_translations_are_deterministic(self):
+        translations = google_translate.translate_texts(
+            texts=["Home", "Away", "Home"], to_language="es"
+        )
+
+        self.assertIsInstance(self.backend, google_backends.LocalBackend)
+        self.assertEqual(translations, {"Home": "Local", "Away": "[es] Away"})
+        self.assertEqual((self.backend.requests, self.backend.texts), (1, 2))
+
+    @mock.patch.object(google_translate, "TRANSLATE_CHUNK_SIZE", 2)
+    def test_chunks_are_separate_requests(self):
+        texts = [f"Team {index}" for index in range(5)]
+
+        translations = google_translate.translate_texts(texts=texts, to_language="fr")
+
+        self.assertEqual(len(translations), 5)
+        self.assertEqual(self.backend.requests, 3)
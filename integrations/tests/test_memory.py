@@ -0,0 +1,42 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from integrations import memory as translation_memory
+from integrations import models as integrations_models
+from utils.first_party import testing as utils_testing
+
+
+@override_settings(CACHES=utils_testing.LOCMEM_CACHES)
+@mock.patch.object(translation_memory.google.translate, "translate_texts")
+class TranslationMemoryTests(TestCase):
+    def test_only_misses_reach_google(self, translate_texts):
+        translate_texts.return_value = {"Away": "Visitante"}
+        integrations_models.TranslationMemory.objects.create(
+            source_hash=translation_memory._hash("Home"),
+            source="Home",
+            language="es",
+            translation="Local",
+        )
+
+        translations = translation_memory.translate_texts(
+            texts=["Home", "Away", "Home"], to_language="es"
+        )
+
+        self.assertEqual(translations, {"Home": "Local", "Away": "Visitante"})
+        translate_texts.assert_called_once_with(texts=["Away"], to_language="es")
+        self.assertTrue(
+            integrations_models.TranslationMemory.objects.filter(source="Away").exists()
+        )
+
+    def test_remembered_texts_are_served_from_cache(self, translate_texts):
+        translate_texts.return_value = {"Match Winner": "Ganador del partido"}
+        translation_memory.translate_texts(texts=["Match Winner"], to_language="es")
+
+        with self.assertNumQueries(0):
+            translations = translation_memory.translate_texts(
+                texts=["Match Winner"], to_language="es"
+            )
+
+        self.assertEqual(translations, {"Match Winner": "Ganador del partido"})
+        translate_texts.assert_called_once()
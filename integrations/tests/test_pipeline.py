@@ -0,0 +1,166 @@
+from unittest import mock
+
+from django.core import cache as django_cache
+from django.test import TestCase, override_settings
+
+from football import models as football_models
+from football import tasks as football_tasks
+from football.services import cache as football_cache
+from football.signals.invalidation import signals as invalidation_signals
+from geo import models as geo_models
+from integrations import memory as translation_memory
+from integrations import models as integrations_models
+from integrations import tasks as integrations_tasks
+from integrations.google import exceptions as google_exceptions
+from integrations.google import translate as google_translate
+from utils import translate as utils_translate
+from utils.first_party import testing as utils_testing
+
+
+class ChunkTests(TestCase):
+    def test_chunks_respect_request_limits(self):
+        with mock.patch.object(google_translate, "TRANSLATE_CHUNK_SIZE", 3), mock.patch.object(
+            google_translate, "TRANSLATE_CHUNK_CHARS", 10
+        ):
+            chunks = list(google_translate._chunks(["a", "b", "c", "d", "123456789", "x"]))
+
+        self.assertEqual(chunks, [["a", "b", "c"], ["d", "123456789"], ["x"]])
+
+    def test_failed_request_raises_with_the_other_chunks(self):
+        backend = mock.Mock(available=True)
+        backend.translate.side_effect = lambda texts, to_language: (
+            [f"{text}!" for text in texts] if texts != ["b"] else 1 / 0
+        )
+
+        with mock.patch.object(google_translate, "TRANSLATE_CHUNK_SIZE", 1), mock.patch.object(
+            google_translate.google_backends, "get_backend", return_value=backend
+        ), self.assertRaises(google_exceptions.TranslationUnavailable) as raised:
+            google_translate.translate_texts(texts=["a", "b"], to_language="es")
+
+        self.assertEqual(raised.exception.translations, {"a": "a!"})
+
+    def test_unavailable_backend_raises(self):
+        backend = mock.Mock(available=False)
+
+        with mock.patch.object(
+            google_translate.google_backends, "get_backend", return_value=backend
+        ), self.assertRaises(google_exceptions.TranslationUnavailable):
+            google_translate.translate_texts(texts=["a"], to_language="es")
+
+
+@override_settings(CACHES=utils_testing.LOCMEM_CACHES)
+@mock.patch.object(football_tasks.task_rebuild_league_listings, "delay", mock.Mock())
+@mock.patch.object(translation_memory.google.translate, "translate_texts")
+class TranslatePipelineTests(TestCase):
+    def setUp(self):
+        # * The translation memory would answer from what earlier tests learned
+        django_cache.caches[translation_memory.CACHE_ALIAS].clear()
+
+    def test_missing_columns_are_filled_in_one_batch(self, translate_texts):
+        translate_texts.side_effect = lambda texts, to_language: {
+            text: f"{text} ({to_language})" for text in texts
+        }
+        first = football_models.Team.objects.create(title="Arsenal")
+        second = football_models.Team.objects.create(title="Arsenal")
+        kept = football_models.Team.objects.create(title="Chelsea", title_es="Chelsea FC")
+
+        translated = utils_translate.translate_missing(model=football_models.Team)
+
+        self.assertEqual(translated, 3)
+        # * One request per language, duplicated titles are sent once
+        self.assertEqual(translate_texts.call_count, 2)
+        translate_texts.assert_any_call(texts=["Arsenal"], to_language="es")
+        translate_texts.assert_any_call(texts=["Arsenal", "Chelsea"], to_language="fr")
+
+        for team in (first, second):
+            team.refresh_from_db()
+            self.assertEqual(team.title_es, "Arsenal (es)")
+            self.assertEqual(team.title_fr, "Arsenal (fr)")
+        kept.refresh_from_db()
+        self.assertEqual(kept.title_es, "Chelsea FC")
+
+        translate_texts.reset_mock()
+        self.assertEqual(utils_translate.translate_missing(model=football_models.Team), 0)
+        translate_texts.assert_not_called()
+
+    def test_new_rows_are_translated_once_past_the_checkpoint(self, translate_texts):
+        translate_texts.side_effect = lambda texts, to_language: {
+            text: f"{text} ({to_language})" for text in texts
+        }
+        football_models.Team.objects.create(title="Arsenal")
+
+        with mock.patch.object(utils_translate, "TRANSLATION_OVERLAP", 0):
+            self.assertEqual(utils_translate.translate_new_rows(model=football_models.Team), 1)
+
+            # * Rows behind the checkpoint are left to translate_missing
+            football_models.Team._base_manager.update(title_es=None)
+            translate_texts.reset_mock()
+            self.assertEqual(utils_translate.translate_new_rows(model=football_models.Team), 0)
+            translate_texts.assert_not_called()
+
+            added = football_models.Team.objects.create(title="Chelsea")
+            self.assertEqual(utils_translate.translate_new_rows(model=football_models.Team), 1)
+
+        checkpoint = integrations_models.TranslationCheckpoint.objects.get(label="football.Team")
+        self.assertEqual(checkpoint.last_pk, added.pk)
+
+    def test_failed_rows_are_not_retried(self, translate_texts):
+        translate_texts.return_value = {}
+        team = football_models.Team.objects.create(title="Arsenal")
+
+        self.assertEqual(utils_translate.translate_new_rows(model=football_models.Team), 0)
+        checkpoint = integrations_models.TranslationCheckpoint.objects.get(label="football.Team")
+        self.assertEqual(checkpoint.failed, [team.pk])
+
+        translate_texts.reset_mock()
+        utils_translate.translate_new_rows(model=football_models.Team)
+        translate_texts.assert_not_called()
+
+    def test_rows_stay_pending_while_the_backend_fails(self, translate_texts):
+        translate_texts.side_effect = google_exceptions.TranslationUnavailable("timeout")
+        team = football_models.Team.objects.create(title="Arsenal")
+
+        with self.assertRaises(google_exceptions.TranslationUnavailable):
+            utils_translate.translate_new_rows(model=football_models.Team)
+
+        checkpoint = integrations_models.TranslationCheckpoint.objects.get(label="football.Team")
+        self.assertEqual((checkpoint.last_pk, checkpoint.failed), (0, []))
+
+        translate_texts.side_effect = lambda texts, to_language: {
+            text: f"{text} ({to_language})" for text in texts
+        }
+        self.assertEqual(utils_translate.translate_new_rows(model=football_models.Team), 1)
+        team.refresh_from_db()
+        self.assertEqual(team.title_es, "Arsenal (es)")
+
+    def test_run_refreshes_listings_once(self, translate_texts):
+        translate_texts.side_effect = lambda texts, to_language: {
+            text: f"{text} ({to_language})" for text in texts
+        }
+        with mock.patch.object(utils_translate, "schedule_translation"):
+            country = geo_models.Country.objects.create(title="England")
+            football_models.League.objects.create(
+                title="Premier League", country=country, season="2024", round="1"
+            )
+            football_models.Team.objects.create(title="Arsenal")
+
+        with mock.patch.object(football_cache, "on_commit_once") as on_commit_once:
+            updated = utils_translate.translate_pending()
+
+        self.assertEqual(updated, 3)
+        on_commit_once.assert_called_once_with(invalidation_signals.refresh_listings)
+
+    @mock.patch.object(integrations_tasks.task_translate_new_rows, "apply_async")
+    def test_saves_queue_one_task_after_commit(self, apply_async, translate_texts):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            football_models.Team.objects.create(title="Arsenal")
+            football_models.League.objects.create(title="Premier League", season="2024", round="1")
+
+        self.assertEqual(callbacks.count(utils_translate._dispatch_translation), 1)
+        translate_texts.assert_not_called()
+        apply_async.assert_called_once_with(countdown=utils_translate.TRANSLATION_DELAY)
+
+        # * A task is already waiting for the rows
+        with self.captureOnCommitCallbacks(execute=True):
+            football_models.Team.objects.create(title="Liverpool")
+        apply_async.assert_called_once()
@@ -1,17 +1,37 @@
 from django import http
+from django.db import models as django_models
 from drf_spectacular import utils as drf_utils
 from rest_framework import mixins as rest_mixins
 from rest_framework import renderers as rest_renderers
 from rest_framework import response as rest_response
 from rest_framework import viewsets as rest_viewsets
 
+from utils.third_party.api.rest_framework import conditional as utils_conditional
+from utils.third_party.api.rest_framework import mixins as utils_mixins
+
 from .... import models as news_models
 from ..serializers import serializers as news_serializers
 
 cache_dictionary = {}
 
 
-class NewsViewSet(rest_viewsets.GenericViewSet, rest_mixins.ListModelMixin):
+def _news_etag(request: http.HttpRequest, *args, **kwargs) -> str:
+    # * Inserts raise the last pk, prunes the count and updates the last write
+    version = news_models.News.objects.aggregate(
+        last=django_models.Max("pk"),
+        count=django_models.Count("pk"),
+        updated=django_models.Max("updated_at"),
+    )
+    return utils_conditional.version_etag(
+        version["last"], version["count"], version["updated"], request.GET.urlencode()
+    )
+
+
+class NewsViewSet(
+    utils_mixins.KeysetPaginationMixin,
+    rest_viewsets.GenericViewSet,
+    rest_mixins.ListModelMixin,
+):
     permission_classes = []
 
     @drf_utils.extend_schema(
@@ -26,6 +46,7 @@ class NewsViewSet(rest_viewsets.GenericViewSet, rest_mixins.ListModelMixin):
         ],
         responses=news_serializers.ReadNewsSerializer,
     )
+    @utils_conditional.conditional_list(etag_func=_news_etag)
     def list(self, request: http.HttpRequest, *args, **kwargs) -> rest_response.Response:
         return super().list(request=request, *args, **kwargs)
 
@@ -38,3 +59,4 @@ class NewsViewSet(rest_viewsets.GenericViewSet, rest_mixins.ListModelMixin):
     serializer_class = news_serializers.ReadNewsSerializer
     renderer_classes = [rest_renderers.JSONRenderer]
     queryset = news_models.News.objects.all()
+    keyset_ordering = "pk"
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def remove_duplicated_links(apps, schema_editor):
+    # * The importer recreated every article each hour, the newest row is kept
+    News = apps.get_model("news", "News")
+    duplicates = (
+        News.objects.values("link")
+        .annotate(last=models.Max("pk"), count=models.Count("pk"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        News.objects.filter(link=duplicate["link"]).exclude(pk=duplicate["last"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0002_auto_20241106_1143"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="news",
+            name="published",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="news",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(remove_duplicated_links, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="news",
+            name="link",
+            field=models.TextField(unique=True),
+        ),
+    ]
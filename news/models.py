@@ -5,4 +5,7 @@ class News(django_models.Model):
     image = django_models.TextField(null=True, blank=True)
     header = django_models.TextField()
     content = django_models.TextField()
-    link = django_models.TextField()
+    # * Articles are upserted by their link, every run writes only what changed
+    link = django_models.TextField(unique=True)
+    published = django_models.DateTimeField(null=True, blank=True)
+    updated_at = django_models.DateTimeField(auto_now=True)
@@ -1,31 +1,158 @@
+# region				-----External Imports-----
+import datetime
+import logging
+import typing
+from email import utils as email_utils
+
 import celery
 import requests
-from bs4 import BeautifulSoup
+from django import utils as django_utils
+from django.core import cache as django_cache
+from django.db import models as django_models
+from django.db import transaction
+from lxml import etree
+
+# endregion
 
+# region				-----Internal Imports-----
 from .models import News
 
+# endregion
 
-@celery.shared_task(name="task_start_news_import")
-def task_start_news_import():
-    news = []
-    rss_url = "https://www.coindesk.com/arc/outboundfeeds/rss/"
+# region			  -----Supporting Variables-----
+logger = logging.Logger(__file__)
+
+RSS_URL = "https://www.coindesk.com/arc/outboundfeeds/rss/"
+RSS_TIMEOUT = 30
+MEDIA_NAMESPACE = "http://search.yahoo.com/mrss/"
+
+# * Articles published before the retention window are pruned
+NEWS_RETENTION = datetime.timedelta(days=7)
+NEWS_FIELDS = ["image", "header", "content", "published"]
+
+CACHE_ALIAS = "shared"
+FEED_VALIDATORS_KEY = "news:feed:validators"
+# endregion
+
+
+def _validators_cache() -> django_cache.BaseCache:
+    return django_cache.caches[CACHE_ALIAS]
+
+
+def fetch_feed(url: str = RSS_URL) -> requests.Response or None:
+    # * The validators of the last imported response make an unchanged feed a 304
+    validators = _validators_cache().get(FEED_VALIDATORS_KEY) or {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = requests.get(url, headers=headers, timeout=RSS_TIMEOUT, stream=True)
+    if response.status_code == 304:
+        response.close()
+        return None
+
+    response.raise_for_status()
+    return response
+
+
+def _published(value: str or None) -> datetime.datetime or None:
+    if not value:
+        return None
+    try:
+        return email_utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
 
-    response = requests.get(rss_url)
-    rss_content = response.content
 
-    soup = BeautifulSoup(rss_content, 'xml')
+def iter_items(stream: typing.IO[bytes]) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    # * Items are parsed one by one and dropped, the tree never holds the feed
+    for _, item in etree.iterparse(stream, events=("end",), tag="item"):
+        media = item.find(f"{{{MEDIA_NAMESPACE}}}content")
+        yield {
+            "link": (item.findtext("link") or "").strip(),
+            "header": item.findtext("title") or "",
+            "content": item.findtext("description") or "",
+            "image": media.get("url") if media is not None else None,
+            "published": _published(item.findtext("pubDate")),
+        }
 
-    items = soup.find_all('item')
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
 
-    for item in items:
-        title = item.find('title').text if item.find('title') else None
-        link = item.find('link').text if item.find('link') else None
-        description = item.find('description').text if item.find('description') else None
 
-        media_content = item.find('media:content')
-        image_url = media_content['url'] if media_content else None
+def _expired(now: datetime.datetime) -> django_models.Q:
+    # * Rows imported before publication dates were stored expire by their last write
+    threshold = now - NEWS_RETENTION
+    return django_models.Q(published__lt=threshold) | django_models.Q(
+        published__isnull=True, updated_at__lt=threshold
+    )
 
-        news.append(News(image=image_url, header=title, content=description, link=link))
 
-    News.objects.all().delete()
-    News.objects.bulk_create(news)
+def upsert_news(items: typing.Iterable[typing.Dict[str, typing.Any]]) -> typing.Dict[str, int]:
+    now = django_utils.timezone.now()
+    threshold = now - NEWS_RETENTION
+    items = {
+        item["link"]: item
+        for item in items
+        if item["link"] and not (item["published"] and item["published"] < threshold)
+    }
+
+    summary = {"inserted": 0, "updated": 0, "unchanged": 0}
+    with transaction.atomic():
+        existing = News.objects.in_bulk(list(items), field_name="link")
+
+        changed, created = [], []
+        for link, item in items.items():
+            news = existing.get(link)
+            if news is None:
+                created.append(News(link=link, **{field: item[field] for field in NEWS_FIELDS}))
+                continue
+
+            if all(getattr(news, field) == item[field] for field in NEWS_FIELDS):
+                summary["unchanged"] += 1
+                continue
+
+            for field in NEWS_FIELDS:
+                setattr(news, field, item[field])
+            # * bulk_update leaves auto_now alone
+            news.updated_at = now
+            changed.append(news)
+
+        News.objects.bulk_update(changed, fields=[*NEWS_FIELDS, "updated_at"])
+        News.objects.bulk_create(created, ignore_conflicts=True)
+
+    summary.update(inserted=len(created), updated=len(changed))
+    return summary
+
+
+def import_news(url: str = RSS_URL) -> typing.Dict[str, int]:
+    summary = {"inserted": 0, "updated": 0, "unchanged": 0}
+
+    response = fetch_feed(url=url)
+    if response is not None:
+        with response:
+            response.raw.decode_content = True
+            summary = upsert_news(items=iter_items(stream=response.raw))
+
+        _validators_cache().set(
+            FEED_VALIDATORS_KEY,
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            },
+            timeout=None,
+        )
+
+    summary["deleted"], _ = News.objects.filter(
+        _expired(now=django_utils.timezone.now())
+    ).delete()
+    return summary
+
+
+@celery.shared_task(name="task_start_news_import")
+def task_start_news_import() -> None:
+    summary = import_news()
+    logger.info(f"task_start_news_import: {summary}")
@@ -0,0 +1,110 @@
+import datetime
+import io
+from unittest import mock
+
+from django import utils
+from django.test import TestCase, override_settings
+
+from news import models as news_models
+from news import tasks as news_tasks
+from utils.first_party import testing as utils_testing
+
+ITEM = """
+    <item>
+      <title>{title}</title>
+      <link>https://www.coindesk.com/{slug}</link>
+      <description>About {slug}</description>
+      <pubDate>{date}</pubDate>
+      <media:content url="https://www.coindesk.com/{slug}.jpg" medium="image" />
+    </item>"""
+
+
+def feed(*items: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss xmlns:media="http://search.yahoo.com/mrss/" version="2.0"><channel>'
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode()
+
+
+def item(slug: str, title: str = None, age: datetime.timedelta = datetime.timedelta()) -> str:
+    date = utils.timezone.now() - age
+    return ITEM.format(
+        slug=slug,
+        title=title or slug.title(),
+        date=date.strftime("%a, %d %b %Y %H:%M:%S +0000"),
+    )
+
+
+def response(content: bytes, status_code: int = 200, headers: dict = None) -> mock.Mock:
+    return mock.MagicMock(
+        status_code=status_code,
+        headers=headers or {},
+        raw=io.BytesIO(content),
+    )
+
+
+@override_settings(CACHES=utils_testing.LOCMEM_CACHES)
+@mock.patch.object(news_tasks.requests, "get")
+class NewsImportTests(TestCase):
+    def tearDown(self):
+        news_tasks._validators_cache().clear()
+
+    def test_runs_write_only_new_and_changed_articles(self, get):
+        get.return_value = response(feed(item("bitcoin"), item("ether")))
+        self.assertEqual(
+            news_tasks.import_news(),
+            {"inserted": 2, "updated": 0, "unchanged": 0, "deleted": 0},
+        )
+        bitcoin = news_models.News.objects.get(link="https://www.coindesk.com/bitcoin")
+
+        get.return_value = response(
+            feed(item("bitcoin"), item("ether", title="Ether rallies"), item("solana"))
+        )
+        self.assertEqual(
+            news_tasks.import_news(),
+            {"inserted": 1, "updated": 1, "unchanged": 1, "deleted": 0},
+        )
+
+        # * Ids survive the run
+        self.assertTrue(news_models.News.objects.filter(pk=bitcoin.pk).exists())
+        self.assertEqual(
+            news_models.News.objects.get(link="https://www.coindesk.com/ether").header,
+            "Ether rallies",
+        )
+        self.assertEqual(bitcoin.image, "https://www.coindesk.com/bitcoin.jpg")
+
+    def test_only_expired_articles_are_pruned(self, get):
+        expired = utils.timezone.now() - news_tasks.NEWS_RETENTION - datetime.timedelta(hours=1)
+        news_models.News.objects.create(
+            header="Old", content="", link="https://www.coindesk.com/old", published=expired
+        )
+        news_models.News.objects.create(
+            header="Gone from the feed",
+            content="",
+            link="https://www.coindesk.com/recent",
+            published=utils.timezone.now(),
+        )
+        get.return_value = response(
+            feed(item("bitcoin"), item("stale", age=datetime.timedelta(days=30)))
+        )
+
+        summary = news_tasks.import_news()
+
+        self.assertEqual((summary["inserted"], summary["deleted"]), (1, 1))
+        self.assertEqual(
+            set(news_models.News.objects.values_list("link", flat=True)),
+            {"https://www.coindesk.com/bitcoin", "https://www.coindesk.com/recent"},
+        )
+
+    def test_unchanged_feed_is_not_downloaded_again(self, get):
+        get.return_value = response(feed(item("bitcoin")), headers={"ETag": '"v1"'})
+        news_tasks.import_news()
+
+        get.return_value = response(b"", status_code=304)
+        summary = news_tasks.import_news()
+
+        self.assertEqual(summary["inserted"], 0)
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(news_models.News.objects.count(), 1)
@@ -1,4 +1,4 @@
 # region				-----Internal Imports-----
-from . import api, handlers
+from . import api, cache, handlers, limiter
 
 # endregion
@@ -1,32 +1,87 @@
 # region				-----External Imports-----
 import dataclasses
 import datetime
+import logging
 import os
+import threading
 import typing
+from concurrent import futures
 
 import requests
+from requests import adapters
 
 import utils
 
+# * ijson is optional: without it every page is decoded with .json()
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
 # region				-----Internal Imports-----
-from . import exceptions
+from . import cache, exceptions, limiter
 
 # endregion
 
 # endregion
 
+# region			  -----Supporting Variables-----
+logger = logging.Logger(__file__)
+
+MAX_WORKERS = int(os.environ.get("RAPID_API_MAX_WORKERS", 8))
+# * Per worker process, see limiter.TokenBucket
+REQUESTS_PER_MINUTE = int(os.environ.get("RAPID_API_REQUESTS_PER_MINUTE", 300))
+MAX_RETRIES = 3
+RETRY_AFTER = 60
+# * (connect, read) seconds: a hung connection must not hold a fetch_many worker
+REQUEST_TIMEOUT = (
+    float(os.environ.get("RAPID_API_CONNECT_TIMEOUT", 5)),
+    float(os.environ.get("RAPID_API_READ_TIMEOUT", 60)),
+)
+
+_sessions: typing.Dict[str, requests.Session] = {}
+_limiters: typing.Dict[str, limiter.TokenBucket] = {}
+_lock = threading.Lock()
+
+_PARSE_ERRORS = (ValueError, ijson.JSONError) if IJSON_AVAILABLE else (ValueError,)
+# endregion
+
+
+def _session(host: str) -> requests.Session:
+    # * Sessions are shared per host so keep-alive connections survive between
+    # * RapidAPI objects and tasks running in the same worker process
+    with _lock:
+        if host not in _sessions:
+            session = requests.Session()
+            adapter = adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=MAX_WORKERS
+            )
+            session.mount("https://", adapter)
+            _sessions[host] = session
+            _limiters[host] = limiter.TokenBucket(
+                rate=REQUESTS_PER_MINUTE / 60, capacity=REQUESTS_PER_MINUTE
+            )
+        return _sessions[host]
+
 
 @dataclasses.dataclass
 class RapidAPI(object):
     version: str or None
     path: str
     host: str
+    max_workers: int = MAX_WORKERS
 
     # region		     -----Private Method-----
     def __post_init__(self):
         self.secret_key = os.environ.get("RAPID_API_KEY")
         self.url = self.__build_url()
         self.headers = self.__request_headers()
+        self.session = _session(host=self.host)
+        self.limiter = _limiters[self.host]
+        self.cache = cache.ResponseCache(host=self.host, path=self.path)
 
     def __build_url(self) -> typing.AnyStr:
         if self.version:
@@ -39,16 +94,112 @@ class RapidAPI(object):
     def __request_headers(self) -> typing.Dict:
         return {"X-RapidAPI-Key": self.secret_key, "X-RapidAPI-Host": self.host}
 
-    # endregion
+    def __get(self, search_by: typing.Dict, stream: bool = False) -> requests.Response:
+        for _ in range(MAX_RETRIES):
+            self.limiter.acquire()
+            response = self.session.get(
+                headers=self.headers,
+                params=search_by,
+                url=self.url,
+                stream=stream,
+                timeout=REQUEST_TIMEOUT,
+            )
+            self.limiter.update_from_headers(headers=response.headers)
 
-    # region		     -----Public Methods-----
-    def fetch_data(self, search_by: typing.Dict) -> typing.List[typing.Dict]:
+            if response.status_code != 429:
+                return response
+
+            retry_after = self.__retry_after(headers=response.headers)
+            logger.warning(f"RapidAPI {self.host} throttled, retry in {retry_after}s")
+            response.close()
+            self.limiter.block(seconds=retry_after)
+
+        # * The body of a 429 is an error message, never data
+        raise exceptions.RapidException(f"RapidAPI {self.host} throttled {MAX_RETRIES} times")
+
+    @staticmethod
+    def __retry_after(headers: typing.Mapping[str, str]) -> float:
+        # * Retry-After may also be an HTTP date, the default wait is used then
+        try:
+            return float(headers.get("retry-after", RETRY_AFTER))
+        except (TypeError, ValueError):
+            return RETRY_AFTER
+
+    def __fetch(self, search_by: typing.Dict) -> typing.List[typing.Dict]:
         try:
-            response = requests.get(
-                headers=self.headers, params=search_by, url=self.url
-            ).json()
+            response = self.__get(search_by=search_by).json()
             return response.get("response")
         except requests.exceptions.RequestException:
             raise exceptions.RapidException
 
+    @staticmethod
+    def __iter_page(
+        response: requests.Response, paging: typing.Dict
+    ) -> typing.Iterator[typing.Dict]:
+        if not IJSON_AVAILABLE:
+            data = response.json()
+            paging.update(data.get("paging") or {})
+            yield from data.get("response") or []
+            return
+
+        # * Items of "response" are built one by one from the raw socket, so
+        # * the page is never held in memory as a whole
+        response.raw.decode_content = True
+        builder = None
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if prefix.startswith("paging.") and event == "number":
+                paging[prefix.split(".", 1)[1]] = value
+            elif prefix == "response.item" and event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+
+            if builder is None:
+                continue
+
+            builder.event(event, value)
+            if prefix == "response.item" and event in ("end_map", "end_array"):
+                yield builder.value
+                builder = None
+
+    # endregion
+
+    # region		     -----Public Methods-----
+    def fetch_data(self, search_by: typing.Dict) -> typing.List[typing.Dict]:
+        return self.cache.get_or_fetch(
+            search_by=search_by, fetch=lambda: self.__fetch(search_by=search_by)
+        )
+
+    def iter_data(self, search_by: typing.Dict) -> typing.Iterator[typing.Dict]:
+        # * Follows the "paging" block of the API and yields single items
+        if self.cache.ttl:
+            yield from self.fetch_data(search_by=search_by) or []
+            return
+
+        page = 1
+        while True:
+            params = {**search_by, "page": page} if page > 1 else search_by
+            paging = {}
+            try:
+                with self.__get(search_by=params, stream=True) as response:
+                    yield from self.__iter_page(response=response, paging=paging)
+            except (requests.exceptions.RequestException, *_PARSE_ERRORS):
+                raise exceptions.RapidException
+
+            if page >= int(paging.get("total") or 1):
+                return
+            page += 1
+
+    def fetch_many(
+        self, search_by: typing.Iterable[typing.Dict]
+    ) -> typing.Iterator[typing.Tuple[typing.Dict, typing.List[typing.Dict]]]:
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            jobs = {
+                executor.submit(self.fetch_data, search_by=params): params
+                for params in search_by
+            }
+            for job in futures.as_completed(jobs):
+                try:
+                    yield jobs[job], job.result()
+                except Exception as ex:
+                    logger.error(f"RapidAPI {self.url} {jobs[job]}: {ex}")
+
     # endregion
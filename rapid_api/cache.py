@@ -0,0 +1,95 @@
+# region				-----External Imports-----
+import hashlib
+import json
+import logging
+import threading
+import time
+import typing
+
+from django.conf import settings
+from django.core import cache as django_cache
+
+# endregion
+
+# region			  -----Supporting Variables-----
+logger = logging.Logger(__file__)
+
+CACHE_ALIAS = "rapid_api"
+REFRESH_LOCK_TIMEOUT = 60
+# endregion
+
+
+class ResponseCache(object):
+    # region		     -----Public Methods-----
+    def get_or_fetch(
+        self, search_by: typing.Dict, fetch: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        if not self.ttl:
+            return fetch()
+
+        key = self.__key(search_by=search_by)
+        try:
+            entry = self.__cache.get(key)
+        except Exception as ex:
+            # * Redis being down costs the request, never the import
+            logger.error(f"RapidAPI cache {key}: {ex}")
+            return fetch()
+
+        if entry is None:
+            return self.__store(key=key, data=fetch())
+
+        age = time.time() - entry["stored_at"]
+        if age > self.ttl:
+            # * Stale-while-revalidate: the old response is returned at once and
+            # * one caller per key refreshes it in the background
+            if self.__lock_refresh(key=key):
+                threading.Thread(
+                    target=self.__refresh, args=(key, fetch), daemon=True
+                ).start()
+
+        return entry["data"]
+
+    # endregion
+
+    # region		     -----Private Method-----
+    def __init__(self, host: str, path: str) -> None:
+        self.host = host
+        self.path = path
+        self.ttl = getattr(settings, "RAPID_API_CACHE_TTL", {}).get(path, 0)
+        self.__cache = django_cache.caches[CACHE_ALIAS]
+
+    def __key(self, search_by: typing.Dict) -> str:
+        params = json.dumps(search_by, sort_keys=True, default=str)
+        digest = hashlib.sha1(params.encode()).hexdigest()
+        return f"{self.host}:{self.path}:{digest}"
+
+    def __store(self, key: str, data: typing.Any) -> typing.Any:
+        # * Empty and failed responses are not worth keeping
+        if data:
+            try:
+                self.__cache.set(
+                    key, {"stored_at": time.time(), "data": data}, timeout=self.ttl * 2
+                )
+            except Exception as ex:
+                logger.error(f"RapidAPI cache {key}: {ex}")
+        return data
+
+    def __lock_refresh(self, key: str) -> bool:
+        try:
+            return bool(self.__cache.add(f"{key}:refresh", 1, timeout=REFRESH_LOCK_TIMEOUT))
+        except Exception as ex:
+            logger.error(f"RapidAPI cache {key}: {ex}")
+            return False
+
+    def __refresh(self, key: str, fetch: typing.Callable[[], typing.Any]) -> None:
+        try:
+            self.__store(key=key, data=fetch())
+        except Exception as ex:
+            logger.error(f"RapidAPI cache refresh {key}: {ex}")
+        finally:
+            try:
+                self.__cache.delete(f"{key}:refresh")
+            except Exception as ex:
+                logger.error(f"RapidAPI cache {key}: {ex}")
+
+    # endregion
@@ -0,0 +1,71 @@
+# region				-----External Imports-----
+import threading
+import time
+import typing
+
+# endregion
+
+
+class TokenBucket(object):
+    # * The bucket lives in one worker process while the RapidAPI quota is per
+    # * account: every process gets the full rate, so REQUESTS_PER_MINUTE has to
+    # * be split between the workers. The x-ratelimit headers and 429 replies
+    # * pull each bucket back to what the account has left
+    # region		     -----Public Methods-----
+    def acquire(self) -> None:
+        while True:
+            with self.__lock:
+                self.__refill()
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                wait = (1 - self.__tokens) / self.__rate
+
+            time.sleep(wait)
+
+    def update_from_headers(self, headers: typing.Mapping[str, str]) -> None:
+        # * RapidAPI reports the per-minute window of the upstream API with
+        # * x-ratelimit-limit / x-ratelimit-remaining on every response
+        limit = self.__header_number(headers=headers, name="x-ratelimit-limit")
+        remaining = self.__header_number(headers=headers, name="x-ratelimit-remaining")
+
+        with self.__lock:
+            self.__refill()
+            if limit:
+                self.__rate = limit / 60
+                self.__capacity = limit
+            if remaining is not None:
+                self.__tokens = min(self.__tokens, remaining)
+
+    def block(self, seconds: float) -> None:
+        with self.__lock:
+            self.__refill()
+            self.__tokens = min(self.__tokens, -seconds * self.__rate)
+
+    # endregion
+
+    # region		     -----Private Method-----
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.__lock = threading.Lock()
+        self.__capacity = capacity
+        self.__tokens = capacity
+        self.__rate = rate
+        self.__updated = time.monotonic()
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        self.__tokens = min(
+            self.__capacity, self.__tokens + (now - self.__updated) * self.__rate
+        )
+        self.__updated = now
+
+    @staticmethod
+    def __header_number(
+        headers: typing.Mapping[str, str], name: str
+    ) -> typing.Optional[float]:
+        try:
+            return float(headers[name])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    # endregion
@@ -0,0 +1,100 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from rapid_api import api as rapid_api
+from rapid_api import exceptions as rapid_exceptions
+from rapid_api import limiter
+from rapid_api.tests.test_limiter import FakeClock
+
+
+def response(status_code: int = 200, headers: dict = None, data: list = None) -> mock.Mock:
+    return mock.Mock(
+        status_code=status_code,
+        headers=headers or {},
+        json=mock.Mock(return_value={"response": data or []}),
+    )
+
+
+@override_settings(RAPID_API_CACHE_TTL={})
+class RapidAPITests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(limiter, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.api = rapid_api.RapidAPI(version="v3", path="odds", host="api.example.com")
+        self.api.session = mock.Mock()
+        self.api.limiter = limiter.TokenBucket(rate=1, capacity=10)
+
+    def test_fetch_data_returns_the_response_items(self):
+        self.api.session.get.return_value = response(data=[{"id": 1}])
+
+        self.assertEqual(self.api.fetch_data(search_by={"fixture": 1}), [{"id": 1}])
+        self.assertEqual(self.api.session.get.call_args.kwargs["params"], {"fixture": 1})
+
+    def test_rate_limit_headers_throttle_the_next_request(self):
+        self.api.session.get.return_value = response(
+            headers={"x-ratelimit-limit": "60", "x-ratelimit-remaining": "0"}
+        )
+
+        self.api.fetch_data(search_by={"fixture": 1})
+        self.assertEqual(self.clock.slept, [])
+
+        self.api.fetch_data(search_by={"fixture": 2})
+        self.assertEqual(self.clock.slept, [1])
+
+    def test_throttled_request_is_retried_after_the_backoff(self):
+        throttled = response(status_code=429, headers={"retry-after": "5"})
+        self.api.session.get.side_effect = [throttled, response(data=[{"id": 1}])]
+
+        self.assertEqual(self.api.fetch_data(search_by={"fixture": 1}), [{"id": 1}])
+        self.assertEqual(self.api.session.get.call_count, 2)
+        throttled.close.assert_called_once_with()
+        self.assertEqual(sum(self.clock.slept), 6)
+
+    def test_retries_stop_after_max_retries(self):
+        self.api.session.get.return_value = response(status_code=429, headers={"retry-after": "1"})
+
+        with self.assertRaises(rapid_exceptions.RapidException):
+            self.api.fetch_data(search_by={"fixture": 1})
+
+        self.assertEqual(self.api.session.get.call_count, rapid_api.MAX_RETRIES)
+
+    def test_retry_after_date_falls_back_to_the_default_wait(self):
+        throttled = response(
+            status_code=429, headers={"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"}
+        )
+        self.api.session.get.side_effect = [throttled, response(data=[{"id": 1}])]
+
+        self.assertEqual(self.api.fetch_data(search_by={"fixture": 1}), [{"id": 1}])
+        self.assertEqual(sum(self.clock.slept), rapid_api.RETRY_AFTER + 1)
+
+    def test_requests_have_a_timeout(self):
+        self.api.session.get.return_value = response()
+
+        self.api.fetch_data(search_by={"fixture": 1})
+
+        self.assertEqual(
+            self.api.session.get.call_args.kwargs["timeout"], rapid_api.REQUEST_TIMEOUT
+        )
+
+    def test_fetch_many_yields_every_answer_and_skips_failures(self):
+        def get(params: dict, **kwargs) -> mock.Mock:
+            if params["fixture"] == 2:
+                raise rapid_api.requests.exceptions.ConnectionError
+            return response(data=[{"id": params["fixture"]}])
+
+        self.api.session.get.side_effect = get
+
+        with mock.patch.object(rapid_api.logger, "error") as error:
+            results = dict(
+                (params["fixture"], data)
+                for params, data in self.api.fetch_many(
+                    search_by=[{"fixture": 1}, {"fixture": 2}, {"fixture": 3}]
+                )
+            )
+
+        self.assertEqual(results, {1: [{"id": 1}], 3: [{"id": 3}]})
+        error.assert_called_once()
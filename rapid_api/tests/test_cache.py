@@ -0,0 +1,68 @@
+import time
+from unittest import mock
+
+from django.core import cache as django_cache
+from django.test import SimpleTestCase, override_settings
+
+from rapid_api import cache as rapid_cache
+from utils.first_party import testing as utils_testing
+
+
+@override_settings(
+    CACHES=utils_testing.LOCMEM_CACHES, RAPID_API_CACHE_TTL={"teams": 60, "odds": 0}
+)
+class ResponseCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.cache = rapid_cache.ResponseCache(host="api.example.com", path="teams")
+
+    def tearDown(self):
+        django_cache.caches[rapid_cache.CACHE_ALIAS].clear()
+
+    def test_fresh_entry_is_served_without_fetching(self):
+        fetch = mock.Mock(return_value=[{"id": 1}])
+
+        self.cache.get_or_fetch(search_by={"id": 1}, fetch=fetch)
+        data = self.cache.get_or_fetch(search_by={"id": 1}, fetch=fetch)
+
+        self.assertEqual(data, [{"id": 1}])
+        fetch.assert_called_once_with()
+
+    def test_paths_without_ttl_always_fetch(self):
+        cache = rapid_cache.ResponseCache(host="api.example.com", path="odds")
+        fetch = mock.Mock(return_value=[{"id": 1}])
+
+        cache.get_or_fetch(search_by={"fixture": 1}, fetch=fetch)
+        cache.get_or_fetch(search_by={"fixture": 1}, fetch=fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    @mock.patch.object(rapid_cache.threading, "Thread")
+    def test_stale_entry_is_served_and_refreshed_once(self, thread):
+        self.cache.get_or_fetch(search_by={"id": 1}, fetch=lambda: ["old"])
+        fetch = mock.Mock(return_value=["new"])
+
+        with mock.patch.object(rapid_cache.time, "time", return_value=time.time() + 61):
+            first = self.cache.get_or_fetch(search_by={"id": 1}, fetch=fetch)
+            second = self.cache.get_or_fetch(search_by={"id": 1}, fetch=fetch)
+
+        self.assertEqual((first, second), (["old"], ["old"]))
+        thread.assert_called_once()
+        fetch.assert_not_called()
+
+        # * The background refresh stores the new response for the next caller
+        target, args = thread.call_args.kwargs["target"], thread.call_args.kwargs["args"]
+        target(*args)
+        self.assertEqual(self.cache.get_or_fetch(search_by={"id": 1}, fetch=fetch), ["new"])
+        fetch.assert_called_once_with()
+
+    def test_redis_down_falls_back_to_fetching(self):
+        backend = django_cache.caches[rapid_cache.CACHE_ALIAS]
+        fetch = mock.Mock(return_value=[{"id": 1}])
+
+        with mock.patch.object(
+            backend, "get", side_effect=ConnectionError("down")
+        ), mock.patch.object(backend, "set", side_effect=ConnectionError("down")):
+            data = self.cache.get_or_fetch(search_by={"id": 1}, fetch=fetch)
+
+        self.assertEqual(data, [{"id": 1}])
+        fetch.assert_called_once_with()
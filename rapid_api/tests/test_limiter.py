@@ -0,0 +1,78 @@
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from rapid_api import limiter
+
+
+class FakeClock(object):
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept = []
+        self.lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self.lock:
+            self.slept.append(seconds)
+            self.now += seconds
+
+
+class TokenBucketTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(limiter, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_acquire_waits_for_a_refill_once_the_burst_is_spent(self):
+        bucket = limiter.TokenBucket(rate=1, capacity=2)
+
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(self.clock.slept, [])
+
+        bucket.acquire()
+        self.assertEqual(self.clock.slept, [1])
+
+    def test_tokens_refill_with_time_up_to_the_capacity(self):
+        bucket = limiter.TokenBucket(rate=1, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        self.clock.now += 60
+        for _ in range(3):
+            bucket.acquire()
+
+        self.assertEqual(self.clock.slept, [1])
+
+    def test_headers_lower_the_tokens_and_the_rate(self):
+        bucket = limiter.TokenBucket(rate=10, capacity=100)
+
+        bucket.update_from_headers(
+            headers={"x-ratelimit-limit": "30", "x-ratelimit-remaining": "0"}
+        )
+        bucket.acquire()
+
+        # * 30 requests a minute is one token every two seconds
+        self.assertEqual(self.clock.slept, [2])
+
+    def test_malformed_headers_are_ignored(self):
+        bucket = limiter.TokenBucket(rate=1, capacity=1)
+
+        bucket.update_from_headers(headers={"x-ratelimit-limit": "many"})
+        bucket.acquire()
+
+        self.assertEqual(self.clock.slept, [])
+
+    def test_block_waits_out_the_retry_after(self):
+        bucket = limiter.TokenBucket(rate=1, capacity=10)
+
+        bucket.block(seconds=30)
+        bucket.acquire()
+
+        self.assertEqual(sum(self.clock.slept), 31)
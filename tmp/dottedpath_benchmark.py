@@ -0,0 +1,72 @@
+"""Compare the compiled dottedpath accessors with the per-call split.
+
+Run with ``python tmp/dottedpath_benchmark.py`` from the project root.
+"""
+import json
+import os
+import sys
+import timeit
+import typing
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "website.settings")
+django.setup()
+
+from utils import dottedpath  # noqa: E402
+
+FIXTURES_AMOUNT = 500
+REPEAT = 20
+
+FIELDS = {
+    "api_id": "fixture.id",
+    "date": "fixture.date",
+    "referee": "fixture.referee",
+    "country": "league.country",
+    "league": "league",
+    "league_id": "league.id",
+    "league_name": "league.name",
+    "home_team": "teams.home",
+    "home_team_id": "teams.home.id",
+    "home_team_name": "teams.home.name",
+    "away_team": "teams.away",
+    "away_team_id": "teams.away.id",
+    "away_team_name": "teams.away.name",
+    "home_winner": "teams.home.winner",
+    "away_winner": "teams.away.winner",
+}
+
+
+def split(fixtures: typing.List[typing.Dict]) -> None:
+    for fixture in fixtures:
+        for path in FIELDS.values():
+            dottedpath.dottedpath(data=fixture, path=path)
+
+
+def compiled(fixtures: typing.List[typing.Dict]) -> None:
+    getters = [dottedpath.compile_path(path) for path in FIELDS.values()]
+    for fixture in fixtures:
+        for getter in getters:
+            getter(fixture)
+
+
+def extract_many(fixtures: typing.List[typing.Dict]) -> None:
+    dottedpath.extract_many(records=fixtures, fields=FIELDS)
+
+
+if __name__ == "__main__":
+    path = os.path.join(os.path.dirname(__file__), "fixture_example.json")
+    with open(path) as file:
+        fixtures = [json.load(file)] * FIXTURES_AMOUNT
+
+    baseline = None
+    for function in (split, compiled, extract_many):
+        seconds = min(
+            timeit.repeat(lambda: function(fixtures), number=REPEAT, repeat=5)
+        )
+        baseline = baseline or seconds
+        print(
+            f"{function.__name__:>13}: {seconds / REPEAT * 1000:7.3f} ms "
+            f"per {FIXTURES_AMOUNT} fixtures ({baseline / seconds:.2f}x)"
+        )
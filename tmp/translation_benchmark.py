@@ -0,0 +1,179 @@
+"""Measure the translation layer on a recorded fixture day without Google.
+
+Run with ``python tmp/translation_benchmark.py [fixtures] [latency]`` from the
+project root. The day is built from ``fixture_example.json`` and imported
+inside a transaction that is rolled back, translations go to the local backend.
+The imported rows go through translate_new_rows, the post-commit batch run in
+production, starting from checkpoints placed after the rows already stored.
+"""
+import copy
+import json
+import os
+import sys
+import time
+import typing
+from unittest import mock
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "website.settings")
+django.setup()
+
+import modeltranslation  # noqa: E402
+from django.db import models as django_models  # noqa: E402
+from django.db import transaction  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+from modeltranslation import utils as modeltranslation_utils  # noqa: E402
+
+from bets.tasks import importer as bet_importer  # noqa: E402
+from bets.tasks import services as bet_services  # noqa: E402
+from bets.tasks import sports as bet_sports  # noqa: E402
+from football import models as football_models  # noqa: E402
+from geo import models as geo_models  # noqa: E402
+from integrations import memory as translation_memory  # noqa: E402
+from integrations import models as integrations_models  # noqa: E402
+from integrations.google import backends as google_backends  # noqa: E402
+from utils import dottedpath  # noqa: E402
+from utils import translate as utils_translate  # noqa: E402
+
+FIXTURES_AMOUNT = 300
+LATENCY = 0.2
+
+# * A match day repeats its teams and leagues, which is what the memory is for
+TEAMS_AMOUNT = 120
+LEAGUES_AMOUNT = 25
+COUNTRIES_AMOUNT = 12
+
+MODELS = [
+    geo_models.Country,
+    football_models.League,
+    football_models.Team,
+    football_models.Match,
+]
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+def fixture_day(amount: int) -> typing.List[typing.Dict]:
+    path = os.path.join(os.path.dirname(__file__), "fixture_example.json")
+    with open(path) as file:
+        recorded = json.load(file)
+
+    fixtures = []
+    for index in range(amount):
+        fixture = copy.deepcopy(recorded)
+        fixture["fixture"]["id"] += index
+        fixture["fixture"]["referee"] = f"Referee {index % 40}"
+
+        league = index % LEAGUES_AMOUNT
+        fixture["league"].update(
+            id=fixture["league"]["id"] + league,
+            name=f"{recorded['league']['name']} {league}",
+            country=f"{recorded['league']['country']} {league % COUNTRIES_AMOUNT}",
+        )
+        for side, offset in (("home", 0), ("away", 1)):
+            team = (index * 2 + offset) % TEAMS_AMOUNT
+            fixture["teams"][side].update(
+                id=recorded["teams"][side]["id"] * 1000 + team,
+                name=f"{recorded['teams'][side]['name']} {team}",
+            )
+        fixtures.append(fixture)
+    return fixtures
+
+
+def import_day(fixtures: typing.List[typing.Dict]) -> int:
+    spec = bet_sports.SPORTS["football"]
+    batch = bet_services.FixtureBatch(kind_of_sport=spec.kind_of_sport, version=spec.version)
+    columns = dottedpath.extract_many(records=fixtures, fields=spec.fields)
+    for fixture, *values in zip(fixtures, *columns.values()):
+        bet_importer._add_fixture(batch=batch, fixture=fixture, row=dict(zip(columns, values)))
+    batch.flush()
+    return len(fixtures)
+
+
+def place_checkpoints(last_pks: typing.Dict[str, int]) -> None:
+    for label, last_pk in last_pks.items():
+        integrations_models.TranslationCheckpoint.objects.update_or_create(
+            label=label, defaults={"last_pk": last_pk, "failed": []}
+        )
+
+
+def stored_pks() -> typing.Dict[str, int]:
+    last_pks = {}
+    for model in MODELS:
+        aggregate = model._base_manager.aggregate(last_pk=django_models.Max("pk"))
+        last_pks[model._meta.label] = aggregate["last_pk"] or 0
+    return last_pks
+
+
+def translate_day() -> int:
+    return sum(utils_translate.translate_new_rows(model=model) for model in MODELS)
+
+
+def forget_translations(last_pks: typing.Dict[str, int]) -> None:
+    # * Empties the translated columns and rewinds the checkpoints, the memory
+    # * keeps what it learned
+    place_checkpoints(last_pks=last_pks)
+    for model in MODELS:
+        fields = modeltranslation.manager.get_translatable_fields_for_model(model)
+        model._base_manager.update(
+            **{
+                modeltranslation_utils.build_localized_fieldname(field, language): None
+                for field in fields
+                for language in utils_translate._target_languages()
+            }
+        )
+
+
+def run(fixtures_amount: int, latency: float) -> None:
+    lookup = mock.Mock(wraps=translation_memory.translate_texts)
+
+    def stage(name: str, function: typing.Callable[[], typing.Any]) -> None:
+        lookup.reset_mock()
+        requests, texts = backend.requests, backend.texts
+
+        start = time.monotonic()
+        rows = function()
+        seconds = time.monotonic() - start
+
+        requested = sum(len(set(call.kwargs["texts"])) for call in lookup.call_args_list)
+        sent = backend.texts - texts
+        hit_rate = 1 - sent / requested if requested else 0
+        print(
+            f"{name:>14}: {seconds * 1000:9.1f} ms"
+            f" | rows {rows:>5}"
+            f" | texts requested {requested:>5}"
+            f" | sent {sent:>5} in {backend.requests - requests:>3} requests"
+            f" | cache hit rate {hit_rate:6.1%}"
+        )
+
+    with override_settings(
+        CACHES=CACHES,
+        TRANSLATION_BACKEND="integrations.google.backends.LocalBackend",
+        TRANSLATION_BACKEND_OPTIONS={"latency": latency},
+    ), mock.patch.object(translation_memory, "translate_texts", lookup):
+        backend = google_backends.get_backend()
+        with transaction.atomic():
+            # * As if the last run caught up with everything stored before the day
+            last_pks = stored_pks()
+            place_checkpoints(last_pks=last_pks)
+
+            fixtures = fixture_day(amount=fixtures_amount)
+            stage("import", lambda: import_day(fixtures=fixtures))
+            stage("translate cold", translate_day)
+
+            forget_translations(last_pks=last_pks)
+            stage("translate warm", translate_day)
+            transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    run(
+        fixtures_amount=int(arguments[0]) if arguments else FIXTURES_AMOUNT,
+        latency=float(arguments[1]) if len(arguments) > 1 else LATENCY,
+    )
@@ -7,7 +7,7 @@ from django.db import models
 
 from bets import models as bets_models
 from football.services import prefetch as services_prefetch
-from football.services.sportingnews import SportingNewsClient
+from football.services import sportingnews as services_sportingnews
 
 from ..client.models import Client
 from . import forms
@@ -58,7 +58,7 @@ class SatellitesView(LoginRequiredMixin, services_prefetch.SportIndexView, views
                 satellites.append(satellites_list[satellite_index])
                 del satellites_list[satellite_index]
 
-        rss_news = SportingNewsClient().rss_list()
+        rss_news = services_sportingnews.read_news()
         sports_amount = self._count_fixtures(queryset=bets_models.Odds.objects)
 
         return shortcuts.render(
@@ -1,10 +1,33 @@
 # region				-----Internal Imports-----
+import functools
 import typing
 
 # endregion
 
+# region			  -----Supporting Variables-----
+GetterType = typing.Callable[[typing.Any], typing.Any]
+# endregion
+
+
+@functools.lru_cache(maxsize=None)
+def compile_path(path: str) -> GetterType:
+    keys = tuple(path.split("."))
+
+    def getter(data: typing.Any) -> typing.Any:
+        value = data
+        for key in keys:
+            if isinstance(value, dict):
+                value = value.get(key, {})
+            else:
+                return None
+        return value
+
+    return getter
+
 
 def dottedpath(data: typing.Dict, path: str) -> typing.Any:
+    # * One-off lookups: the lru_cache round trip of compile_path costs more
+    # * than the split, compiled getters only pay off in extract_many
     value = data
     for key in path.split("."):
         if isinstance(value, dict):
@@ -12,3 +35,14 @@ def dottedpath(data: typing.Dict, path: str) -> typing.Any:
         else:
             return None
     return value
+
+
+def extract_many(
+    records: typing.Iterable[typing.Dict], fields: typing.Mapping[str, str]
+) -> typing.Dict[str, typing.List[typing.Any]]:
+    getters = [(field, compile_path(path)) for field, path in fields.items()]
+    columns = {field: [] for field in fields}
+    for record in records:
+        for field, getter in getters:
+            columns[field].append(getter(record))
+    return columns
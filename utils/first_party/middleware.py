@@ -5,12 +5,19 @@ import typing
 from django import http as django_http
 
 # region				-----External Imports-----
+from django.conf import settings
+from django.core import exceptions as django_exceptions
 from django.utils.translation import gettext_lazy as _
 
 from website import settings as website_settings
 
 # endregion
 
+# region				-----Internal Imports-----
+from . import queries as utils_queries
+
+# endregion
+
 # region			  -----Supporting Variables-----
 logger = logging.getLogger(__file__)
 # endregion
@@ -36,3 +43,46 @@ class Process500Error(object):
             response_data.update(trace_back)
 
         return django_http.JsonResponse(response_data, status=500)
+
+
+class QueryBudgetMiddleware(object):
+    # * Opt-in with QUERY_BUDGET_ENABLED: every query of the request is timed
+    def __init__(self, get_response: typing.Callable) -> None:
+        if not getattr(settings, "QUERY_BUDGET_ENABLED", False):
+            raise django_exceptions.MiddlewareNotUsed
+        self._get_response = get_response
+
+    def __call__(self, request: django_http.HttpRequest) -> django_http.HttpResponse:
+        with utils_queries.record_queries() as stats:
+            response = self._get_response(request)
+
+        name = getattr(request, "_query_budget_view", request.path)
+        duration = stats.duration * 1000
+        response["Server-Timing"] = (
+            f'db;dur={duration:.1f};desc="{stats.count} queries", '
+            f'dup;desc="{sum(stats.duplicates.values())} duplicated"'
+        )
+        logger.info(f"{name} {stats.count} queries {duration:.1f} ms")
+        for sql, count in stats.duplicates.items():
+            logger.warning(f"{name} {count}x {sql}")
+
+        try:
+            utils_queries.check_budget(
+                stats=stats, budget=getattr(request, "_query_budget", None), name=name
+            )
+        except utils_queries.QueryBudgetExceeded as ex:
+            if getattr(settings, "QUERY_BUDGET_RAISE", False):
+                raise
+            logger.warning(ex)
+        return response
+
+    def process_view(
+        self,
+        request: django_http.HttpRequest,
+        view_func: typing.Callable,
+        view_args: typing.List,
+        view_kwargs: typing.Dict,
+    ) -> None:
+        request._query_budget = utils_queries.view_budget(view=view_func)
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        request._query_budget_view = (view_class or view_func).__name__
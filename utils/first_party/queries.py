@@ -0,0 +1,101 @@
+# region				-----External Imports-----
+import collections
+import contextlib
+import dataclasses
+import re
+import time
+import typing
+
+from django.conf import settings
+from django.db import connections
+
+# endregion
+
+# region			  -----Supporting Variables-----
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\bIN \((?:\s*(?:\?|%s)\s*,?)+\)", re.IGNORECASE)
+# endregion
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+@dataclasses.dataclass
+class QueryStats(object):
+    count: int = 0
+    duration: float = 0.0
+    fingerprints: typing.Counter[str] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+    @property
+    def duplicates(self) -> typing.Dict[str, int]:
+        # * The same statement run again with other parameters: usually N+1
+        return {sql: count for sql, count in self.fingerprints.items() if count > 1}
+
+
+def fingerprint(sql: str) -> str:
+    sql = _LITERALS.sub("?", sql)
+    return _IN_LISTS.sub("IN (...)", sql)
+
+
+@contextlib.contextmanager
+def record_queries() -> typing.Iterator[QueryStats]:
+    stats = QueryStats()
+
+    def wrapper(execute, sql, params, many, context):
+        start = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            stats.count += 1
+            stats.duration += time.monotonic() - start
+            stats.fingerprints[fingerprint(sql)] += 1
+
+    with contextlib.ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(wrapper))
+        yield stats
+
+
+def query_budget(max_queries: int) -> typing.Callable:
+    # * Declares the budget of a function view, class views set ``query_budget``
+    def decorator(view: typing.Callable) -> typing.Callable:
+        view.query_budget = max_queries
+        return view
+
+    return decorator
+
+
+def view_budget(view: typing.Callable) -> int or None:
+    view_class = getattr(view, "cls", None) or getattr(view, "view_class", None)
+    for owner in (view, view_class):
+        budget = getattr(owner, "query_budget", None)
+        if budget is not None:
+            return budget
+    return getattr(settings, "QUERY_BUDGET_DEFAULT", None)
+
+
+def check_budget(stats: QueryStats, budget: int or None, name: str) -> None:
+    if budget is None or stats.count <= budget:
+        return
+
+    duplicates = "; ".join(
+        f"{count}x {sql}" for sql, count in stats.duplicates.items()
+    )
+    raise QueryBudgetExceeded(
+        f"{name} ran {stats.count} queries, budget {budget}. Duplicates: {duplicates}"
+    )
+
+
+class QueryBudgetTestMixin(object):
+    @contextlib.contextmanager
+    def assertQueryBudget(self, max_queries: int) -> typing.Iterator[QueryStats]:
+        with record_queries() as stats:
+            yield stats
+
+        try:
+            check_budget(stats=stats, budget=max_queries, name="block")
+        except QueryBudgetExceeded as ex:
+            self.fail(str(ex))
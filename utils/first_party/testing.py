@@ -0,0 +1,7 @@
+# region			  -----Supporting Variables-----
+# * Every cache alias of the project in process memory, for override_settings
+LOCMEM_CACHES = {
+    alias: {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    for alias in ("default", "shared", "rapid_api")
+}
+# endregion
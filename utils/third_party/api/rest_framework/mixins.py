@@ -11,6 +11,8 @@ from rest_framework import viewsets as rest_viewsets
 # endregion
 
 # region				-----Internal Imports-----
+from . import paginators as utils_paginators
+
 # endregion
 
 # region			  -----Supporting Variables-----
@@ -45,6 +47,22 @@ class PrefetchableListMixin(rest_viewsets.GenericViewSet, rest_mixins.ListModelM
         return super().list(request, *args, **kwargs)
 
 
+class KeysetPaginationMixin(object):
+    # * ?pagination=keyset (kept in the next links) switches to cursor pages
+    keyset_pagination_class = utils_paginators.KeysetPaginator
+    keyset_ordering: str or typing.Sequence[str] = "-pk"
+
+    @property
+    def paginator(self) -> typing.Any:
+        if not hasattr(self, "_paginator") and self.is_keyset_paginated():
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
+
+    def is_keyset_paginated(self) -> bool:
+        params = self.request.query_params
+        return params.get("pagination") == "keyset" or "cursor" in params
+
+
 class PrefetchableOutputMixin(object):
     def _prefetch_output(self, queryset: models.QuerySet) -> models.QuerySet:
         return queryset
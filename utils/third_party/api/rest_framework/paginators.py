@@ -1,16 +1,37 @@
+import json
 import typing
 
 # region				-----External Imports-----
+from django.db import connections
+from django.db import models as django_models
 from rest_framework import pagination as rest_pagination
+from rest_framework import request as rest_request
 from rest_framework import response as rest_response
 
 # endregion
 
 
+def estimate_count(queryset: django_models.QuerySet) -> int or None:
+    # * The planner's row estimate costs no scan, only PostgreSQL exposes it
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 class StandartPagePaginator(rest_pagination.PageNumberPagination):
+    # * Clients that render a whole list at once ask for it with ?page_size
     page_size_query_param: str = "page_size"
-    max_page_size: int = 10_000
-    page_size: int = 10_000
+    max_page_size: int = 1_000
+    page_size: int = 100
 
     def get_paginated_response(self, data: typing.Iterable) -> rest_response.Response:
         return rest_response.Response(
@@ -23,3 +44,45 @@ class StandartPagePaginator(rest_pagination.PageNumberPagination):
                 "results": data,
             }
         )
+
+
+class KeysetPaginator(rest_pagination.CursorPagination):
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 500
+    page_size: int = 100
+    ordering: str = "-pk"
+
+    # * ?count=estimate adds the planner estimate, there is never a COUNT(*)
+    count_query_param: str = "count"
+
+    def paginate_queryset(
+        self,
+        queryset: django_models.QuerySet,
+        request: rest_request.Request,
+        view: typing.Any = None,
+    ) -> typing.List:
+        self.count = None
+        if request.query_params.get(self.count_query_param) == "estimate":
+            self.count = estimate_count(queryset=queryset)
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_ordering(
+        self,
+        request: rest_request.Request,
+        queryset: django_models.QuerySet,
+        view: typing.Any,
+    ) -> typing.Tuple[str]:
+        ordering = getattr(view, "keyset_ordering", self.ordering)
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
+
+    def get_paginated_response(self, data: typing.Iterable) -> rest_response.Response:
+        return rest_response.Response(
+            {
+                "links": {
+                    "next": self.get_next_link(),
+                    "previous": self.get_previous_link(),
+                },
+                "count": self.count,
+                "results": data,
+            }
+        )
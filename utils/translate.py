@@ -2,21 +2,246 @@ import logging
 import typing
 
 # region				-----External Imports-----
+import modeltranslation
+from django import dispatch
 from django.conf import settings
+from django.core import cache as django_cache
+from django.db import models as django_models
+from django.db import transaction
+from modeltranslation import utils as modeltranslation_utils
 
-from integrations import google
+from integrations import memory as translation_memory
+from integrations import models as integrations_models
 
 # region				-----Internal Imports-----
 logger = logging.Logger(__file__)
 # endregion
 
+# region			  -----Supporting Variables-----
+CACHE_ALIAS = "shared"
+SOURCE_LANGUAGE = "en-us"
 
-def multiple_translations(instance: typing.Any) -> None:
-    if instance._state.adding:
-        LANGUAGE_CODES = [code for code in settings.LANGUAGE_CODES if code != "en-us"]
-        for language in LANGUAGE_CODES:
-            instance = google.translate.translate(
-                to_language=language, instance=instance
+# * Rows committed within the delay share one task
+TRANSLATION_DELAY = 10
+TRANSLATION_PENDING_KEY = "translation:pending"
+TRANSLATION_BATCH_SIZE = 2000
+TRANSLATION_OVERLAP = 1000
+TRANSLATION_FAILED_LIMIT = 10000
+
+# * Sent with the translated model classes once their columns were written back
+translations_updated = dispatch.Signal()
+# endregion
+
+
+def _target_languages() -> typing.List[str]:
+    return [code for code in settings.LANGUAGE_CODES if code != SOURCE_LANGUAGE]
+
+
+def _missing_filter(
+    fields: typing.Sequence[str], languages: typing.Sequence[str]
+) -> django_models.Q:
+    missing = django_models.Q()
+    for field in fields:
+        source = modeltranslation_utils.build_localized_fieldname(field, SOURCE_LANGUAGE)
+        for language in languages:
+            target = modeltranslation_utils.build_localized_fieldname(field, language)
+            empty = django_models.Q(**{f"{target}__isnull": True}) | django_models.Q(
+                **{target: ""}
             )
+            missing |= empty & ~django_models.Q(**{f"{source}__isnull": True}) & ~(
+                django_models.Q(**{source: ""})
+            )
+    return missing
+
+
+def _translate_rows(
+    rows: typing.Sequence[django_models.Model],
+    fields: typing.Sequence[str],
+    languages: typing.Sequence[str],
+) -> typing.Set[str]:
+    # * Only empty columns are filled, edits made in the admin are kept
+    updated = set()
+    for language in languages:
+        pending = []
+        for row in rows:
+            for field in fields:
+                source = getattr(
+                    row, modeltranslation_utils.build_localized_fieldname(field, SOURCE_LANGUAGE)
+                )
+                target = modeltranslation_utils.build_localized_fieldname(field, language)
+                if source and not getattr(row, target):
+                    pending.append((row, target, str(source)))
+
+        if not pending:
+            continue
+
+        # * Every distinct string goes out once, whatever the number of rows
+        translations = translation_memory.translate_texts(
+            texts=[source for *_, source in pending], to_language=language
+        )
+        for row, target, source in pending:
+            translated = translations.get(source)
+            if translated:
+                setattr(row, target, translated)
+                updated.add(target)
+
+    return updated
+
+
+def _missing_sources(
+    row: django_models.Model,
+    fields: typing.Sequence[str],
+    languages: typing.Sequence[str],
+) -> bool:
+    return any(
+        getattr(row, modeltranslation_utils.build_localized_fieldname(field, SOURCE_LANGUAGE))
+        and not getattr(row, modeltranslation_utils.build_localized_fieldname(field, language))
+        for field in fields
+        for language in languages
+    )
+
+
+def _translate_queryset(
+    model: typing.Type[django_models.Model],
+    queryset: django_models.QuerySet,
+    fields: typing.Sequence[str],
+    after_pk: int = 0,
+    on_batch: typing.Optional[typing.Callable[[int, typing.List[int]], None]] = None,
+) -> int:
+    languages = _target_languages()
+    columns = [
+        modeltranslation_utils.build_localized_fieldname(field, language)
+        for field in fields
+        for language in [SOURCE_LANGUAGE, *languages]
+    ]
+
+    # * Walked by primary key: rows the API failed on do not come back in this run
+    translated, last_pk = 0, after_pk
+    while rows := list(
+        queryset.filter(pk__gt=last_pk).order_by("pk").only("pk", *columns)[
+            :TRANSLATION_BATCH_SIZE
+        ]
+    ):
+        last_pk = rows[-1].pk
+        updated = _translate_rows(rows=rows, fields=fields, languages=languages)
+        if updated:
+            model._base_manager.bulk_update(rows, fields=sorted(updated))
+            translated += len(rows)
+
+        if on_batch:
+            failed = [
+                row.pk
+                for row in rows
+                if _missing_sources(row=row, fields=fields, languages=languages)
+            ]
+            on_batch(last_pk, failed)
+
+    return translated
+
+
+def translate_missing(model: typing.Type[django_models.Model]) -> int:
+    # * Full scan of the table, for backfills; imports go through translate_new_rows
+    fields = modeltranslation.manager.get_translatable_fields_for_model(model)
+    if not fields:
+        return 0
+
+    queryset = model._base_manager.filter(
+        _missing_filter(fields=fields, languages=_target_languages())
+    )
+    translated = _translate_queryset(model=model, queryset=queryset, fields=fields)
+    if translated:
+        translations_updated.send(sender=None, models=[model])
+    logger.info(f"translate_missing {model._meta.label}: {translated}")
+    return translated
+
+
+def translate_new_rows(model: typing.Type[django_models.Model]) -> int:
+    fields = modeltranslation.manager.get_translatable_fields_for_model(model)
+    if not fields:
+        return 0
+
+    checkpoint, _ = integrations_models.TranslationCheckpoint.objects.get_or_create(
+        label=model._meta.label
+    )
+    # * Concurrent imports commit out of primary key order, so the last rows
+    # * before the checkpoint are looked at again; failed rows are skipped
+    after_pk = max(checkpoint.last_pk - TRANSLATION_OVERLAP, 0)
+    queryset = model._base_manager.filter(
+        _missing_filter(fields=fields, languages=_target_languages())
+    ).exclude(pk__in=[pk for pk in checkpoint.failed if pk > after_pk])
+
+    # * Only rows the API answered without a translation are failed; when the
+    # * backend errors, TranslationUnavailable leaves the batch pending
+    def on_batch(last_pk: int, failed: typing.List[int]) -> None:
+        if failed:
+            logger.warning(f"translate_new_rows {model._meta.label}: failed {failed[:20]}")
+        checkpoint.last_pk = max(checkpoint.last_pk, last_pk)
+        checkpoint.failed = [*checkpoint.failed, *failed][-TRANSLATION_FAILED_LIMIT:]
+        checkpoint.save(update_fields=["last_pk", "failed", "updated_at"])
+
+    translated = _translate_queryset(
+        model=model, queryset=queryset, fields=fields, after_pk=after_pk, on_batch=on_batch
+    )
+    logger.info(f"translate_new_rows {model._meta.label}: {translated}")
+    return translated
+
+
+def translate_pending() -> int:
+    # * Cleared before reading: rows committed from now on queue a new task
+    django_cache.caches[CACHE_ALIAS].delete(TRANSLATION_PENDING_KEY)
+
+    updated_models = []
+    for model in modeltranslation.translator.translator.get_registered_models(
+        abstract=False
+    ):
+        try:
+            if translate_new_rows(model=model):
+                updated_models.append(model)
+        except Exception as ex:
+            logger.error(f"translate_pending {model._meta.label}: {ex}")
+
+    # * Sent once per run, whatever the number of models translated
+    if updated_models:
+        translations_updated.send(sender=None, models=updated_models)
+    return len(updated_models)
+
+
+def _dispatch_translation() -> None:
+    from integrations import tasks as integrations_tasks
+
+    cache = django_cache.caches[CACHE_ALIAS]
+    # * A task already waiting picks these rows up as well
+    if cache.add(TRANSLATION_PENDING_KEY, 1, timeout=TRANSLATION_DELAY * 6) is False:
+        return
+
+    try:
+        integrations_tasks.task_translate_new_rows.apply_async(countdown=TRANSLATION_DELAY)
+    except Exception as ex:
+        cache.delete(TRANSLATION_PENDING_KEY)
+        logger.error(f"schedule translation: {ex}")
+
+
+def schedule_translation(model: typing.Type[django_models.Model]) -> None:
+    # * Translation is never on the save path: it runs once the rows are committed
+    if not modeltranslation.manager.get_translatable_fields_for_model(model):
+        return
+
+    connection = transaction.get_connection()
+    if any(func is _dispatch_translation for _, func in connection.run_on_commit):
+        return
+
+    transaction.on_commit(_dispatch_translation)
+
+
+def multiple_translations(instance: typing.Any, created: bool = True) -> None:
+    if created:
+        schedule_translation(model=instance.__class__)
 
     return instance
+
+
+def bulk_translations(instances: typing.Sequence[typing.Any]) -> None:
+    if not instances:
+        return
+
+    schedule_translation(model=instances[0].__class__)
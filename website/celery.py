@@ -4,9 +4,7 @@ from __future__ import absolute_import, unicode_literals
 import logging
 import os
 import sys
-import time
 
-import requests
 from celery import Celery, signals
 from celery.schedules import crontab
 from celery.signals import worker_ready
@@ -20,13 +18,6 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 
-@app.task
-def cache_matches():
-    time.sleep(60)
-    for kind_of_sport in range(1, 9):
-        requests.get(f"https://admin.greekz.com/api/frontend/league/?kind_of_sport={kind_of_sport}&cache=True")
-
-
 beat_schedules = {
     "task_satellites_balance_migrating": {
         "task": "task_satellites_balance_migrating",
@@ -38,48 +29,18 @@ beat_schedules = {
         "schedule": crontab(minute=0, hour="*/1"),
         "args": (),
     },
+    "task_refresh_news": {
+        "task": "task_refresh_news",
+        "schedule": 10 * 60,
+        "args": (),
+    },
     "task_clean_matches": {
         "task": "task_clean_matches",
         "schedule": crontab(minute=0, hour=11),
         "args": (),
     },
-    "task_baseball_data_import": {
-        "task": "task_baseball_data_import",
-        "schedule": crontab(minute=0, hour="3,12,18"),
-        "args": (),
-    },
-    "task_basketball_data_import": {
-        "task": "task_basketball_data_import",
-        "schedule": crontab(minute=0, hour="3,12,18"),
-        "args": (),
-    },
-    "task_football_data_import": {
-        "task": "task_football_data_import",
-        "schedule": crontab(minute=0, hour="3,12,18"),
-        "args": (),
-    },
-    "task_formula_1_data_import": {
-        "task": "task_formula_1_data_import",
-        "schedule": crontab(minute=0, hour="3,12,18"),
-        "args": (),
-    },
-    "task_handball_data_import": {
-        "task": "task_handball_data_import",
-        "schedule": crontab(minute=0, hour="3,12,18"),
-        "args": (),
-    },
-    "task_hockey_data_import": {
-        "task": "task_hockey_data_import",
-        "schedule": crontab(minute=0, hour="3,12,18"),
-        "args": (),
-    },
-    "task_rugby_data_import": {
-        "task": "task_rugby_data_import",
-        "schedule": crontab(minute=0, hour="3,12,18"),
-        "args": (),
-    },
-    "task_volleyball_data_import": {
-        "task": "task_volleyball_data_import",
+    "task_sports_data_import": {
+        "task": "task_sports_data_import",
         "schedule": crontab(minute=0, hour="3,12,18"),
         "args": (),
     },
@@ -131,4 +92,6 @@ def on_celery_setup_logging(**kwargs):
 
 @worker_ready.connect
 def at_start(**kwargs):
-    cache_matches.apply_async()
+    # * The listings live in the database, only the shared cache may be cold
+    app.send_task("task_warm_league_lists")
+    app.send_task("task_refresh_news")
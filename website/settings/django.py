@@ -41,7 +41,16 @@ INSTALLED_APPS = [
     "django.contrib.sites",
 ]
 
-USER_APPS = ["football", "user", "geo", "finance", "bets", "history", "news"]
+USER_APPS = [
+    "football",
+    "user",
+    "geo",
+    "finance",
+    "bets",
+    "history",
+    "news",
+    "integrations",
+]
 
 INSTALLED_APPS = THIRD_PARTY_APPS + INSTALLED_APPS + USER_APPS
 
@@ -56,6 +65,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "website.middleware.SaveIPMiddleware",
     "history.middleware.CurrentUserMiddleware",
+    "utils.first_party.middleware.QueryBudgetMiddleware",
 ]
 
 LOCALE_PATHS = (os.path.join(BASE_DIR, "locale"),)
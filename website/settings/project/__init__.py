@@ -1,2 +1,3 @@
 from .email import *
+from .queries import *
 from .veriff import *
\ No newline at end of file
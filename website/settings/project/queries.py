@@ -0,0 +1,8 @@
+import os
+
+# Query budget middleware: counts, times and fingerprints the SQL of each request
+QUERY_BUDGET_ENABLED = os.environ.get("QUERY_BUDGET_ENABLED", "False") == "True"
+# Budget of views that don't declare a query_budget, None - unlimited
+QUERY_BUDGET_DEFAULT = None
+# Raise instead of logging when a view goes over its budget (tests)
+QUERY_BUDGET_RAISE = False
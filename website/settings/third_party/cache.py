@@ -0,0 +1,37 @@
+# region				-----External Imports-----
+import os
+
+# endregion
+
+REDIS_URL = f'redis://{os.environ.get("REDIS_HOST","127.0.0.1")}:{os.environ.get("REDIS_PORT",6379)}'
+
+# * Host of the absolute links in responses rendered by the cache warming tasks
+CACHE_WARMING_HOST = os.environ.get("CACHE_WARMING_HOST", "admin.greekz.com")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # * Shared between web and celery workers, a cache outage only means a miss
+    "shared": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"{REDIS_URL}/1",
+        "KEY_PREFIX": "shared",
+        "OPTIONS": {
+            "IGNORE_EXCEPTIONS": True,
+            "SOCKET_CONNECT_TIMEOUT": 1,
+            "SOCKET_TIMEOUT": 1,
+        },
+    },
+    "rapid_api": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"{REDIS_URL}/2",
+        "TIMEOUT": None,
+        "KEY_PREFIX": "rapid_api",
+        "OPTIONS": {
+            "IGNORE_EXCEPTIONS": True,
+            "SOCKET_CONNECT_TIMEOUT": 1,
+            "SOCKET_TIMEOUT": 1,
+        },
+    },
+}
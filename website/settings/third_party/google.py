@@ -2,3 +2,12 @@ import os
 
 GOOGLE_CLOUD_TRANSLATE_PROJECT_ID = os.environ.get("GOOGLE_CLOUD_TRANSLATE_PROJECT_ID")
 GOOGLE_CLOUD_TRANSLATE_LOCATION = os.environ.get("GOOGLE_CLOUD_TRANSLATE_LOCATION")
+
+# * Dotted path of the integrations.google.backends class that serves
+# * translations; the local one needs no Google project
+TRANSLATION_BACKEND = os.environ.get(
+    "TRANSLATION_BACKEND", "integrations.google.backends.GoogleBackend"
+)
+TRANSLATION_BACKEND_OPTIONS = {
+    "latency": float(os.environ.get("TRANSLATION_BACKEND_LATENCY", 0)),
+}
@@ -2,3 +2,17 @@ import os
 
 RAPID_API_HOST = os.environ["RAPID_API_HOST"]
 RAPID_API_KEY = os.environ["RAPID_API_KEY"]
+
+# * Seconds a RapidAPI response stays fresh per endpoint path, 0 disables the
+# * cache. Stale entries are served for as long again while being refreshed
+RAPID_API_CACHE_TTL = {
+    "drivers": 3 * 24 * 60 * 60,
+    "teams": 3 * 24 * 60 * 60,
+    "leagues": 3 * 24 * 60 * 60,
+    "countries": 3 * 24 * 60 * 60,
+    # * Never cached: every import run (3, 12 and 18h) must write current prices
+    "odds": 0,
+    "fixtures": 0,
+    "games": 0,
+    "races": 0,
+}